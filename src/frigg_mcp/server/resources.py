@@ -0,0 +1,233 @@
+import json
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
+from urllib.parse import unquote
+
+SCENE_URI = "frigg://scene"
+OBJECT_URI_PREFIX = "frigg://scene/objects/"
+COLLECTION_URI_PREFIX = "frigg://scene/collections/"
+
+
+def resources_list() -> Dict[str, Any]:
+    return {
+        "resources": [
+            {
+                "uri": SCENE_URI,
+                "name": "Blender scene",
+                "description": "Scene info and the names of all objects.",
+                "mimeType": "application/json",
+            }
+        ]
+    }
+
+
+def resource_templates_list() -> Dict[str, Any]:
+    return {
+        "resourceTemplates": [
+            {
+                "uriTemplate": OBJECT_URI_PREFIX + "{name}",
+                "name": "Blender object",
+                "description": "Local transform of one object.",
+                "mimeType": "application/json",
+            },
+            {
+                "uriTemplate": COLLECTION_URI_PREFIX + "{name}",
+                "name": "Blender collection",
+                "description": "Names of the objects in a collection (including child collections).",
+                "mimeType": "application/json",
+            },
+        ]
+    }
+
+
+def parse_uri(uri: Any) -> Tuple[str, Optional[str]]:
+    """Map a resource URI to a bridge subscription scope and its target."""
+    if not isinstance(uri, str):
+        raise ValueError("Resource uri must be a string")
+    if uri == SCENE_URI:
+        return "all", None
+    for prefix, scope in ((OBJECT_URI_PREFIX, "names"), (COLLECTION_URI_PREFIX, "collection")):
+        if uri.startswith(prefix) and len(uri) > len(prefix):
+            return scope, unquote(uri[len(prefix):])
+    raise ValueError(f"Unknown resource: {uri}")
+
+
+def subscription_params(uri: str) -> Dict[str, Any]:
+    scope, target = parse_uri(uri)
+    if scope == "names":
+        return {"scope": "names", "names": [target]}
+    if scope == "collection":
+        return {"scope": "collection", "collection": target}
+    return {"scope": "all"}
+
+
+def read_resource(uri: Any, call_bridge: Callable[[str, Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+    scope, target = parse_uri(uri)
+
+    def bridge(method: str, params: Dict[str, Any]) -> Any:
+        response = call_bridge(method, params)
+        if response.get("ok") is not True:
+            error = response.get("error")
+            message = error.get("message") if isinstance(error, dict) else error
+            raise RuntimeError(message or "Unknown bridge error")
+        return response.get("result")
+
+    if scope == "all":
+        content = {"scene": bridge("scene_info", {}), "objects": bridge("list_objects", {}).get("objects", [])}
+    elif scope == "names":
+        content = bridge("get_transform", {"name": target})
+    else:
+        content = {"collection": target, "objects": bridge("list_objects", {"collection": target}).get("objects", [])}
+
+    return {"contents": [{"uri": uri, "mimeType": "application/json", "text": json.dumps(content, indent=2)}]}
+
+
+class SceneSubscriber:
+    """
+    Keeps one long-lived bridge connection carrying resource subscriptions.
+
+    The bridge pushes scene_changed events on that connection; each one is
+    turned into notify(uri). After a reconnect every subscription is renewed
+    and reported as updated, since changes may have been missed meanwhile.
+    """
+
+    def __init__(
+        self,
+        get_target: Callable[[], Tuple[str, int]],
+        notify: Callable[[str], None],
+        log: Callable[[str], None],
+    ) -> None:
+        self._get_target = get_target
+        self._notify = notify
+        self._log = log
+        self._lock = threading.Lock()
+        self._uris: Set[str] = set()
+        self._sub_by_uri: Dict[str, int] = {}
+        self._uri_by_sub: Dict[int, str] = {}
+        self._pending: Deque[Tuple[str, str]] = deque()
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def subscribe(self, uri: str) -> None:
+        parse_uri(uri)
+        with self._lock:
+            if uri in self._uris:
+                return
+            self._uris.add(uri)
+            if self._sock is not None:
+                self._send_subscribe(uri)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="frigg-scene-subscriber", daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self, uri: str) -> None:
+        with self._lock:
+            self._uris.discard(uri)
+            sub_id = self._sub_by_uri.pop(uri, None)
+            if sub_id is not None:
+                self._uri_by_sub.pop(sub_id, None)
+                self._send_unsubscribe(sub_id, uri)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        # Caller holds self._lock.
+        if self._sock is None:
+            return
+        try:
+            self._sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+        except OSError as exc:
+            self._log(f"Subscription send failed: {exc}")
+
+    def _send_subscribe(self, uri: str) -> None:
+        self._pending.append(("subscribe", uri))
+        self._send({"method": "subscribe", "params": subscription_params(uri)})
+
+    def _send_unsubscribe(self, sub_id: int, uri: str) -> None:
+        self._pending.append(("unsubscribe", uri))
+        self._send({"method": "unsubscribe", "params": {"subscription": sub_id}})
+
+    def _run(self) -> None:
+        backoff = 0.5
+        connected_before = False
+        while not self._closed:
+            try:
+                sock = socket.create_connection(self._get_target(), timeout=5)
+                sock.settimeout(None)
+            except OSError:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 10.0)
+                continue
+            backoff = 0.5
+            with self._lock:
+                self._sock = sock
+                self._sub_by_uri.clear()
+                self._uri_by_sub.clear()
+                self._pending.clear()
+                uris = sorted(self._uris)
+                for uri in uris:
+                    self._send_subscribe(uri)
+            if connected_before:
+                for uri in uris:
+                    self._notify(uri)
+            connected_before = True
+            try:
+                for line in sock.makefile("r", encoding="utf-8"):
+                    line = line.strip()
+                    if line:
+                        self._handle_line(line)
+            except OSError as exc:
+                self._log(f"Subscription connection lost: {exc}")
+            finally:
+                with self._lock:
+                    self._sock = None
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+            if not self._closed:
+                time.sleep(backoff)
+
+    def _handle_line(self, line: str) -> None:
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            self._log(f"Invalid subscription message from bridge: {line[:200]}")
+            return
+        if not isinstance(message, dict):
+            return
+        if message.get("event") == "scene_changed":
+            with self._lock:
+                uri = self._uri_by_sub.get(message.get("subscription"))
+            if uri is not None:
+                self._notify(uri)
+            return
+
+        with self._lock:
+            if not self._pending:
+                return
+            kind, uri = self._pending.popleft()
+            if kind != "subscribe":
+                return
+            if message.get("ok") is not True:
+                self._log(f"Bridge refused subscription to {uri}: {message.get('error')}")
+                return
+            sub_id = (message.get("result") or {}).get("subscription")
+            if uri in self._uris:
+                self._sub_by_uri[uri] = sub_id
+                self._uri_by_sub[sub_id] = uri
+            else:
+                # Unsubscribed while the subscribe request was in flight.
+                self._send_unsubscribe(sub_id, uri)
@@ -3,11 +3,13 @@ import os
 import signal
 import socket
 import sys
+import threading
 import traceback
 from typing import Any, Dict, Optional, Tuple
 
 from frigg_mcp import __version__ as FRIGG_VERSION
 
+from frigg_mcp.server import resources, tracing
 from frigg_mcp.tools import core_tools
 from frigg_mcp.tools.search_tools import handle_search_tools
 
@@ -15,6 +17,9 @@ PROTOCOL_VERSION = "2024-11-05"
 SERVER_INFO = {"name": "frigg-mcp", "version": FRIGG_VERSION}
 # Track if we're shutting down
 _SHUTTING_DOWN = False
+# stdout is shared by the main loop and the subscription thread
+_STDOUT_LOCK = threading.Lock()
+_SUBSCRIBER: Optional[resources.SceneSubscriber] = None
 
 def log(message: str) -> None:
     """Log to stderr and optionally to a log file"""
@@ -36,6 +41,22 @@ def log(message: str) -> None:
         pass
 
 
+def write_message(message: Dict[str, Any]) -> None:
+    with _STDOUT_LOCK:
+        print(json.dumps(message), flush=True)
+
+
+def _notify_resource_updated(uri: str) -> None:
+    write_message({"jsonrpc": "2.0", "method": "notifications/resources/updated", "params": {"uri": uri}})
+
+
+def _get_subscriber() -> resources.SceneSubscriber:
+    global _SUBSCRIBER
+    if _SUBSCRIBER is None:
+        _SUBSCRIBER = resources.SceneSubscriber(get_bridge_target, _notify_resource_updated, log)
+    return _SUBSCRIBER
+
+
 def jsonrpc_error(code: int, message: str, req_id: Any) -> Dict[str, Any]:
     return {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
 
@@ -96,16 +117,21 @@ def get_bridge_target() -> Tuple[str, int]:
 def call_bridge(method: str, params: Dict[str, Any], retry: int = 0) -> Dict[str, Any]:
     host, port = get_bridge_target()
     request = {"method": method, "params": params}
+    trace = tracing.current_trace()
+    if trace is not None:
+        request["trace"] = {"id": trace.trace_id}
     data = json.dumps(request) + "\n"
 
     try:
-        with socket.create_connection((host, port), timeout=30) as sock:
-            sock.sendall(data.encode("utf-8"))
-            file = sock.makefile("r", encoding="utf-8")
-            line = file.readline()
-            if not line:
-                raise RuntimeError("Empty response from bridge")
-            response = json.loads(line)
+        with tracing.span(f"bridge_call:{method}"):
+            with socket.create_connection((host, port), timeout=30) as sock:
+                sock.sendall(data.encode("utf-8"))
+                file = sock.makefile("r", encoding="utf-8")
+                line = file.readline()
+                if not line:
+                    raise RuntimeError("Empty response from bridge")
+            with tracing.span("decode"):
+                response = json.loads(line)
     except ConnectionRefusedError:
         # If this is a bridge_ping and it's the first try, maybe the bridge is still starting
         if method == "bridge_ping" and retry < 2:
@@ -130,6 +156,8 @@ def call_bridge(method: str, params: Dict[str, Any], retry: int = 0) -> Dict[str
 
     if not isinstance(response, dict):
         raise RuntimeError("Invalid bridge response: expected object")
+    if trace is not None and isinstance(response.get("trace"), dict):
+        trace.extend(response["trace"].get("spans"))
     if "ok" not in response:
         raise RuntimeError("Invalid bridge response: missing ok")
     if response.get("ok") is True:
@@ -159,6 +187,41 @@ def handle_call(name: str, arguments: Optional[Dict[str, Any]]) -> Dict[str, Any
     return core_tools.error_result("unknown_tool", f"Unknown tool: {name}")
 
 
+def _tool_call_result(result: Any, req_id: Any) -> Dict[str, Any]:
+    # Convert internal result format to MCP format
+    if isinstance(result, dict):
+        if result.get("ok") is True:
+            # Success: wrap result in MCP content format
+            inner_result = result.get("result", {})
+            import json
+            mcp_result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": json.dumps(inner_result, indent=2)
+                    }
+                ]
+            }
+            return jsonrpc_result(mcp_result, req_id)
+        else:
+            # Error: return as MCP error with content
+            error_info = result.get("error", {})
+            error_message = error_info.get("message", "Unknown error") if isinstance(error_info, dict) else str(error_info)
+            mcp_result = {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Error: {error_message}"
+                    }
+                ],
+                "isError": True
+            }
+            return jsonrpc_result(mcp_result, req_id)
+
+    # Fallback for unexpected format
+    return jsonrpc_result({"content": [{"type": "text", "text": str(result)}]}, req_id)
+
+
 def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if request.get("jsonrpc") != "2.0":
         return jsonrpc_error(-32600, "Invalid Request", request.get("id"))
@@ -186,7 +249,7 @@ def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         result = {
             "protocolVersion": PROTOCOL_VERSION,
             "serverInfo": SERVER_INFO,
-            "capabilities": {"tools": {}},
+            "capabilities": {"tools": {}, "resources": {"subscribe": True}},
         }
         return jsonrpc_result(result, req_id)
 
@@ -202,50 +265,47 @@ def handle_request(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         arguments = params.get("arguments")
         if not name:
             return jsonrpc_error(-32602, "Missing tool name", req_id)
+        with tracing.start_trace(f"tools/call:{name}") as trace:
+            try:
+                result = handle_call(name, arguments)
+            except Exception as exc:
+                log(f"Tool call error: {exc}")
+                log(traceback.format_exc())
+                result = core_tools.error_result("internal_error", str(exc))
+            with tracing.span("encode"):
+                response = _tool_call_result(result, req_id)
+        response["result"]["_meta"] = {"frigg/trace": trace.meta()}
+        return response
+
+    if method == "resources/list":
+        return jsonrpc_result(resources.resources_list(), req_id)
+
+    if method == "resources/templates/list":
+        return jsonrpc_result(resources.resource_templates_list(), req_id)
+
+    if method in ("resources/read", "resources/subscribe", "resources/unsubscribe"):
+        uri = params.get("uri")
+        try:
+            resources.parse_uri(uri)
+        except ValueError as exc:
+            return jsonrpc_error(-32602, str(exc), req_id)
+        if method == "resources/subscribe":
+            _get_subscriber().subscribe(uri)
+            return jsonrpc_result({}, req_id)
+        if method == "resources/unsubscribe":
+            if _SUBSCRIBER is not None:
+                _SUBSCRIBER.unsubscribe(uri)
+            return jsonrpc_result({}, req_id)
         try:
-            result = handle_call(name, arguments)
+            return jsonrpc_result(resources.read_resource(uri, call_bridge), req_id)
         except Exception as exc:
-            log(f"Tool call error: {exc}")
-            log(traceback.format_exc())
-            result = core_tools.error_result("internal_error", str(exc))
-
-        # Convert internal result format to MCP format
-        if isinstance(result, dict):
-            if result.get("ok") is True:
-                # Success: wrap result in MCP content format
-                inner_result = result.get("result", {})
-                import json
-                mcp_result = {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": json.dumps(inner_result, indent=2)
-                        }
-                    ]
-                }
-                return jsonrpc_result(mcp_result, req_id)
-            else:
-                # Error: return as MCP error with content
-                error_info = result.get("error", {})
-                error_message = error_info.get("message", "Unknown error") if isinstance(error_info, dict) else str(error_info)
-                mcp_result = {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"Error: {error_message}"
-                        }
-                    ],
-                    "isError": True
-                }
-                return jsonrpc_result(mcp_result, req_id)
-
-        # Fallback for unexpected format
-        return jsonrpc_result({"content": [{"type": "text", "text": str(result)}]}, req_id)
+            log(f"Resource read error: {exc}")
+            return jsonrpc_error(-32603, str(exc), req_id)
 
     # Handle methods we don't support yet but shouldn't error on
-    if method in ("resources/list", "prompts/list"):
+    if method == "prompts/list":
         # Return empty lists for unsupported capabilities
-        return jsonrpc_result({method.split("/")[0]: []}, req_id)
+        return jsonrpc_result({"prompts": []}, req_id)
 
     log(f"Unknown method: {method}")
     return jsonrpc_error(-32601, "Method not found", req_id)
@@ -297,12 +357,12 @@ def main() -> None:
                 req_id = request.get("id") if isinstance(request, dict) else None
                 if req_id is not None:
                     response = jsonrpc_error(-32603, f"Internal error: {str(e)}", req_id)
-                    print(json.dumps(response), flush=True)
+                    write_message(response)
                 continue
 
             if response is None:
                 continue
-            print(json.dumps(response), flush=True)
+            write_message(response)
     except KeyboardInterrupt:
         log("Received KeyboardInterrupt, shutting down...")
     except Exception as e:
@@ -310,6 +370,8 @@ def main() -> None:
         log(traceback.format_exc())
         sys.exit(1)
     finally:
+        if _SUBSCRIBER is not None:
+            _SUBSCRIBER.close()
         log("Frigg MCP server stopped.")
 
 
@@ -0,0 +1,116 @@
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Trace of the tools/call currently being handled; call_bridge reads it to
+# propagate the trace id and to collect the bridge's spans.
+_CURRENT: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("frigg_trace", default=None)
+_FILE_LOCK = threading.Lock()
+
+# Chrome trace-event "pid" per hop, so each process gets its own track.
+PROCESS_IDS = {"stdio": 1, "bridge": 2}
+
+
+class Trace:
+    """Spans of one tools/call, timed in wall-clock microseconds so hops can be merged."""
+
+    def __init__(self, name: str) -> None:
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.spans: List[Dict[str, Any]] = []
+
+    def add(self, name: str, ts_us: float, dur_us: float, process: str = "stdio", **args: Any) -> None:
+        span = {"name": name, "process": process, "ts_us": int(ts_us), "dur_us": int(dur_us)}
+        if args:
+            span["args"] = args
+        self.spans.append(span)
+
+    def extend(self, spans: Any, process: str = "bridge") -> None:
+        """Merge spans reported by another hop, ignoring malformed entries."""
+        if not isinstance(spans, list):
+            return
+        for span in spans:
+            if not isinstance(span, dict) or not isinstance(span.get("name"), str):
+                continue
+            try:
+                ts_us = float(span["ts_us"])
+                dur_us = float(span["dur_us"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.add(span["name"], ts_us, dur_us, process=str(span.get("process") or process))
+
+    def meta(self) -> Dict[str, Any]:
+        return {"trace_id": self.trace_id, "spans": sorted(self.spans, key=lambda s: s["ts_us"])}
+
+
+def current_trace() -> Optional[Trace]:
+    return _CURRENT.get()
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    """Time a block as a span of the current trace (no-op without one)."""
+    trace = _CURRENT.get()
+    if trace is None:
+        yield
+        return
+    start = time.time()
+    try:
+        yield
+    finally:
+        trace.add(name, start * 1e6, (time.time() - start) * 1e6, **args)
+
+
+@contextmanager
+def start_trace(name: str) -> Iterator[Trace]:
+    """Open a trace for one tools/call, wrap it in a root span and write it out when done."""
+    trace = Trace(name)
+    token = _CURRENT.set(trace)
+    start = time.time()
+    try:
+        yield trace
+    finally:
+        trace.add(name, start * 1e6, (time.time() - start) * 1e6)
+        _CURRENT.reset(token)
+        path = os.environ.get("FRIGG_TRACE_FILE")
+        if path:
+            try:
+                write_trace_events(path, trace)
+            except OSError:
+                pass
+
+
+def write_trace_events(path: str, trace: Trace) -> None:
+    """
+    Append a trace to a Chrome trace-event file (chrome://tracing, Perfetto).
+
+    The file is a JSON array left open so it can be appended to; the format
+    explicitly allows the closing bracket to be missing.
+    """
+    lines = []
+    with _FILE_LOCK:
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        if new_file:
+            lines.append("[")
+            for process, pid in PROCESS_IDS.items():
+                lines.append(json.dumps({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": f"frigg-{process}"}}) + ",")
+        for item in trace.spans:
+            args = dict(item.get("args") or {}, trace_id=trace.trace_id)
+            event = {
+                "name": item["name"],
+                "cat": "frigg",
+                "ph": "X",
+                "ts": item["ts_us"],
+                "dur": item["dur_us"],
+                "pid": PROCESS_IDS.get(item["process"], 0),
+                "tid": 1,
+                "args": args,
+            }
+            lines.append(json.dumps(event) + ",")
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
@@ -0,0 +1,130 @@
+"""Reader for the columnar scene snapshots written by the bridge's scene_snapshot method."""
+
+import json
+import mmap
+import struct
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+SNAPSHOT_MAGIC = b"FRIGGSNP"
+SNAPSHOT_FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<8sII")
+
+# NumPy dtype strings used by the bridge -> memoryview formats.
+_FORMATS = {"u1": "B", "i1": "b", "u2": "H", "i2": "h", "u4": "I", "i4": "i", "u8": "Q", "i8": "q", "f4": "f", "f8": "d"}
+
+
+class SceneSnapshot:
+    """
+    Zero-copy view over a snapshot held in bytes or a memory-mapped file.
+
+    Columns are exposed as flat memoryviews; use the row helpers for
+    matrices and bounding boxes.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap], _file: Any = None) -> None:
+        self._buffer = memoryview(buffer)
+        self._file = _file
+        try:
+            self.header: Dict[str, Any] = self._read_header()
+        except Exception:
+            # Let the caller close the underlying mmap.
+            self._buffer.release()
+            raise
+        self.count: int = self.header["count"]
+        self.types: List[str] = self.header.get("types", [])
+        self.collections: List[str] = self.header.get("collections", [])
+        self._columns: Dict[str, memoryview] = {}
+
+    def _read_header(self) -> Dict[str, Any]:
+        if len(self._buffer) < _PREAMBLE.size:
+            raise ValueError("Not a Frigg scene snapshot")
+        magic, version, header_len = _PREAMBLE.unpack_from(self._buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a Frigg scene snapshot")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version {version}")
+        header_end = _PREAMBLE.size + header_len
+        return json.loads(bytes(self._buffer[_PREAMBLE.size:header_end]).decode("utf-8"))
+
+    def column(self, name: str) -> memoryview:
+        """Flat, typed view of one column (row-major for multi-dimensional columns)."""
+        view = self._columns.get(name)
+        if view is not None:
+            return view
+        spec = self.header["columns"].get(name)
+        if spec is None:
+            raise KeyError(f"Unknown column: {name}")
+        dtype = spec["dtype"]
+        fmt = _FORMATS.get(dtype[1:])
+        if fmt is None:
+            raise ValueError(f"Unsupported dtype {dtype} in column {name}")
+        raw = self._buffer[spec["offset"]:spec["offset"] + spec["nbytes"]]
+        if dtype[0] == ">" or (dtype[0] == "<" and sys.byteorder != "little"):
+            # Foreign byte order: fall back to a swapped copy.
+            values = struct.unpack(f"{dtype[0]}{spec['nbytes'] // struct.calcsize(fmt)}{fmt}", raw)
+            view = memoryview(struct.pack(f"={len(values)}{fmt}", *values)).cast(fmt)
+        else:
+            view = raw.cast(fmt)
+        self._columns[name] = view
+        return view
+
+    def name(self, index: int) -> str:
+        offsets = self.column("name_offsets")
+        data = self.column("name_data")
+        return bytes(data[offsets[index]:offsets[index + 1]]).decode("utf-8")
+
+    def names(self) -> List[str]:
+        return [self.name(index) for index in range(self.count)]
+
+    def index(self, name: str) -> Optional[int]:
+        for index in range(self.count):
+            if self.name(index) == name:
+                return index
+        return None
+
+    def type(self, index: int) -> str:
+        return self.types[self.column("type")[index]]
+
+    def parent(self, index: int) -> Optional[int]:
+        value = self.column("parent")[index]
+        return None if value < 0 else value
+
+    def collection(self, index: int) -> Optional[str]:
+        value = self.column("collection")[index]
+        return None if value < 0 else self.collections[value]
+
+    def matrix_world(self, index: int) -> List[List[float]]:
+        flat = self.column("matrix_world")[index * 16:(index + 1) * 16]
+        return [list(flat[row * 4:(row + 1) * 4]) for row in range(4)]
+
+    def aabb(self, index: int) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        flat = self.column("aabb")[index * 6:(index + 1) * 6]
+        return tuple(flat[:3]), tuple(flat[3:])
+
+    def close(self) -> None:
+        for view in self._columns.values():
+            view.release()
+        self._columns.clear()
+        self._buffer.release()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "SceneSnapshot":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def open_snapshot(path: str) -> SceneSnapshot:
+    """Memory-map a snapshot file written by scene_snapshot."""
+    with open(path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return SceneSnapshot(mapped, _file=mapped)
+    except Exception:
+        mapped.close()
+        raise
@@ -21,6 +21,26 @@ def _empty_schema() -> Dict[str, Any]:
     }
 
 
+# Mesh tools that take object_name or a multi-object selection.
+_MULTI_OBJECT_PROPERTIES: Dict[str, Any] = {
+    "object_names": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Process these objects in one call (instead of object_name).",
+    },
+    "collection": {"type": "string", "description": "Process every object in this collection (instead of object_name)."},
+    "type": {"type": "string", "description": "Object type filter for collection selections (default: MESH)."},
+}
+
+
+def _multi_object_payload(args: Dict[str, Any]) -> Dict[str, Any]:
+    payload = {}
+    for key in ("object_name", "object_names", "collection", "type"):
+        if args.get(key) is not None:
+            payload[key] = args.get(key)
+    return payload
+
+
 CORE_TOOL_DEFS: List[Dict[str, Any]] = [
     {
         "name": "frigg_ping",
@@ -32,6 +52,19 @@ CORE_TOOL_DEFS: List[Dict[str, Any]] = [
         "description": "Ping the Blender bridge server.",
         "inputSchema": _empty_schema(),
     },
+    {
+        "name": "frigg_blender_bridge_metrics",
+        "description": "Per-method latency percentiles (queue wait, handler, encode, send), queue depth and main-thread utilization of the Blender bridge.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "method": {"type": "string", "description": "Only report this bridge method."},
+                "buckets": {"type": "boolean", "description": "Include raw histogram buckets (default: false)."},
+                "reset": {"type": "boolean", "description": "Clear the histograms after reading (default: false)."},
+            },
+            "additionalProperties": False,
+        },
+    },
     {
         "name": "frigg_blender_get_scene_info",
         "description": "Get basic scene info from Blender.",
@@ -39,8 +72,77 @@ CORE_TOOL_DEFS: List[Dict[str, Any]] = [
     },
     {
         "name": "frigg_blender_list_objects",
-        "description": "List all objects in the Blender file.",
-        "inputSchema": _empty_schema(),
+        "description": "List objects in the Blender file by name. Use limit/cursor to page through large scenes and the filters to list only what you need.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "limit": {"type": "integer", "minimum": 1, "maximum": 10000, "description": "Page size (default: all matches)."},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page."},
+                "type": {
+                    "oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}],
+                    "description": "Object type(s), e.g. MESH, CAMERA, LIGHT.",
+                },
+                "collection": {"type": "string", "description": "Only objects in this collection (and its children)."},
+                "pattern": {"type": "string", "description": "Name glob, e.g. 'Tree_*'."},
+                "regex": {"type": "string", "description": "Name regular expression."},
+                "visible": {"type": "boolean", "description": "Only visible (true) or hidden (false) objects."},
+                "scene_only": {"type": "boolean", "description": "Only objects linked to the current scene (default: false)."},
+                "properties": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": ["name", "type", "parent", "collections", "data", "location", "visible"]},
+                    "description": "Return objects as dicts with these keys instead of names.",
+                },
+            },
+            "additionalProperties": False,
+        },
+    },
+    {
+        "name": "frigg_blender_query_objects",
+        "description": (
+            "Find objects with an indexed filter, e.g. {\"type\": \"MESH\", \"material\": \"Bark\", "
+            "\"collection\": \"Forest\", \"polycount\": {\">\": 10000}}. Keys: type, collection, material, "
+            "modifier, parent, data (value or list), name (glob), polycount/vertices (number or {op: n}), "
+            "bbox ({inside|intersects: [[min], [max]]} or {contains: [x, y, z]}), and/or (list), not."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "where": {"type": "object", "description": "Filter expression (default: every object)."},
+                "limit": {"type": "integer", "minimum": 1, "maximum": 10000, "description": "Page size (default: all matches)."},
+                "cursor": {"type": "string", "description": "next_cursor from the previous page."},
+                "properties": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "enum": ["type", "collections", "materials", "modifiers", "parent", "data", "polycount", "vertices", "aabb"],
+                    },
+                    "description": "Return objects as dicts with these keys instead of names.",
+                },
+                "rebuild": {"type": "boolean", "description": "Rebuild the index first (default: false)."},
+            },
+            "additionalProperties": False,
+        },
+    },
+    {
+        "name": "frigg_blender_spatial_query",
+        "description": "Spatial queries over world bounding boxes via a BVH: objects in a region, the nearest objects to a point or object, or overlapping objects.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "action": {"type": "string", "enum": ["region", "nearest", "overlaps"], "description": "Query to run."},
+                "min": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3, "description": "Region corner (action 'region')."},
+                "max": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3, "description": "Opposite region corner (action 'region')."},
+                "mode": {"type": "string", "enum": ["intersects", "inside"], "description": "Region match (default: intersects)."},
+                "point": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3, "description": "Query point (action 'nearest')."},
+                "object_name": {"type": "string", "description": "Query from this object's bounds (nearest/overlaps)."},
+                "k": {"type": "integer", "minimum": 1, "maximum": 1000, "description": "Number of nearest objects (default: 5)."},
+                "max_distance": {"type": "number", "description": "Ignore objects further away (action 'nearest')."},
+                "where": {"type": "object", "description": "Optional query_objects filter on the results."},
+                "limit": {"type": "integer", "minimum": 1, "description": "Maximum number of results."},
+            },
+            "required": ["action"],
+            "additionalProperties": False,
+        },
     },
     {
         "name": "frigg_blender_create_primitive",
@@ -182,6 +284,74 @@ CORE_TOOL_DEFS: List[Dict[str, Any]] = [
             "additionalProperties": False,
         },
     },
+    {
+        "name": "frigg_blender_set_transforms_bulk",
+        "description": "Set local location/rotation/scale of many objects in one call with a single scene update.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "records": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "location": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3},
+                            "rotation": {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3},
+                            "scale": {
+                                "oneOf": [
+                                    {"type": "number"},
+                                    {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3},
+                                ],
+                            },
+                        },
+                        "required": ["name"],
+                    },
+                    "description": "One record per object; omitted channels are left unchanged.",
+                },
+                "rotation_mode": {
+                    "type": "string",
+                    "enum": ["DEGREES", "RADIANS"],
+                    "description": "Rotation units.",
+                    "default": "DEGREES",
+                },
+                "strict": {"type": "boolean", "description": "Fail on unknown object names (default: false)."},
+            },
+            "required": ["records"],
+            "additionalProperties": False,
+        },
+    },
+    {
+        "name": "frigg_blender_get_transforms_bulk",
+        "description": "Read local or world transforms of all (or filtered) objects as packed float32 arrays with a parallel name index.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "names": {"type": "array", "items": {"type": "string"}, "description": "Only these objects."},
+                "type": {"type": "string", "description": "Only objects of this type (e.g. MESH)."},
+                "collection": {"type": "string", "description": "Only objects in this collection (including children)."},
+                "space": {
+                    "type": "string",
+                    "enum": ["LOCAL", "WORLD"],
+                    "description": "LOCAL returns location/rotation/scale, WORLD returns location/matrix.",
+                    "default": "LOCAL",
+                },
+                "rotation_mode": {
+                    "type": "string",
+                    "enum": ["DEGREES", "RADIANS"],
+                    "description": "Rotation units.",
+                    "default": "DEGREES",
+                },
+                "transport": {
+                    "type": "string",
+                    "enum": ["base64", "shm", "list"],
+                    "description": "Array encoding; shm only works on the same host as Blender.",
+                    "default": "base64",
+                },
+            },
+            "additionalProperties": False,
+        },
+    },
     {
         "name": "frigg_blender_apply_transform",
         "description": "Apply transforms to an object (location, rotation, scale).",
@@ -482,8 +652,8 @@ CORE_TOOL_DEFS: List[Dict[str, Any]] = [
             "properties": {
                 "object_name": {"type": "string", "description": "Mesh object name to edit."},
                 "distance": {"type": "number", "minimum": 0, "description": "Merge distance threshold (default: 0.0001).", "default": 0.0001},
+                **_MULTI_OBJECT_PROPERTIES,
             },
-            "required": ["object_name"],
             "additionalProperties": False,
         },
     },
@@ -548,8 +718,8 @@ CORE_TOOL_DEFS: List[Dict[str, Any]] = [
                     ],
                     "description": "List of face indices to subdivide, or null for all faces (default: null).",
                 },
+                **_MULTI_OBJECT_PROPERTIES,
             },
-            "required": ["object_name"],
             "additionalProperties": False,
         },
     },
@@ -567,8 +737,8 @@ CORE_TOOL_DEFS: List[Dict[str, Any]] = [
                     "type": "boolean",
                     "description": "If true, normals point inside; if false, normals point outside (default: false).",
                 },
+                **_MULTI_OBJECT_PROPERTIES,
             },
-            "required": ["object_name"],
             "additionalProperties": False,
         },
     },
@@ -582,8 +752,8 @@ CORE_TOOL_DEFS: List[Dict[str, Any]] = [
                 "smooth": {"type": "boolean", "description": "True for smooth shading, False for flat (default: true)."},
                 "auto_smooth": {"type": "boolean", "description": "Enable auto smooth (default: false)."},
                 "angle": {"type": "number", "description": "Auto smooth angle in degrees (default: 30.0)."},
+                **_MULTI_OBJECT_PROPERTIES,
             },
-            "required": ["object_name"],
             "additionalProperties": False,
         },
     },
@@ -627,8 +797,99 @@ CORE_TOOL_DEFS: List[Dict[str, Any]] = [
             "additionalProperties": False,
         },
     },
+    {
+        "name": "frigg_blender_mesh_session",
+        "description": "Open, edit, commit or discard an in-memory mesh edit session so several mesh ops on one object share a single mesh conversion.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["open", "apply", "commit", "discard", "list"],
+                    "description": "Session step to run.",
+                },
+                "object_name": {"type": "string", "description": "Mesh object to open a session on (action 'open')."},
+                "session": {"type": "integer", "description": "Session id returned by 'open'."},
+                "operations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "op": {
+                                "type": "string",
+                                "enum": [
+                                    "extrude_faces",
+                                    "inset_faces",
+                                    "merge_vertices",
+                                    "bevel_edges",
+                                    "subdivide_mesh",
+                                    "recalculate_normals",
+                                    "select_faces_by_angle",
+                                ],
+                            },
+                            "params": {"type": "object", "description": "Same parameters as the matching tool, without object_name; face_indices may be 'selected'."},
+                        },
+                        "required": ["op"],
+                    },
+                    "description": "Ops to run in order (action 'apply').",
+                },
+                "keep_open": {"type": "boolean", "description": "Keep the session open after commit (default: false)."},
+            },
+            "required": ["action"],
+            "additionalProperties": False,
+        },
+    },
+    {
+        "name": "frigg_blender_job",
+        "description": "Run a heavy bridge method (e.g. batch, apply_all_modifiers, boolean_operation) as an async job: submit returns a job id at once; poll status, fetch the result or cancel.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["submit", "status", "result", "cancel"],
+                    "description": "Job step to run.",
+                },
+                "method": {"type": "string", "description": "Bridge method to run (action 'submit')."},
+                "params": {"type": "object", "description": "Parameters of the bridge method (action 'submit')."},
+                "job": {"type": "integer", "description": "Job id (status/result/cancel); omit with 'status' to list all jobs."},
+                "release": {"type": "boolean", "description": "Drop the job after reading its result (default: false)."},
+            },
+            "required": ["action"],
+            "additionalProperties": False,
+        },
+    },
+    {
+        "name": "frigg_blender_checkpoint",
+        "description": "Scene checkpoints: create one before a risky edit sequence, restore it to roll the scene back. State is captured lazily per edited object; capture_ms reports the cost.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["create", "restore", "discard", "list"],
+                    "description": "Checkpoint step to run.",
+                },
+                "checkpoint": {"type": "string", "description": "Checkpoint name (restore/discard default to the newest)."},
+                "keep": {"type": "boolean", "description": "Keep the checkpoint after restoring it (default: true)."},
+                "all": {"type": "boolean", "description": "Discard every checkpoint (action 'discard')."},
+            },
+            "required": ["action"],
+            "additionalProperties": False,
+        },
+    },
 ]
 
+# Every bridge-backed tool accepts a projection of its result.
+_FIELDS_PROPERTY: Dict[str, Any] = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": "Return only these result keys; dotted paths reach into nested objects and lists (e.g. 'objects.name').",
+}
+for _tool in CORE_TOOL_DEFS:
+    if _tool["name"] != "frigg_ping":
+        _tool["inputSchema"]["properties"]["fields"] = _FIELDS_PROPERTY
+
 CORE_TOOL_NAMES = {tool["name"] for tool in CORE_TOOL_DEFS}
 
 
@@ -653,12 +914,26 @@ def _bridge_call(
     return error_result("bridge_error", str(error) if error else "Unknown bridge error")
 
 
+def _with_fields(
+    call_bridge: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+    fields: Any,
+) -> Callable[[str, Dict[str, Any]], Dict[str, Any]]:
+    """Pass a tool's 'fields' projection on to the bridge with every call."""
+
+    def call(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return call_bridge(method, dict(params, fields=fields))
+
+    return call
+
+
 def handle_core_call(
     name: str,
     arguments: Optional[Dict[str, Any]],
     call_bridge: Callable[[str, Dict[str, Any]], Dict[str, Any]],
 ) -> Dict[str, Any]:
     args = arguments or {}
+    if args.get("fields") is not None:
+        call_bridge = _with_fields(call_bridge, args["fields"])
 
     if name == "frigg_ping":
         return ok_result({"message": "pong"})
@@ -666,11 +941,30 @@ def handle_core_call(
     if name == "frigg_blender_bridge_ping":
         return _bridge_call(call_bridge, "bridge_ping", {})
 
+    if name == "frigg_blender_bridge_metrics":
+        payload = {key: args.get(key) for key in ("method", "buckets", "reset") if args.get(key) is not None}
+        return _bridge_call(call_bridge, "bridge_metrics", payload)
+
     if name == "frigg_blender_get_scene_info":
         return _bridge_call(call_bridge, "scene_info", {})
 
     if name == "frigg_blender_list_objects":
-        return _bridge_call(call_bridge, "list_objects", {})
+        keys = ("limit", "cursor", "type", "collection", "pattern", "regex", "visible", "scene_only", "properties")
+        payload = {key: args.get(key) for key in keys if args.get(key) is not None}
+        return _bridge_call(call_bridge, "list_objects", payload)
+
+    if name == "frigg_blender_query_objects":
+        payload = {key: args.get(key) for key in ("where", "limit", "cursor", "properties", "rebuild") if args.get(key) is not None}
+        return _bridge_call(call_bridge, "query_objects", payload)
+
+    if name == "frigg_blender_spatial_query":
+        methods = {"region": "objects_in_region", "nearest": "nearest_objects", "overlaps": "overlapping_objects"}
+        action = args.get("action")
+        if action not in methods:
+            return error_result("invalid_params", f"Unknown spatial query action: {action}")
+        keys = ("min", "max", "mode", "point", "object_name", "k", "max_distance", "where", "limit")
+        payload = {key: args.get(key) for key in keys if args.get(key) is not None}
+        return _bridge_call(call_bridge, methods[action], payload)
 
     if name == "frigg_blender_create_primitive":
         primitive_type = args.get("type")
@@ -711,6 +1005,26 @@ def handle_core_call(
         }
         return _bridge_call(call_bridge, "set_transform", payload)
 
+    if name == "frigg_blender_set_transforms_bulk":
+        payload = {
+            "records": args.get("records"),
+            "rotation_mode": args.get("rotation_mode", "DEGREES"),
+        }
+        if args.get("strict") is not None:
+            payload["strict"] = args.get("strict")
+        return _bridge_call(call_bridge, "set_transforms_bulk", payload)
+
+    if name == "frigg_blender_get_transforms_bulk":
+        payload = {
+            "space": args.get("space", "LOCAL"),
+            "rotation_mode": args.get("rotation_mode", "DEGREES"),
+            "transport": args.get("transport", "base64"),
+        }
+        for key in ("names", "type", "collection"):
+            if args.get(key) is not None:
+                payload[key] = args.get(key)
+        return _bridge_call(call_bridge, "get_transforms_bulk", payload)
+
     if name == "frigg_blender_apply_transform":
         payload = {
             "name": args.get("name"),
@@ -858,10 +1172,9 @@ def handle_core_call(
         return _bridge_call(call_bridge, "inset_faces", payload)
 
     if name == "frigg_blender_merge_vertices":
-        return _bridge_call(call_bridge, "merge_vertices", {
-            "object_name": args.get("object_name"),
-            "distance": args.get("distance", 0.0001),
-        })
+        payload = _multi_object_payload(args)
+        payload["distance"] = args.get("distance", 0.0001)
+        return _bridge_call(call_bridge, "merge_vertices", payload)
 
     # HIGH PRIORITY TOOLS
     if name == "frigg_blender_bevel_edges":
@@ -877,7 +1190,7 @@ def handle_core_call(
         return _bridge_call(call_bridge, "bevel_edges", payload)
 
     if name == "frigg_blender_subdivide_mesh":
-        payload = {"object_name": args.get("object_name")}
+        payload = _multi_object_payload(args)
         if args.get("cuts") is not None:
             payload["cuts"] = args.get("cuts")
         if args.get("smooth") is not None:
@@ -887,13 +1200,13 @@ def handle_core_call(
         return _bridge_call(call_bridge, "subdivide_mesh", payload)
 
     if name == "frigg_blender_recalculate_normals":
-        payload = {"object_name": args.get("object_name")}
+        payload = _multi_object_payload(args)
         if args.get("inside") is not None:
             payload["inside"] = args.get("inside")
         return _bridge_call(call_bridge, "recalculate_normals", payload)
 
     if name == "frigg_blender_shade_smooth":
-        payload = {"object_name": args.get("object_name")}
+        payload = _multi_object_payload(args)
         if args.get("smooth") is not None:
             payload["smooth"] = args.get("smooth")
         if args.get("auto_smooth") is not None:
@@ -918,4 +1231,56 @@ def handle_core_call(
             payload["extend"] = args.get("extend")
         return _bridge_call(call_bridge, "select_faces_by_angle", payload)
 
+    if name == "frigg_blender_mesh_session":
+        action = args.get("action")
+        if action == "open":
+            return _bridge_call(call_bridge, "mesh_session_open", {"object_name": args.get("object_name")})
+        if action == "apply":
+            return _bridge_call(call_bridge, "mesh_session_apply", {
+                "session": args.get("session"),
+                "operations": args.get("operations"),
+            })
+        if action == "commit":
+            payload = {"session": args.get("session")}
+            if args.get("keep_open") is not None:
+                payload["keep_open"] = args.get("keep_open")
+            return _bridge_call(call_bridge, "mesh_session_commit", payload)
+        if action == "discard":
+            return _bridge_call(call_bridge, "mesh_session_discard", {"session": args.get("session")})
+        if action == "list":
+            return _bridge_call(call_bridge, "mesh_sessions", {})
+        return error_result("invalid_params", f"Unknown mesh session action: {action}")
+
+    if name == "frigg_blender_job":
+        action = args.get("action")
+        if action == "submit":
+            return _bridge_call(call_bridge, "submit_job", {
+                "method": args.get("method"),
+                "params": args.get("params") or {},
+            })
+        if action == "status":
+            payload = {"job": args.get("job")} if args.get("job") is not None else {}
+            return _bridge_call(call_bridge, "job_status", payload)
+        if action == "result":
+            payload = {"job": args.get("job")}
+            if args.get("release") is not None:
+                payload["release"] = args.get("release")
+            return _bridge_call(call_bridge, "job_result", payload)
+        if action == "cancel":
+            return _bridge_call(call_bridge, "cancel_job", {"job": args.get("job")})
+        return error_result("invalid_params", f"Unknown job action: {action}")
+
+    if name == "frigg_blender_checkpoint":
+        action = args.get("action")
+        methods = {
+            "create": "checkpoint_create",
+            "restore": "checkpoint_restore",
+            "discard": "checkpoint_discard",
+            "list": "checkpoints",
+        }
+        if action not in methods:
+            return error_result("invalid_params", f"Unknown checkpoint action: {action}")
+        payload = {key: args[key] for key in ("checkpoint", "keep", "all") if args.get(key) is not None}
+        return _bridge_call(call_bridge, methods[action], payload)
+
     return error_result("unknown_tool", f"Unknown core tool: {name}")
@@ -0,0 +1,24 @@
+from frigg_mcp.tools import core_tools
+
+
+def test_fields_are_passed_to_every_bridge_call():
+    calls = []
+
+    def call_bridge(method, params):
+        calls.append((method, params))
+        return {"ok": True, "result": {"name": "Cube"}}
+
+    result = core_tools.handle_core_call(
+        "frigg_blender_get_transform",
+        {"name": "Cube", "fields": ["location", "rotation.euler"]},
+        call_bridge,
+    )
+
+    assert result == {"ok": True, "result": {"name": "Cube"}}
+    assert calls and all(params["fields"] == ["location", "rotation.euler"] for _method, params in calls)
+
+
+def test_bridge_tools_advertise_fields():
+    tools = {tool["name"]: tool for tool in core_tools.CORE_TOOL_DEFS}
+    assert "fields" not in tools["frigg_ping"]["inputSchema"]["properties"]
+    assert "fields" in tools["frigg_blender_get_transform"]["inputSchema"]["properties"]
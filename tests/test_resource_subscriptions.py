@@ -0,0 +1,84 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+
+
+def send(proc, message):
+    proc.stdin.write(json.dumps(message) + "\n")
+    proc.stdin.flush()
+    return read(proc)
+
+
+def read(proc):
+    line = proc.stdout.readline().strip()
+    if not line:
+        raise RuntimeError("No response from server")
+    return json.loads(line)
+
+
+def _fake_bridge(server, received):
+    """Accept one subscription connection, confirm it and push one change event."""
+    server.settimeout(10)
+    conn, _addr = server.accept()
+    with conn:
+        file = conn.makefile("r", encoding="utf-8")
+        request = json.loads(file.readline())
+        received.append(request)
+        conn.sendall((json.dumps({"ok": True, "result": {"subscription": 7, "scope": "names", "version": 3}}) + "\n").encode())
+        event = {"event": "scene_changed", "subscription": 7, "version": 4, "reset": False, "changes": []}
+        conn.sendall((json.dumps(event) + "\n").encode())
+        file.readline()  # hold the connection until the server exits
+
+
+def test_resource_subscription_forwards_bridge_events():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    received = []
+    thread = threading.Thread(target=_fake_bridge, args=(server, received), daemon=True)
+    thread.start()
+
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.path.join(repo_root, "src")
+    env["FRIGG_BRIDGE_HOST"] = "127.0.0.1"
+    env["FRIGG_BRIDGE_PORT"] = str(server.getsockname()[1])
+
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "frigg_mcp.server.stdio"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        cwd=repo_root,
+    )
+
+    try:
+        init_resp = send(proc, {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}})
+        assert init_resp["result"]["capabilities"]["resources"]["subscribe"] is True
+
+        list_resp = send(proc, {"jsonrpc": "2.0", "id": 2, "method": "resources/list", "params": {}})
+        assert [r["uri"] for r in list_resp["result"]["resources"]] == ["frigg://scene"]
+
+        bad_resp = send(proc, {"jsonrpc": "2.0", "id": 3, "method": "resources/subscribe", "params": {"uri": "frigg://nope"}})
+        assert bad_resp["error"]["code"] == -32602
+
+        uri = "frigg://scene/objects/My%20Cube"
+        sub_resp = send(proc, {"jsonrpc": "2.0", "id": 4, "method": "resources/subscribe", "params": {"uri": uri}})
+        assert sub_resp == {"jsonrpc": "2.0", "id": 4, "result": {}}
+
+        notification = read(proc)
+        assert notification == {
+            "jsonrpc": "2.0",
+            "method": "notifications/resources/updated",
+            "params": {"uri": uri},
+        }
+        assert received == [{"method": "subscribe", "params": {"scope": "names", "names": ["My Cube"]}}]
+    finally:
+        proc.terminate()
+        proc.wait(timeout=2)
+        server.close()
@@ -0,0 +1,73 @@
+import json
+import struct
+
+from frigg_mcp.snapshot import SNAPSHOT_MAGIC, open_snapshot
+
+
+def _align(offset):
+    return (offset + 15) // 16 * 16
+
+
+def _build_snapshot(columns, header):
+    """Lay out columns the way the bridge's scene_snapshot does."""
+    header_len = 1024
+    offset = _align(16 + header_len)
+    table = {}
+    for name, (dtype, shape, fmt, values) in columns.items():
+        data = struct.pack(f"<{len(values)}{fmt}", *values)
+        table[name] = {"dtype": dtype, "shape": shape, "offset": offset, "nbytes": len(data), "data": data}
+        offset = _align(offset + len(data))
+    out = bytearray(offset)
+    for spec in table.values():
+        data = spec.pop("data")
+        out[spec["offset"]:spec["offset"] + len(data)] = data
+    header_bytes = json.dumps(dict(header, columns=table)).encode("utf-8").ljust(header_len)
+    out[0:16] = struct.pack("<8sII", SNAPSHOT_MAGIC, 1, header_len)
+    out[16:16 + header_len] = header_bytes
+    return bytes(out)
+
+
+def test_open_snapshot_reads_columns(tmp_path):
+    names = ["Cube", "Lamp é"]
+    encoded = [name.encode("utf-8") for name in names]
+    offsets = [0, len(encoded[0]), len(encoded[0]) + len(encoded[1])]
+    identity = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+    moved = list(identity)
+    moved[3] = 2.0
+    columns = {
+        "name_offsets": ("<u4", [3], "I", offsets),
+        "name_data": ("|u1", [offsets[-1]], "B", list(b"".join(encoded))),
+        "type": ("|u1", [2], "B", [0, 1]),
+        "parent": ("<i4", [2], "i", [-1, 0]),
+        "collection": ("<i4", [2], "i", [0, -1]),
+        "matrix_world": ("<f4", [2, 4, 4], "f", identity + moved),
+        "aabb": ("<f4", [2, 6], "f", [-1, -1, -1, 1, 1, 1, 2, 0, 0, 2, 0, 0]),
+        "material_count": ("<u2", [2], "H", [1, 0]),
+        "modifier_count": ("<u2", [2], "H", [3, 0]),
+    }
+    header = {"count": 2, "scene": "Scene", "scene_version": 5, "types": ["MESH", "LIGHT"], "collections": ["Props"]}
+    path = tmp_path / "scene.frgs"
+    path.write_bytes(_build_snapshot(columns, header))
+
+    with open_snapshot(str(path)) as snapshot:
+        assert snapshot.count == 2
+        assert snapshot.header["scene_version"] == 5
+        assert snapshot.names() == names
+        assert snapshot.index("Lamp é") == 1
+        assert [snapshot.type(i) for i in range(2)] == ["MESH", "LIGHT"]
+        assert snapshot.parent(0) is None and snapshot.parent(1) == 0
+        assert snapshot.collection(0) == "Props" and snapshot.collection(1) is None
+        assert snapshot.matrix_world(1)[0] == [1.0, 0.0, 0.0, 2.0]
+        assert snapshot.aabb(0) == ((-1.0, -1.0, -1.0), (1.0, 1.0, 1.0))
+        assert list(snapshot.column("modifier_count")) == [3, 0]
+
+
+def test_open_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * 64)
+    try:
+        open_snapshot(str(path))
+    except ValueError as exc:
+        assert "snapshot" in str(exc)
+    else:
+        raise AssertionError("expected ValueError")
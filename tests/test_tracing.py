@@ -0,0 +1,83 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+
+def send(proc, message):
+    proc.stdin.write(json.dumps(message) + "\n")
+    proc.stdin.flush()
+    line = proc.stdout.readline().strip()
+    if not line:
+        raise RuntimeError("No response from server")
+    return json.loads(line)
+
+
+def _fake_bridge(server, received):
+    """Answer one request the way the bridge does for traced requests."""
+    server.settimeout(10)
+    conn, _addr = server.accept()
+    with conn:
+        request = json.loads(conn.makefile("r", encoding="utf-8").readline())
+        received.append(request)
+        now_us = int(time.time() * 1e6)
+        span = {"name": "bridge.handler:bridge_ping", "process": "bridge", "ts_us": now_us, "dur_us": 120}
+        response = {
+            "ok": True,
+            "result": {"pong": True},
+            "trace": {"id": request["trace"]["id"], "spans": [span]},
+        }
+        conn.sendall((json.dumps(response) + "\n").encode())
+
+
+def test_tool_call_returns_trace_meta(tmp_path):
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    received = []
+    thread = threading.Thread(target=_fake_bridge, args=(server, received), daemon=True)
+    thread.start()
+
+    trace_file = tmp_path / "trace.json"
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.path.join(repo_root, "src")
+    env["FRIGG_BRIDGE_HOST"] = "127.0.0.1"
+    env["FRIGG_BRIDGE_PORT"] = str(server.getsockname()[1])
+    env["FRIGG_TRACE_FILE"] = str(trace_file)
+
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "frigg_mcp.server.stdio"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        cwd=repo_root,
+    )
+
+    try:
+        resp = send(
+            proc,
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "frigg_blender_bridge_ping", "arguments": {}}},
+        )
+    finally:
+        proc.terminate()
+        proc.wait(timeout=2)
+        server.close()
+
+    trace = resp["result"]["_meta"]["frigg/trace"]
+    assert received[0]["trace"] == {"id": trace["trace_id"]}
+    names = [span["name"] for span in trace["spans"]]
+    assert names[0] == "tools/call:frigg_blender_bridge_ping"
+    assert {"bridge_call:bridge_ping", "bridge.handler:bridge_ping", "encode"} <= set(names)
+    assert {span["process"] for span in trace["spans"]} == {"stdio", "bridge"}
+
+    text = trace_file.read_text(encoding="utf-8").rstrip().rstrip(",")
+    events = json.loads(text + "]")
+    complete = [event for event in events if event["ph"] == "X"]
+    assert len(complete) == len(trace["spans"])
+    assert all(event["args"]["trace_id"] == trace["trace_id"] for event in complete)
@@ -0,0 +1,174 @@
+"""
+Benchmark: bmesh.ops mesh editing vs. the old edit-mode/operator path.
+
+Run inside Blender (no bridge server needed):
+    blender -b --factory-startup --python tools/bench_mesh_editing.py -- [grid_size] [repeats]
+
+grid_size defaults to 317 (about 100k faces). Each op runs on a fresh grid,
+and the best of `repeats` runs is reported. Each row also compares the
+vertex/face counts both paths leave behind, so one run exercises the bmesh
+handlers against the operator path; the script exits 1 on any mismatch.
+
+Output, one row per handler (times in milliseconds, speedup = legacy / bmesh):
+    Mesh editing benchmark: <faces> faces, grid_size <n>, best of <repeats>
+    Blender <version>, <cpu>
+
+    op                       legacy ms    bmesh ms   speedup   topology
+    extrude_faces                  ...         ...      ...x   same
+    ...
+
+Recorded results:
+    None yet. The bmesh handlers were written where no Blender build was
+    available, so these timings have not been measured. Paste the table here
+    together with the Blender version, the CPU and the grid_size/repeats used.
+"""
+
+import importlib.util
+import platform
+import sys
+import time
+from pathlib import Path
+
+import bpy
+
+BRIDGE_PATH = Path(__file__).parent / "frigg_blender_bridge.py"
+
+
+def load_bridge():
+    spec = importlib.util.spec_from_file_location("frigg_blender_bridge", BRIDGE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_grid(size):
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=size, y_subdivisions=size, size=10.0)
+    obj = bpy.context.active_object
+    obj.name = "BenchGrid"
+    return obj
+
+
+def legacy(obj, params, domain, operator):
+    """The pre-bmesh handler shape: toggle into edit mode, select, run bpy.ops.mesh, toggle out."""
+    import bmesh
+
+    bpy.ops.object.mode_set(mode="OBJECT")
+    bpy.ops.object.select_all(action="DESELECT")
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_mode(type=domain)
+    bpy.ops.mesh.select_all(action="DESELECT")
+    bm = bmesh.from_edit_mesh(obj.data)
+    elements = bm.edges if domain == "EDGE" else bm.faces if domain == "FACE" else bm.verts
+    indices = params.get("edge_indices" if domain == "EDGE" else "face_indices")
+    wanted = None if indices in (None, "all") else set(indices)
+    for element in elements:
+        element.select = wanted is None or element.index in wanted
+    bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+    operator()
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+
+def face_sample(obj, step=10):
+    return list(range(0, len(obj.data.polygons), step))
+
+
+# (handler name, params for the grid, domain, legacy operator call)
+CASES = [
+    (
+        "extrude_faces",
+        lambda obj: {"object_name": obj.name, "face_indices": face_sample(obj), "offset": 0.2},
+        "FACE",
+        lambda: (bpy.ops.mesh.extrude_region(), bpy.ops.transform.shrink_fatten(value=0.2)),
+    ),
+    (
+        "inset_faces",
+        lambda obj: {"object_name": obj.name, "thickness": 0.01},
+        "FACE",
+        lambda: bpy.ops.mesh.inset(thickness=0.01, depth=0.0),
+    ),
+    (
+        "merge_vertices",
+        lambda obj: {"object_name": obj.name, "distance": 0.0001},
+        "VERT",
+        lambda: bpy.ops.mesh.remove_doubles(threshold=0.0001),
+    ),
+    (
+        "bevel_edges",
+        lambda obj: {"object_name": obj.name, "edge_indices": list(range(0, len(obj.data.edges), 50)), "width": 0.005},
+        "EDGE",
+        lambda: bpy.ops.mesh.bevel(offset=0.005, segments=2, profile=0.5),
+    ),
+    (
+        "subdivide_mesh",
+        lambda obj: {"object_name": obj.name, "face_indices": face_sample(obj, 4), "cuts": 1},
+        "FACE",
+        lambda: bpy.ops.mesh.subdivide(number_cuts=1),
+    ),
+    (
+        "recalculate_normals",
+        lambda obj: {"object_name": obj.name},
+        "FACE",
+        lambda: bpy.ops.mesh.normals_make_consistent(inside=False),
+    ),
+]
+
+
+def best_of(repeats, size, run):
+    """Best wall time over `repeats` fresh grids, plus the (verts, faces) the last run left."""
+    best = None
+    for _ in range(repeats):
+        obj = make_grid(size)
+        start = time.perf_counter()
+        run(obj)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    mesh = obj.data
+    return best, (len(mesh.vertices), len(mesh.polygons))
+
+
+def cpu_name():
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/cpuinfo", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.startswith("model name"):
+                        return line.split(":", 1)[1].strip()
+        except OSError:
+            pass
+    return platform.processor() or platform.machine()
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    size = int(argv[0]) if len(argv) > 0 else 317
+    repeats = int(argv[1]) if len(argv) > 1 else 3
+
+    bridge = load_bridge()
+    faces = len(make_grid(size).data.polygons)
+    print(f"\nMesh editing benchmark: {faces} faces, grid_size {size}, best of {repeats}")
+    print(f"Blender {bpy.app.version_string}, {cpu_name()}\n")
+    print(f"{'op':<22}{'legacy ms':>12}{'bmesh ms':>12}{'speedup':>10}   topology")
+
+    mismatched = []
+    for name, make_params, domain, operator in CASES:
+        handler = bridge.HANDLERS[name]["handler"]
+        legacy_s, legacy_counts = best_of(repeats, size, lambda obj: legacy(obj, make_params(obj), domain, operator))
+        bmesh_s, bmesh_counts = best_of(repeats, size, lambda obj: handler(make_params(obj)))
+        topology = "same" if legacy_counts == bmesh_counts else f"legacy {legacy_counts} != bmesh {bmesh_counts}"
+        if legacy_counts != bmesh_counts:
+            mismatched.append(name)
+        print(f"{name:<22}{legacy_s * 1000:>12.1f}{bmesh_s * 1000:>12.1f}{legacy_s / bmesh_s:>9.1f}x   {topology}")
+
+    if mismatched:
+        print(f"\nTopology differs from the operator path: {', '.join(mismatched)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
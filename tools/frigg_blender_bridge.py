@@ -1,3 +1,5 @@
+import collections
+import itertools
 import json
 import os
 import socket
@@ -11,14 +13,633 @@ import bpy
 
 STOP = False
 SERVER_SOCKET = None
-REQUEST_QUEUE = queue.Queue()
 
 
 def log(message: str) -> None:
     print(message, file=sys.stderr, flush=True)
 
 
-def scene_info():
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# Main-thread scheduler: each timer tick drains jobs until TICK_BUDGET_S is
+# spent, then hands control back to Blender so the UI stays responsive.
+TICK_BUDGET_S = _env_float("FRIGG_TICK_BUDGET_MS", 20.0) / 1000.0
+TICK_INTERVAL_S = _env_float("FRIGG_TICK_INTERVAL_MS", 50.0) / 1000.0
+TICK_YIELD_S = 0.001
+
+# Request lanes, highest priority first. A job's lane comes from its handler
+# spec (see lane_for); within a lane jobs run in arrival order.
+LANES = ("interactive", "mutation", "heavy")
+# Starvation protection: a lane's oldest job is served ahead of higher lanes
+# once it has waited this long.
+LANE_MAX_WAIT_S = {
+    "interactive": 0.0,
+    "mutation": _env_float("FRIGG_LANE_MUTATION_MAX_WAIT_MS", 250.0) / 1000.0,
+    "heavy": _env_float("FRIGG_LANE_HEAVY_MAX_WAIT_MS", 1000.0) / 1000.0,
+}
+
+
+class LaneQueue:
+    """
+    Drop-in replacement for the FIFO queue.Queue the scheduler used to pull from.
+
+    put() files a job into its lane; get()/get_nowait() return the oldest
+    overdue job from a lower lane if any, otherwise the head of the highest
+    non-empty lane.
+    """
+
+    def __init__(self, lanes=LANES):
+        self._lanes = {lane: collections.deque() for lane in lanes}
+        self._order = tuple(lanes)
+        self._cond = threading.Condition()
+        self._stats = {
+            lane: {"enqueued": 0, "dequeued": 0, "promoted": 0, "max_depth": 0, "wait": None}
+            for lane in lanes
+        }
+
+    def put(self, job, lane=None):
+        lane = lane or job.get("lane") or self._order[0]
+        with self._cond:
+            jobs = self._lanes[lane]
+            job["lane"] = lane
+            job.setdefault("queued_at", time.perf_counter())
+            jobs.append(job)
+            stats = self._stats[lane]
+            stats["enqueued"] += 1
+            stats["max_depth"] = max(stats["max_depth"], len(jobs))
+            self._cond.notify()
+
+    def _pop(self):
+        now = time.perf_counter()
+        chosen = None
+        promoted = False
+        oldest = None
+        for lane in self._order[1:]:
+            jobs = self._lanes[lane]
+            if jobs and now - jobs[0]["queued_at"] >= LANE_MAX_WAIT_S[lane]:
+                if oldest is None or jobs[0]["queued_at"] < oldest:
+                    oldest = jobs[0]["queued_at"]
+                    chosen = lane
+        if chosen is not None:
+            # Only a promotion if a higher lane actually had work waiting.
+            higher = self._order[:self._order.index(chosen)]
+            promoted = any(self._lanes[lane] for lane in higher)
+        else:
+            for lane in self._order:
+                if self._lanes[lane]:
+                    chosen = lane
+                    break
+        if chosen is None:
+            raise queue.Empty
+        job = self._lanes[chosen].popleft()
+        stats = self._stats[chosen]
+        stats["dequeued"] += 1
+        if promoted:
+            stats["promoted"] += 1
+        if stats["wait"] is None:
+            stats["wait"] = LatencyHistogram()
+        stats["wait"].record(now - job["queued_at"])
+        return job
+
+    def get_nowait(self):
+        with self._cond:
+            return self._pop()
+
+    def get(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not any(self._lanes.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._cond.wait(remaining)
+            return self._pop()
+
+    def qsize(self):
+        with self._cond:
+            return sum(len(jobs) for jobs in self._lanes.values())
+
+    def empty(self):
+        return self.qsize() == 0
+
+    def lane_stats(self, include_buckets=False):
+        with self._cond:
+            return {
+                lane: {
+                    "depth": len(self._lanes[lane]),
+                    "enqueued": stats["enqueued"],
+                    "dequeued": stats["dequeued"],
+                    "promoted": stats["promoted"],
+                    "max_depth": stats["max_depth"],
+                    "max_wait_ms": LANE_MAX_WAIT_S[lane] * 1000.0,
+                    "wait": stats["wait"].summary(include_buckets) if stats["wait"] else {"count": 0},
+                }
+                for lane, stats in self._stats.items()
+            }
+
+    def reset_stats(self):
+        with self._cond:
+            for lane, stats in self._stats.items():
+                stats.update(enqueued=0, dequeued=0, promoted=0, max_depth=len(self._lanes[lane]), wait=None)
+
+
+REQUEST_QUEUE = LaneQueue()
+
+
+def _new_scheduler_stats():
+    return {
+        "started_at": time.time(),
+        "ticks": 0,
+        "busy_ticks": 0,
+        "over_budget_ticks": 0,
+        "jobs": 0,
+        "busy_s": 0.0,
+        "utilization_ewma": 0.0,
+        "max_backlog": 0,
+        "last_tick": None,
+    }
+
+
+SCHEDULER_STATS = _new_scheduler_stats()
+
+# Connected clients. Every connection is served by its own thread, but all
+# bpy work still goes through REQUEST_QUEUE and the main-thread timer.
+MAX_CLIENTS = int(_env_float("FRIGG_BRIDGE_MAX_CLIENTS", 16))
+CLIENTS = {}
+CLIENTS_LOCK = threading.Lock()
+_CLIENT_IDS = itertools.count(1)
+
+
+# =============================================================================
+# HANDLER REGISTRY
+# =============================================================================
+
+# Cost classes drive scheduling decisions; the deadline is the default time a
+# caller should be prepared to wait for a handler of that class.
+COST_DEADLINES = {"light": 5.0, "medium": 30.0, "heavy": 120.0}
+
+# method name -> handler spec (see bridge_method)
+HANDLERS = {}
+
+
+def bridge_method(name, mutating=False, cost="light", deadline=None, aliases=(), envelope=False, slices=None):
+    """
+    Register a bridge handler under one or more method names.
+
+    Parameters:
+        name: Method name clients send in the request
+        mutating: True if the handler changes scene data
+        cost: Expected cost class ("light", "medium" or "heavy")
+        deadline: Default deadline in seconds (defaults to the cost class value)
+        aliases: Extra method names dispatched to the same handler
+        envelope: The handler may return its own {"ok": False, "error": ...}
+        slices: Optional generator function(params) running the same work in
+            main-thread slices for async jobs (see submit_job)
+    """
+    if cost not in COST_DEADLINES:
+        raise ValueError(f"Unknown cost class: {cost}")
+
+    def decorator(func):
+        spec = {
+            "name": name,
+            "handler": func,
+            "mutating": mutating,
+            "cost": cost,
+            "deadline_s": float(deadline if deadline is not None else COST_DEADLINES[cost]),
+            "envelope": envelope,
+            "slices": slices,
+        }
+        for method in (name,) + tuple(aliases):
+            if method in HANDLERS:
+                raise ValueError(f"Bridge method registered twice: {method}")
+            HANDLERS[method] = spec
+        return func
+
+    return decorator
+
+
+def handler_spec(method):
+    return HANDLERS.get(method)
+
+
+def lane_for(request):
+    """
+    Scheduler lane of a request: heavy handlers, other mutations, or interactive.
+
+    A client may pass "lane" to demote a request to a lower-priority lane;
+    a lane above the one the handler spec implies is ignored.
+    """
+    if not isinstance(request, dict):
+        return "interactive"
+    method = request.get("method")
+    spec = HANDLERS.get(method) if isinstance(method, str) else None
+    if spec is None:
+        return "interactive"  # unknown methods fail fast
+    if spec["cost"] == "heavy":
+        lane = "heavy"
+    elif spec["mutating"]:
+        lane = "mutation"
+    else:
+        lane = "interactive"
+    requested = request.get("lane")
+    if requested in LANES and LANES.index(requested) > LANES.index(lane):
+        return requested
+    return lane
+
+
+@bridge_method("bridge_methods")
+def bridge_methods(params=None):
+    methods = []
+    for method, spec in sorted(HANDLERS.items()):
+        methods.append({
+            "method": method,
+            "handler": spec["name"],
+            "mutating": spec["mutating"],
+            "cost": spec["cost"],
+            "deadline_s": spec["deadline_s"],
+            "lane": lane_for({"method": method}),
+        })
+    return {"methods": methods, "count": len(methods)}
+
+
+@bridge_method("bridge_ping")
+def bridge_ping(params=None):
+    return {"pong": True, "time": time.time()}
+
+
+# =============================================================================
+# CHANGE JOURNAL
+# =============================================================================
+
+# Every scene change bumps SCENE_VERSION and appends a compact entry to
+# JOURNAL. Mutating handlers record their own changes; edits made in the
+# Blender UI (or through execute_python) arrive via depsgraph_update_post.
+JOURNAL = collections.deque(maxlen=max(int(_env_float("FRIGG_JOURNAL_SIZE", 10000)), 1))
+SCENE_VERSION = 0
+CHANGE_KINDS = (
+    "added", "removed", "renamed", "transform", "geometry", "material", "modifier", "parent", "collection", "updated",
+)
+# Kinds with no depsgraph flag of their own; their echo is an unflagged
+# Object update, journaled as "updated" when no handler recorded it.
+UNFLAGGED_KINDS = ("material", "modifier", "parent", "collection")
+# object pointer -> name, used to spot additions, removals and renames
+_KNOWN_OBJECTS = {}
+# (object, kind) pairs already journaled by a handler, so the depsgraph
+# update that follows does not record them a second time. Only valid until
+# the next evaluation: cleared after every depsgraph callback and at the end
+# of every busy scheduler tick (see _settle_pending_depsgraph).
+_PENDING_DEPSGRAPH = set()
+
+
+def record_change(kind, name, source="bridge", pointer=None, **details):
+    """Journal one change. Pass the object's pointer when recording a removal."""
+    global SCENE_VERSION
+    SCENE_VERSION += 1
+    entry = {"version": SCENE_VERSION, "kind": kind, "object": name, "source": source}
+    entry.update(details)
+    JOURNAL.append(entry)
+    if SUBSCRIPTIONS:
+        _publish_change(entry)
+
+    if kind == "removed":
+        if pointer is not None:
+            _KNOWN_OBJECTS.pop(pointer, None)
+    elif name is not None:
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            _KNOWN_OBJECTS[obj.as_pointer()] = obj.name
+    if source == "bridge" and kind in ("transform", "geometry"):
+        _PENDING_DEPSGRAPH.add((name, kind))
+    elif source == "bridge" and kind in UNFLAGGED_KINDS:
+        _PENDING_DEPSGRAPH.add((name, "updated"))
+    return entry
+
+
+def _sync_known_objects(source="depsgraph"):
+    """Journal objects added, removed or renamed since the last sync."""
+    current = {obj.as_pointer(): obj.name for obj in bpy.data.objects}
+    for pointer, name in list(_KNOWN_OBJECTS.items()):
+        if pointer not in current:
+            record_change("removed", name, source=source)
+    for pointer, name in current.items():
+        known = _KNOWN_OBJECTS.get(pointer)
+        if known is None:
+            record_change("added", name, source=source)
+        elif known != name:
+            record_change("renamed", name, source=source, old_name=known)
+    _KNOWN_OBJECTS.clear()
+    _KNOWN_OBJECTS.update(current)
+
+
+def _on_depsgraph_update(scene, depsgraph=None):
+    try:
+        if depsgraph is None:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+        if len(bpy.data.objects) != len(_KNOWN_OBJECTS):
+            _sync_known_objects()
+        for update in depsgraph.updates:
+            datablock = update.id.original
+            if isinstance(datablock, bpy.types.Material):
+                record_change("material", None, source="depsgraph", material=datablock.name)
+                continue
+            if isinstance(datablock, bpy.types.Collection):
+                # Linking or unlinking objects updates the collection.
+                record_change("collection", None, source="depsgraph", collection=datablock.name)
+                continue
+            if not isinstance(datablock, bpy.types.Object):
+                continue
+            name = datablock.name
+            known = _KNOWN_OBJECTS.get(datablock.as_pointer())
+            if known is not None and known != name:
+                record_change("renamed", name, source="depsgraph", old_name=known)
+            flagged = False
+            for flag, kind in (("is_updated_transform", "transform"), ("is_updated_geometry", "geometry")):
+                if not getattr(update, flag):
+                    continue
+                flagged = True
+                if (name, kind) in _PENDING_DEPSGRAPH:
+                    _PENDING_DEPSGRAPH.discard((name, kind))
+                    continue
+                record_change(kind, name, source="depsgraph")
+            if not flagged and (name, "updated") not in _PENDING_DEPSGRAPH:
+                # Material slots, modifiers, parenting and collections carry
+                # no flag; journal the object so indexes re-read it.
+                record_change("updated", name, source="depsgraph")
+    except Exception as exc:
+        log(f"Change journal depsgraph hook failed: {exc}")
+    finally:
+        _PENDING_DEPSGRAPH.clear()
+
+
+def _settle_pending_depsgraph() -> None:
+    """
+    Evaluate the depsgraph after a tick of handlers, so the echo of their
+    changes arrives now, then drop what is left. A leftover entry (the
+    handler had already evaluated, or nothing changed) would otherwise
+    swallow the next genuine UI edit to that object.
+    """
+    if not _PENDING_DEPSGRAPH:
+        return
+    try:
+        bpy.context.view_layer.update()
+    except Exception as exc:
+        log(f"Depsgraph update after tick failed: {exc}")
+    _PENDING_DEPSGRAPH.clear()
+
+
+def _register_change_journal() -> None:
+    _KNOWN_OBJECTS.clear()
+    _KNOWN_OBJECTS.update({obj.as_pointer(): obj.name for obj in bpy.data.objects})
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if _on_depsgraph_update not in handlers:
+        handlers.append(_on_depsgraph_update)
+
+
+def _compact_key(entry):
+    """
+    Entries that share a key supersede each other when compacting. Material
+    and collection entries often carry no object, so their target has to be
+    part of the key or changes to different datablocks would collapse.
+    """
+    applied = entry.get("applied")
+    return (
+        entry["object"],
+        entry["kind"],
+        entry.get("material"),
+        entry.get("collection"),
+        entry.get("modifier"),
+        tuple(applied) if applied else None,
+        entry.get("old_name"),
+    )
+
+
+@bridge_method("get_changes")
+def get_changes(params):
+    """
+    Return scene changes recorded after a given version.
+
+    Parameters:
+        since_version: Last version the client has seen (default: 0)
+        compact: Keep only the latest entry per object, kind and target
+            (material, collection, modifier, old name) (default: true)
+        limit: Maximum number of changes to return (default: all)
+
+    Returns:
+        version: Current scene version, to pass as since_version next time
+        reset: True if the journal no longer reaches back to since_version;
+               the client must re-read the scene and continue from version
+        changes: Change entries in version order
+    """
+    since = params.get("since_version", 0)
+    compact = params.get("compact", True)
+    limit = params.get("limit")
+    if not isinstance(since, int) or since < 0:
+        raise ValueError("since_version must be a non-negative integer")
+    if limit is not None and (not isinstance(limit, int) or limit <= 0):
+        raise ValueError("limit must be a positive integer")
+
+    oldest = JOURNAL[0]["version"] if JOURNAL else SCENE_VERSION + 1
+    if since < oldest - 1:
+        return {"version": SCENE_VERSION, "reset": True, "changes": []}
+
+    changes = [entry for entry in JOURNAL if entry["version"] > since]
+    truncated = False
+    version = SCENE_VERSION
+    if limit is not None and len(changes) > limit:
+        changes = changes[:limit]
+        version = changes[-1]["version"]
+        truncated = True
+    if compact:
+        latest = {}
+        for entry in changes:
+            latest[_compact_key(entry)] = entry
+        changes = sorted(latest.values(), key=lambda entry: entry["version"])
+    return {"version": version, "reset": False, "truncated": truncated, "changes": changes}
+
+
+# =============================================================================
+# CHANGE SUBSCRIPTIONS
+# =============================================================================
+
+# Clients subscribe on their own connection; matching journal entries are
+# collected on the main thread and pushed once per scheduler tick as
+#   {"event": "scene_changed", "subscription": id, "version": n, "changes": [...]}
+# lines interleaved with normal responses (responses never carry "event").
+SUBSCRIPTIONS = {}
+SUBSCRIPTION_SCOPES = ("all", "collection", "names")
+OUTBOX_SIZE = 1000
+_SUBSCRIPTION_IDS = itertools.count(1)
+_CURRENT_CLIENT = None
+
+
+def _subscription_matches(sub, entry) -> bool:
+    scope = sub["scope"]
+    name = entry["object"]
+    if scope == "all":
+        return True
+    if name is None:
+        return False
+    if scope == "names":
+        names = sub["names"]
+        if entry["kind"] == "renamed" and entry.get("old_name") in names:
+            names.discard(entry["old_name"])
+            names.add(name)
+            return True
+        return name in names
+    # collection scope: follow membership so removals and moves out still match
+    members = sub["members"]
+    old_name = entry.get("old_name")
+    if old_name in members:
+        members.discard(old_name)
+        members.add(name)
+    collection = bpy.data.collections.get(sub["collection"])
+    inside = collection is not None and collection.all_objects.get(name) is not None
+    if inside:
+        members.add(name)
+        return True
+    if name in members:
+        members.discard(name)
+        return True
+    return False
+
+
+def _publish_change(entry) -> None:
+    for sub in SUBSCRIPTIONS.values():
+        if _subscription_matches(sub, entry):
+            sub["pending"].append(entry)
+
+
+def _flush_subscriptions() -> None:
+    with CLIENTS_LOCK:
+        connected = set(CLIENTS.keys())
+    for sub_id, sub in list(SUBSCRIPTIONS.items()):
+        if sub["client"] not in connected:
+            # Subscriptions die with their connection.
+            del SUBSCRIPTIONS[sub_id]
+            continue
+        if not sub["pending"] and not sub["overflowed"]:
+            continue
+        event = {
+            "event": "scene_changed",
+            "subscription": sub_id,
+            "version": SCENE_VERSION,
+            "reset": sub["overflowed"],
+            "changes": [] if sub["overflowed"] else sub["pending"],
+        }
+        try:
+            sub["outbox"].put_nowait(event)
+        except queue.Full:
+            # Client is not reading; drop detail and ask it to resync later.
+            sub["overflowed"] = True
+        else:
+            sub["overflowed"] = False
+        sub["pending"] = []
+
+
+def _send_to_client(client_id, message, method=None) -> bool:
+    """Send one JSON line; with method set, encode and send time feed bridge_metrics."""
+    with CLIENTS_LOCK:
+        info = CLIENTS.get(client_id)
+    if info is None:
+        return False
+    start = time.perf_counter()
+    payload = (json.dumps(message) + "\n").encode("utf-8")
+    encoded = time.perf_counter()
+    try:
+        with info["send_lock"]:
+            info["conn"].sendall(payload)
+    except OSError:
+        return False
+    if method is not None:
+        record_latency(method, "encode", encoded - start)
+        record_latency(method, "send", time.perf_counter() - encoded)
+    return True
+
+
+def _push_loop(client_id, outbox) -> None:
+    while not STOP:
+        message = outbox.get()
+        if message is None or not _send_to_client(client_id, message):
+            break
+
+
+def _client_outbox(client_id):
+    with CLIENTS_LOCK:
+        info = CLIENTS.get(client_id)
+        if info is None:
+            raise ValueError("subscribe must be sent over a client connection")
+        if info["outbox"] is None:
+            info["outbox"] = queue.Queue(maxsize=OUTBOX_SIZE)
+            threading.Thread(
+                target=_push_loop,
+                args=(client_id, info["outbox"]),
+                name=f"frigg-push-{client_id}",
+                daemon=True,
+            ).start()
+        return info["outbox"]
+
+
+@bridge_method("subscribe")
+def subscribe(params):
+    """
+    Subscribe this connection to scene change events.
+
+    Parameters:
+        scope: "all" | "collection" | "names" (default: all)
+        collection: Collection name (scope "collection")
+        names: Object names (scope "names")
+
+    Returns:
+        subscription id and the scene version events start after
+    """
+    scope = params.get("scope", "all")
+    if scope not in SUBSCRIPTION_SCOPES:
+        raise ValueError(f"scope must be one of {list(SUBSCRIPTION_SCOPES)}")
+    sub = {
+        "client": _CURRENT_CLIENT,
+        "scope": scope,
+        "collection": None,
+        "names": set(),
+        "members": set(),
+        "pending": [],
+        "overflowed": False,
+    }
+    if scope == "collection":
+        collection_name = params.get("collection")
+        collection = bpy.data.collections.get(collection_name) if collection_name else None
+        if collection is None:
+            raise ValueError(f"Collection '{collection_name}' not found")
+        sub["collection"] = collection.name
+        sub["members"] = {obj.name for obj in collection.all_objects}
+    elif scope == "names":
+        names = params.get("names")
+        if not isinstance(names, list) or not names or not all(isinstance(n, str) for n in names):
+            raise ValueError("scope 'names' requires a non-empty 'names' list")
+        sub["names"] = set(names)
+    sub["outbox"] = _client_outbox(_CURRENT_CLIENT)
+
+    sub_id = next(_SUBSCRIPTION_IDS)
+    SUBSCRIPTIONS[sub_id] = sub
+    return {"subscription": sub_id, "scope": scope, "version": SCENE_VERSION}
+
+
+@bridge_method("unsubscribe")
+def unsubscribe(params):
+    sub_id = params.get("subscription")
+    sub = SUBSCRIPTIONS.get(sub_id)
+    if sub is None or sub["client"] != _CURRENT_CLIENT:
+        raise ValueError(f"Subscription {sub_id} not found on this connection")
+    del SUBSCRIPTIONS[sub_id]
+    return {"subscription": sub_id, "unsubscribed": True}
+
+
+@bridge_method("scene_info", aliases=("get_scene_info",))
+def scene_info(params=None):
     scenes = list(bpy.data.scenes)
     if not scenes:
         return {"name": None, "frame_start": None, "frame_end": None, "objects": 0}
@@ -28,13 +649,176 @@ def scene_info():
         "frame_start": scene.frame_start,
         "frame_end": scene.frame_end,
         "objects": len(bpy.data.objects),
+        "version": SCENE_VERSION,
     }
 
 
-def list_objects():
-    return {"objects": [obj.name for obj in bpy.data.objects]}
+LIST_OBJECTS_MAX_LIMIT = 10000
+
+
+def _object_visible(obj) -> bool:
+    try:
+        return obj.visible_get()
+    except RuntimeError:
+        return False  # not in the active view layer
+
+
+# Per-object properties list_objects can return instead of bare names.
+LIST_OBJECT_PROPERTIES = {
+    "name": lambda obj: obj.name,
+    "type": lambda obj: obj.type,
+    "parent": lambda obj: obj.parent.name if obj.parent else None,
+    "collections": lambda obj: [col.name for col in obj.users_collection],
+    "data": lambda obj: obj.data.name if obj.data is not None else None,
+    "location": lambda obj: [float(v) for v in obj.location],
+    "visible": _object_visible,
+}
+
+
+def _encode_cursor(name) -> str:
+    import base64
+
+    return base64.urlsafe_b64encode(name.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor) -> str:
+    import base64
+    import binascii
+
+    try:
+        return base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (AttributeError, binascii.Error, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+
+# Name-sorted snapshot of bpy.data.objects that list_objects pages seek
+# into, so a page costs a bisect plus the page instead of a sort of the
+# whole scene. Rebuilt when SCENE_VERSION or the object count moves, or
+# when a cached object turns out removed or renamed.
+_LIST_ORDER = {"key": None, "names": [], "objects": []}
+
+
+def _sorted_objects(refresh=False):
+    objects = bpy.data.objects
+    key = (SCENE_VERSION, len(objects))
+    if refresh or _LIST_ORDER["key"] != key:
+        pairs = sorted(objects.items())  # names are unique, objects never compared
+        _LIST_ORDER["key"] = key
+        _LIST_ORDER["names"] = [name for name, _obj in pairs]
+        _LIST_ORDER["objects"] = [obj for _name, obj in pairs]
+    return _LIST_ORDER["names"], _LIST_ORDER["objects"]
+
+
+def _cached_object_stale(obj, name) -> bool:
+    try:
+        return obj.name != name
+    except ReferenceError:
+        return True
+
+
+@bridge_method("list_objects")
+def list_objects(params=None):
+    """
+    List objects by name, one page at a time.
+
+    Parameters:
+        limit: Page size (default: everything that matches)
+        cursor: next_cursor of the previous page
+        type: Object type or list of types, e.g. "MESH" or ["MESH", "CURVE"]
+        collection: Only objects in this collection (including child collections)
+        pattern: Name glob, e.g. "Tree_*"
+        regex: Name regular expression (re.search)
+        visible: Only objects visible (true) or hidden (false) in the view layer
+        scene_only: Only objects linked to the current scene (default: false)
+        properties: Return per-object dicts with these keys instead of names
+            (see LIST_OBJECT_PROPERTIES)
+
+    Objects are ordered by name and the cursor holds the last name returned,
+    so pages stay consistent while objects are added or removed. The name
+    order is cached per scene version, so a page costs a bisect plus work
+    per candidate on the page.
+
+    Returns:
+        objects, count and next_cursor (null on the last page)
+    """
+    import bisect
+    import fnmatch
+    import re
+
+    params = params or {}
+    limit = params.get("limit")
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or not 1 <= limit <= LIST_OBJECTS_MAX_LIMIT):
+        raise ValueError(f"limit must be an integer between 1 and {LIST_OBJECTS_MAX_LIMIT}")
+    types = params.get("type")
+    if isinstance(types, str):
+        types = [types]
+    types = {value.upper() for value in types} if types else None
+    pattern = params.get("pattern")
+    regex = None
+    if params.get("regex"):
+        try:
+            regex = re.compile(params["regex"])
+        except re.error as exc:
+            raise ValueError(f"Invalid regex: {exc}")
+    visible = params.get("visible")
+    properties = params.get("properties")
+    if properties is not None:
+        if not isinstance(properties, list) or not properties:
+            raise ValueError("properties must be a non-empty list")
+        unknown = [key for key in properties if key not in LIST_OBJECT_PROPERTIES]
+        if unknown:
+            raise ValueError(f"Unknown properties {unknown}; available: {sorted(LIST_OBJECT_PROPERTIES)}")
+
+    members = None
+    collection_name = params.get("collection")
+    if collection_name:
+        collection = bpy.data.collections.get(collection_name)
+        if collection is None:
+            raise ValueError(f"Collection '{collection_name}' not found")
+        members = {obj.name for obj in collection.all_objects}
+    if params.get("scene_only"):
+        scene_names = set(bpy.context.scene.objects.keys())
+        members = scene_names if members is None else members & scene_names
+
+    after = _decode_cursor(params["cursor"]) if params.get("cursor") else None
+
+    def collect(sorted_names, sorted_objects):
+        start = 0 if after is None else bisect.bisect_right(sorted_names, after)
+        page = []
+        for position in range(start, len(sorted_names)):
+            name = sorted_names[position]
+            if members is not None and name not in members:
+                continue
+            if pattern and not fnmatch.fnmatchcase(name, pattern):
+                continue
+            if regex is not None and regex.search(name) is None:
+                continue
+            obj = sorted_objects[position]
+            if _cached_object_stale(obj, name):
+                return None
+            if types is not None and obj.type not in types:
+                continue
+            if visible is not None and _object_visible(obj) != bool(visible):
+                continue
+            if limit is not None and len(page) == limit:
+                return page, _encode_cursor(page[-1].name)
+            page.append(obj)
+        return page, None
+
+    collected = collect(*_sorted_objects())
+    if collected is None:
+        # Changed outside the journal (no depsgraph hook); re-read the scene once.
+        collected = collect(*_sorted_objects(refresh=True))
+    page, next_cursor = collected
+
+    if properties is None:
+        items = [obj.name for obj in page]
+    else:
+        items = [{key: LIST_OBJECT_PROPERTIES[key](obj) for key in properties} for obj in page]
+    return {"objects": items, "count": len(items), "next_cursor": next_cursor}
 
 
+@bridge_method("move_object", mutating=True)
 def move_object(params):
     name = params.get("name")
     location = params.get("location")
@@ -44,9 +828,11 @@ def move_object(params):
     if obj is None:
         raise ValueError(f"Object not found: {name}")
     obj.location = location
+    record_change("transform", obj.name)
     return {"name": obj.name, "location": [float(v) for v in obj.location]}
 
 
+@bridge_method("get_object_transform")
 def get_object_transform(params):
     name = params.get("name")
     if not name:
@@ -62,6 +848,7 @@ def get_object_transform(params):
     }
 
 
+@bridge_method("set_object_location", mutating=True)
 def set_object_location(params):
     name = params.get("name")
     location = params.get("location")
@@ -71,9 +858,11 @@ def set_object_location(params):
     if obj is None:
         raise ValueError(f"Object not found: {name}")
     obj.location = location
+    record_change("transform", obj.name)
     return {"name": obj.name, "location": [float(v) for v in obj.location]}
 
 
+@bridge_method("set_object_rotation", mutating=True)
 def set_object_rotation(params):
     """
     Set object rotation with multiple input formats.
@@ -113,6 +902,7 @@ def set_object_rotation(params):
         import mathutils
         obj.rotation_mode = 'QUATERNION'
         obj.rotation_quaternion = mathutils.Quaternion(rotation)
+        record_change("transform", obj.name)
         return {
             "object_name": object_name,
             "rotation_quaternion": list(obj.rotation_quaternion),
@@ -125,6 +915,7 @@ def set_object_rotation(params):
     # Set Euler rotation
     obj.rotation_mode = order
     obj.rotation_euler = rotation_rad
+    record_change("transform", obj.name)
 
     return {
         "object_name": object_name,
@@ -136,6 +927,7 @@ def set_object_rotation(params):
     }
 
 
+@bridge_method("set_object_scale", mutating=True)
 def set_object_scale(params):
     """
     Set object scale (uniform or per-axis).
@@ -170,6 +962,7 @@ def set_object_scale(params):
         obj.scale = scale
     else:
         raise ValueError("scale must be a number or [x, y, z] array")
+    record_change("transform", obj.name)
 
     return {
         "object_name": object_name,
@@ -179,6 +972,7 @@ def set_object_scale(params):
     }
 
 
+@bridge_method("select_object", mutating=True)
 def select_object(params):
     name = params.get("name") or params.get("object_name")
     action = (params.get("action") or "SET").upper()
@@ -214,6 +1008,7 @@ def select_object(params):
     }
 
 
+@bridge_method("get_transform")
 def get_transform(params):
     import math
 
@@ -248,6 +1043,7 @@ def get_transform(params):
     }
 
 
+@bridge_method("set_transform", mutating=True)
 def set_transform(params):
     import math
     import mathutils
@@ -306,9 +1102,11 @@ def set_transform(params):
 
         obj.matrix_world = mathutils.Matrix.LocRotScale(target_loc, target_rot, target_scale)
 
+    record_change("transform", obj.name)
     return get_transform({"name": obj.name, "space": space})
 
 
+@bridge_method("apply_transform", mutating=True, cost="medium")
 def apply_transform(params):
     name = params.get("name") or params.get("object_name")
     apply_location = params.get("apply_location", True)
@@ -319,6 +1117,7 @@ def apply_transform(params):
     obj = bpy.data.objects.get(name)
     if not obj:
         raise ValueError(f"Object '{name}' not found")
+    _require_no_mesh_session(obj)
 
     bpy.ops.object.select_all(action='DESELECT')
     obj.select_set(True)
@@ -328,126 +1127,632 @@ def apply_transform(params):
         rotation=apply_rotation,
         scale=apply_scale,
     )
+    record_change("transform", obj.name)
+    record_change("geometry", obj.name)
     return {"name": obj.name, "applied": {"location": apply_location, "rotation": apply_rotation, "scale": apply_scale}}
 
 
-def create_camera(params):
-    import math
+# =============================================================================
+# BULK TRANSFORMS
+# =============================================================================
 
-    name = params.get("name")
-    location = params.get("location", [0, 0, 0])
-    rotation = params.get("rotation", [0, 0, 0])
-    projection = (params.get("projection") or "PERSP").upper()
-    focal_length = params.get("focal_length")
-    ortho_scale = params.get("ortho_scale")
+# Above this share of bpy.data.objects, a foreach_get/foreach_set pass over
+# the whole collection beats assigning objects one by one.
+BULK_FOREACH_RATIO = 0.125
 
-    if projection not in ("PERSP", "ORTHO"):
-        raise ValueError("projection must be PERSP or ORTHO")
 
-    rot_values = [math.radians(a) for a in rotation]
-    bpy.ops.object.camera_add(location=location, rotation=rot_values)
-    obj = bpy.context.active_object
-    if name:
-        obj.name = name
-    if obj and obj.data:
-        obj.data.type = projection
-        if focal_length is not None:
-            obj.data.lens = focal_length
-        if projection == "ORTHO" and ortho_scale is not None:
-            obj.data.ortho_scale = ortho_scale
+def _pack_array(array):
+    """Encode a NumPy array as {"dtype", "shape", "encoding": "base64", "data"}."""
+    import base64
+    import numpy as np
+
+    array = np.ascontiguousarray(array)
     return {
-        "name": obj.name,
-        "location": [float(v) for v in obj.location],
-        "rotation": rotation,
-        "projection": projection,
+        "dtype": str(array.dtype),
+        "shape": list(array.shape),
+        "encoding": "base64",
+        "data": base64.b64encode(array.tobytes()).decode("ascii"),
     }
 
 
-def set_active_camera(params):
-    name = params.get("name")
-    if not name:
-        raise ValueError("set_active_camera requires 'name'")
-    obj = bpy.data.objects.get(name)
-    if not obj or obj.type != 'CAMERA':
-        raise ValueError(f"Camera '{name}' not found")
-    bpy.context.scene.camera = obj
-    return {"name": obj.name, "active": True}
+def _unpack_array(value, count, width, label):
+    """Read a packed array or a flat/nested list into a float32 array of shape (count, width)."""
+    import base64
+    import numpy as np
+
+    if isinstance(value, dict):
+        if value.get("encoding") != "base64":
+            raise ValueError(f"{label}: only base64 packed arrays are supported")
+        dtype = np.dtype(value.get("dtype", "float32"))
+        try:
+            raw = base64.b64decode(value.get("data") or "", validate=True)
+        except ValueError:
+            raise ValueError(f"{label}: invalid base64 data")
+        if len(raw) % dtype.itemsize:
+            raise ValueError(f"{label}: data length does not match dtype {dtype}")
+        array = np.frombuffer(raw, dtype=dtype)
+    elif isinstance(value, (list, tuple)):
+        try:
+            array = np.asarray(value, dtype=np.float64)
+        except ValueError:
+            raise ValueError(f"{label}: must be a list of numbers")
+    else:
+        raise ValueError(f"{label}: must be a packed array or a list")
+    if array.size != count * width:
+        raise ValueError(f"{label}: expected {count * width} values, got {array.size}")
+    return array.astype(np.float32).reshape(count, width)
 
 
-def create_primitive(params):
+def _write_object_vectors(attr, indices, values):
+    """Write (len(indices), 3) values into one vector property of bpy.data.objects."""
+    import numpy as np
+
+    objects = bpy.data.objects
+    if len(indices) >= len(objects) * BULK_FOREACH_RATIO:
+        try:
+            buffer = np.empty(len(objects) * 3, dtype=np.float32)
+            objects.foreach_get(attr, buffer)
+            buffer.reshape(-1, 3)[indices] = values
+            objects.foreach_set(attr, buffer)
+            # foreach_set skips the RNA update that tags objects for the
+            # depsgraph; without the tag matrix_world stays stale.
+            for index in indices.tolist():
+                objects[index].update_tag(refresh={"OBJECT"})
+            return "foreach"
+        except (AttributeError, TypeError, RuntimeError):
+            pass  # fall back to per-object writes
+    for index, value in zip(indices.tolist(), values.tolist()):
+        setattr(objects[index], attr, value)
+    return "loop"
+
+
+@bridge_method("set_transforms_bulk", mutating=True, cost="medium")
+def set_transforms_bulk(params):
     """
-    Create a primitive object (cube, sphere, cylinder, cone, torus, plane, monkey).
+    Set local transforms of many objects in one main-thread pass.
 
     Parameters:
-        primitive_type: Type of primitive to create
-        name: Optional custom name
-        location: Optional [x, y, z] location
-        rotation: Optional [x, y, z] rotation in degrees
-        scale: Optional uniform or [x, y, z] scale
-        size: Optional size parameter
+        records: [{"name", "location"?, "rotation"?, "scale"?}, ...]
+        or, packed:
+        names: Object names
+        location / rotation / scale: flat lists or packed float arrays
+            ({"dtype", "encoding": "base64", "data"}) with 3 values per name
+        rotation_mode: "DEGREES" | "RADIANS" for Euler rotation (default: DEGREES)
+        strict: Fail if a name is unknown instead of skipping it (default: false)
+
+    The depsgraph is updated once at the end. Objects in quaternion or
+    axis-angle rotation mode ignore the Euler rotation written here.
 
     Returns:
-        Object info with name, type, location
+        Count of updated objects, unknown names and write strategy per channel
     """
     import math
+    import numpy as np
 
-    primitive_type = (params.get("primitive_type") or params.get("type", "")).lower()
-    name = params.get("name")
-    location = params.get("location", [0, 0, 0])
-    rotation = params.get("rotation", [0, 0, 0])
-    scale_param = params.get("scale", 1.0)
-    size = params.get("size", 2.0)
-
-    if not primitive_type:
-        raise ValueError("create_primitive requires 'primitive_type' parameter")
-
-    # Map primitive types to operators
-    operators = {
-        "cube": lambda: bpy.ops.mesh.primitive_cube_add(size=size, location=location),
-        "sphere": lambda: bpy.ops.mesh.primitive_uv_sphere_add(radius=size/2, location=location),
-        "cylinder": lambda: bpy.ops.mesh.primitive_cylinder_add(radius=size/2, depth=size, location=location),
-        "cone": lambda: bpy.ops.mesh.primitive_cone_add(radius1=size/2, depth=size, location=location),
-        "torus": lambda: bpy.ops.mesh.primitive_torus_add(major_radius=size/2, minor_radius=size/4, location=location),
-        "plane": lambda: bpy.ops.mesh.primitive_plane_add(size=size, location=location),
-        "monkey": lambda: bpy.ops.mesh.primitive_monkey_add(size=size, location=location)
-    }
+    rotation_mode = (params.get("rotation_mode") or "DEGREES").upper()
+    strict = bool(params.get("strict", False))
+    if rotation_mode not in ("DEGREES", "RADIANS"):
+        raise ValueError("rotation_mode must be DEGREES or RADIANS")
 
-    if primitive_type not in operators:
-        raise ValueError(f"Unknown primitive_type: {primitive_type}. Supported: {', '.join(operators.keys())}")
+    object_index = {name: index for index, name in enumerate(bpy.data.objects.keys())}
+    channels = {}
+    missing = []
+
+    records = params.get("records")
+    if records is not None:
+        if not isinstance(records, list):
+            raise ValueError("records must be a list")
+        gathered = {"location": ([], []), "rotation": ([], []), "scale": ([], [])}
+        for position, record in enumerate(records):
+            if not isinstance(record, dict) or not isinstance(record.get("name"), str):
+                raise ValueError(f"records[{position}] requires 'name'")
+            index = object_index.get(record["name"])
+            if index is None:
+                missing.append(record["name"])
+                continue
+            for key, (indices, values) in gathered.items():
+                value = record.get(key)
+                if value is None:
+                    continue
+                if key == "scale" and isinstance(value, (int, float)):
+                    value = [value, value, value]
+                if not isinstance(value, (list, tuple)) or len(value) != 3:
+                    raise ValueError(f"records[{position}].{key} must be [x, y, z]")
+                indices.append(index)
+                values.append(value)
+        for key, (indices, values) in gathered.items():
+            if indices:
+                channels[key] = (np.asarray(indices), np.asarray(values, dtype=np.float32))
+    else:
+        names = params.get("names")
+        if not isinstance(names, list) or not names:
+            raise ValueError("set_transforms_bulk requires 'records' or 'names'")
+        indices = []
+        keep = []
+        for position, name in enumerate(names):
+            index = object_index.get(name)
+            if index is None:
+                missing.append(name)
+                continue
+            indices.append(index)
+            keep.append(position)
+        indices = np.asarray(indices)
+        for key in ("location", "rotation", "scale"):
+            if params.get(key) is not None:
+                values = _unpack_array(params[key], len(names), 3, key)
+                channels[key] = (indices, values[keep])
+
+    if missing and strict:
+        raise ValueError(f"Objects not found: {missing[:20]}")
+
+    strategies = {}
+    updated = set()
+    for key, attr in (("location", "location"), ("rotation", "rotation_euler"), ("scale", "scale")):
+        if key not in channels:
+            continue
+        indices, values = channels[key]
+        if len(indices) == 0:
+            continue
+        if key == "rotation" and rotation_mode == "DEGREES":
+            values = values * np.float32(math.pi / 180.0)
+        strategies[key] = _write_object_vectors(attr, indices, values)
+        updated.update(indices.tolist())
 
-    # Create the primitive
-    operators[primitive_type]()
+    bpy.context.view_layer.update()
+    objects = bpy.data.objects
+    for index in sorted(updated):
+        record_change("transform", objects[index].name)
 
-    # Get the created object (active object)
-    obj = bpy.context.active_object
+    return {
+        "updated": len(updated),
+        "missing": missing,
+        "strategies": strategies,
+    }
 
-    # Set custom name if provided
-    if name:
-        obj.name = name
 
-    # Apply rotation
-    obj.rotation_euler = [math.radians(a) for a in rotation]
+# Shared-memory segments handed out by get_transforms_bulk, oldest first.
+# The bridge owns them until released or evicted.
+SHARED_BUFFERS = collections.OrderedDict()
+MAX_SHARED_BUFFERS = 8
 
-    # Apply scale
-    if isinstance(scale_param, (int, float)):
-        obj.scale = (scale_param, scale_param, scale_param)
-    else:
-        obj.scale = scale_param
 
-    # Update scene
-    bpy.context.view_layer.update()
+def _share_array(array):
+    """Copy a NumPy array into a new shared-memory segment the client can attach to."""
+    import numpy as np
+    from multiprocessing import shared_memory
 
+    array = np.ascontiguousarray(array)
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    segment.buf[:array.nbytes] = array.tobytes()
+    SHARED_BUFFERS[segment.name] = segment
+    while len(SHARED_BUFFERS) > MAX_SHARED_BUFFERS:
+        _name, oldest = SHARED_BUFFERS.popitem(last=False)
+        _release_segment(oldest)
     return {
-        "name": obj.name,
-        "type": primitive_type,
-        "location": list(obj.location),
-        "rotation_degrees": rotation,
-        "scale": list(obj.scale)
+        "dtype": str(array.dtype),
+        "shape": list(array.shape),
+        "encoding": "shm",
+        "name": segment.name,
+        "nbytes": array.nbytes,
     }
 
 
-def duplicate_object(params):
-    """Duplicate object with optional offset."""
+def _release_segment(segment) -> None:
+    try:
+        segment.close()
+        segment.unlink()
+    except (OSError, BufferError):
+        pass
+
+
+@bridge_method("release_shared_buffers")
+def release_shared_buffers(params):
+    """Release shared-memory segments by name (all of them if 'names' is omitted)."""
+    names = params.get("names")
+    if names is None:
+        names = list(SHARED_BUFFERS.keys())
+    released = []
+    for name in names:
+        segment = SHARED_BUFFERS.pop(name, None)
+        if segment is not None:
+            _release_segment(segment)
+            released.append(name)
+    return {"released": released, "remaining": len(SHARED_BUFFERS)}
+
+
+def _filtered_object_indices(params):
+    """Indices into bpy.data.objects selected by names/type/collection params, in collection order."""
+    objects = bpy.data.objects
+    names = params.get("names")
+    obj_type = params.get("type")
+    collection_name = params.get("collection")
+
+    if names is not None:
+        if not isinstance(names, list):
+            raise ValueError("names must be a list")
+        object_index = {name: index for index, name in enumerate(objects.keys())}
+        indices = [object_index[name] for name in names if name in object_index]
+    else:
+        indices = range(len(objects))
+
+    members = None
+    if collection_name:
+        collection = bpy.data.collections.get(collection_name)
+        if collection is None:
+            raise ValueError(f"Collection '{collection_name}' not found")
+        members = {obj.name for obj in collection.all_objects}
+    if obj_type is None and members is None:
+        return list(indices)
+    obj_type = obj_type.upper() if isinstance(obj_type, str) else None
+    selected = []
+    for index in indices:
+        obj = objects[index]
+        if obj_type is not None and obj.type != obj_type:
+            continue
+        if members is not None and obj.name not in members:
+            continue
+        selected.append(index)
+    return selected
+
+
+def _read_object_floats(attr, width, indices):
+    """Read a float vector/matrix property of bpy.data.objects as a (len(indices), width) float32 array."""
+    import numpy as np
+
+    objects = bpy.data.objects
+    if len(indices) >= len(objects) * BULK_FOREACH_RATIO:
+        try:
+            buffer = np.empty(len(objects) * width, dtype=np.float32)
+            objects.foreach_get(attr, buffer)
+            return buffer.reshape(-1, width)[np.asarray(indices, dtype=np.int64)]
+        except (AttributeError, TypeError, RuntimeError):
+            pass  # fall back to per-object reads
+    values = np.empty((len(indices), width), dtype=np.float32)
+    for row, index in enumerate(indices):
+        value = getattr(objects[index], attr)
+        if width == 16:
+            # foreach_get returns Blender's column-major storage; match it.
+            value = [v for column in value.transposed() for v in column]
+        values[row] = value
+    return values
+
+
+@bridge_method("get_transforms_bulk", cost="medium")
+def get_transforms_bulk(params):
+    """
+    Read transforms of many objects as packed float32 arrays.
+
+    Parameters:
+        names / type / collection: Optional filters (default: all objects)
+        space: "LOCAL" (location, rotation, scale) or "WORLD" (location, matrix)
+        rotation_mode: "DEGREES" | "RADIANS" for LOCAL rotation (default: DEGREES)
+        transport: "base64" (default) | "shm" (shared memory, same host only) | "list"
+
+    Returns:
+        names: Object names, row i of every array belongs to names[i]
+        arrays: location/rotation/scale as (N, 3), matrix as (N, 4, 4) row-major
+    """
+    import math
+    import numpy as np
+
+    space = (params.get("space") or "LOCAL").upper()
+    rotation_mode = (params.get("rotation_mode") or "DEGREES").upper()
+    transport = params.get("transport", "base64")
+    if space not in ("LOCAL", "WORLD"):
+        raise ValueError("space must be LOCAL or WORLD")
+    if rotation_mode not in ("DEGREES", "RADIANS"):
+        raise ValueError("rotation_mode must be DEGREES or RADIANS")
+    if transport not in ("base64", "shm", "list"):
+        raise ValueError("transport must be base64, shm or list")
+
+    indices = _filtered_object_indices(params)
+    objects = bpy.data.objects
+    names = [objects[index].name for index in indices]
+
+    arrays = {}
+    if space == "LOCAL":
+        arrays["location"] = _read_object_floats("location", 3, indices)
+        rotation = _read_object_floats("rotation_euler", 3, indices)
+        if rotation_mode == "DEGREES":
+            rotation = rotation * np.float32(180.0 / math.pi)
+        arrays["rotation"] = rotation
+        arrays["scale"] = _read_object_floats("scale", 3, indices)
+    else:
+        matrices = _read_object_floats("matrix_world", 16, indices).reshape(-1, 4, 4).transpose(0, 2, 1)
+        arrays["matrix"] = np.ascontiguousarray(matrices)
+        arrays["location"] = np.ascontiguousarray(matrices[:, :3, 3])
+
+    if transport == "list":
+        encoded = {key: value.tolist() for key, value in arrays.items()}
+    elif transport == "shm":
+        encoded = {key: _share_array(value) for key, value in arrays.items()}
+    else:
+        encoded = {key: _pack_array(value) for key, value in arrays.items()}
+
+    return {
+        "count": len(names),
+        "names": names,
+        "space": space,
+        "rotation_mode": rotation_mode if space == "LOCAL" else None,
+        "arrays": encoded,
+    }
+
+
+# Columnar scene snapshot file layout (little endian):
+#   8s magic | u32 format version | u32 header length | header JSON | columns
+# Every column starts on a SNAPSHOT_ALIGN boundary; the header lists each
+# column's dtype, shape and absolute byte offset so clients can mmap it.
+SNAPSHOT_MAGIC = b"FRIGGSNP"
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_ALIGN = 16
+
+
+def _output_dir():
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    output_dir = os.environ.get("FRIGG_OUTPUT_DIR") or os.path.join(repo_root, "output")
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+
+def _encode_snapshot(header, columns):
+    """Serialise named NumPy columns behind a JSON header into the snapshot layout."""
+    import struct
+
+    def aligned(offset):
+        return (offset + SNAPSHOT_ALIGN - 1) // SNAPSHOT_ALIGN * SNAPSHOT_ALIGN
+
+    # Offsets depend on the header length, which depends on the offsets;
+    # iterate until the header stops growing (at most a couple of rounds).
+    header_bytes = b""
+    while True:
+        offset = aligned(16 + len(header_bytes))
+        table = {}
+        for name, array in columns.items():
+            table[name] = {
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": offset,
+                "nbytes": array.nbytes,
+            }
+            offset = aligned(offset + array.nbytes)
+        encoded = json.dumps(dict(header, columns=table), separators=(",", ":")).encode("utf-8")
+        if len(encoded) <= len(header_bytes):
+            break
+        header_bytes = encoded + b" " * 64
+    header_bytes = encoded.ljust(len(header_bytes))
+
+    out = bytearray(offset)
+    out[0:16] = struct.pack("<8sII", SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header_bytes))
+    out[16:16 + len(header_bytes)] = header_bytes
+    for name, array in columns.items():
+        start = table[name]["offset"]
+        out[start:start + array.nbytes] = array.tobytes()
+    return bytes(out)
+
+
+@bridge_method("scene_snapshot", cost="heavy")
+def scene_snapshot(params):
+    """
+    Dump the whole scene as one columnar binary snapshot.
+
+    Parameters:
+        output: "file" (default) writes under FRIGG_OUTPUT_DIR, "base64" returns the bytes inline
+        filename: Optional file name (default: scene_snapshot_<timestamp>.frgs)
+
+    Returns:
+        path or data, plus count, bytes and the scene version the snapshot reflects.
+        Columns: name_offsets/name_data (UTF-8), type, parent, collection,
+        matrix_world (N, 4, 4 row-major), aabb (N, 6 world min/max),
+        material_count, modifier_count.
+    """
+    import base64
+    import numpy as np
+
+    output = params.get("output", "file")
+    if output not in ("file", "base64"):
+        raise ValueError("output must be file or base64")
+
+    objects = bpy.data.objects
+    count = len(objects)
+    index_by_name = {name: index for index, name in enumerate(objects.keys())}
+    collections = list(bpy.data.collections.keys())
+    collection_index = {name: index for index, name in enumerate(collections)}
+
+    names = [name.encode("utf-8") for name in objects.keys()]
+    name_offsets = np.zeros(count + 1, dtype=np.uint32)
+    if names:
+        name_offsets[1:] = np.cumsum([len(name) for name in names])
+    name_data = np.frombuffer(b"".join(names), dtype=np.uint8)
+
+    types = []
+    type_codes = {}
+    type_column = np.empty(count, dtype=np.uint8)
+    parent = np.full(count, -1, dtype=np.int32)
+    collection = np.full(count, -1, dtype=np.int32)
+    aabb = np.zeros((count, 6), dtype=np.float32)
+    material_count = np.zeros(count, dtype=np.uint16)
+    modifier_count = np.zeros(count, dtype=np.uint16)
+
+    matrices = _read_object_floats("matrix_world", 16, list(range(count))).reshape(-1, 4, 4).transpose(0, 2, 1)
+    matrices = np.ascontiguousarray(matrices, dtype=np.float32)
+
+    for index, obj in enumerate(objects):
+        code = type_codes.get(obj.type)
+        if code is None:
+            code = type_codes[obj.type] = len(types)
+            types.append(obj.type)
+        type_column[index] = code
+        if obj.parent is not None:
+            parent[index] = index_by_name.get(obj.parent.name, -1)
+        if obj.users_collection:
+            owner = obj.users_collection[0].name
+            # The scene master collection is not in bpy.data.collections and stays -1.
+            collection[index] = collection_index.get(owner, -1)
+        corners = np.asarray([corner[:] for corner in obj.bound_box], dtype=np.float32)
+        world = corners @ matrices[index, :3, :3].T + matrices[index, :3, 3]
+        aabb[index, :3] = world.min(axis=0)
+        aabb[index, 3:] = world.max(axis=0)
+        material_count[index] = min(len(obj.material_slots), 0xFFFF)
+        modifier_count[index] = min(len(obj.modifiers), 0xFFFF)
+
+    columns = {
+        "name_offsets": name_offsets,
+        "name_data": name_data,
+        "type": type_column,
+        "parent": parent,
+        "collection": collection,
+        "matrix_world": matrices,
+        "aabb": aabb,
+        "material_count": material_count,
+        "modifier_count": modifier_count,
+    }
+    header = {
+        "count": count,
+        "scene": bpy.context.scene.name,
+        "scene_version": SCENE_VERSION,
+        "types": types,
+        "collections": collections,
+    }
+    data = _encode_snapshot(header, columns)
+
+    result = {"count": count, "bytes": len(data), "scene_version": SCENE_VERSION, "format_version": SNAPSHOT_FORMAT_VERSION}
+    if output == "base64":
+        result["data"] = base64.b64encode(data).decode("ascii")
+        return result
+
+    filename = params.get("filename") or f"scene_snapshot_{int(time.time() * 1000)}.frgs"
+    if os.path.basename(filename) != filename:
+        raise ValueError("filename must not contain directories")
+    path = os.path.join(_output_dir(), filename)
+    with open(path, "wb") as handle:
+        handle.write(data)
+    result["path"] = path
+    return result
+
+
+@bridge_method("create_camera", mutating=True, cost="medium")
+def create_camera(params):
+    import math
+
+    name = params.get("name")
+    location = params.get("location", [0, 0, 0])
+    rotation = params.get("rotation", [0, 0, 0])
+    projection = (params.get("projection") or "PERSP").upper()
+    focal_length = params.get("focal_length")
+    ortho_scale = params.get("ortho_scale")
+
+    if projection not in ("PERSP", "ORTHO"):
+        raise ValueError("projection must be PERSP or ORTHO")
+
+    rot_values = [math.radians(a) for a in rotation]
+    bpy.ops.object.camera_add(location=location, rotation=rot_values)
+    obj = bpy.context.active_object
+    if name:
+        obj.name = name
+    if obj and obj.data:
+        obj.data.type = projection
+        if focal_length is not None:
+            obj.data.lens = focal_length
+        if projection == "ORTHO" and ortho_scale is not None:
+            obj.data.ortho_scale = ortho_scale
+    record_change("added", obj.name)
+    return {
+        "name": obj.name,
+        "location": [float(v) for v in obj.location],
+        "rotation": rotation,
+        "projection": projection,
+    }
+
+
+@bridge_method("set_active_camera", mutating=True)
+def set_active_camera(params):
+    name = params.get("name")
+    if not name:
+        raise ValueError("set_active_camera requires 'name'")
+    obj = bpy.data.objects.get(name)
+    if not obj or obj.type != 'CAMERA':
+        raise ValueError(f"Camera '{name}' not found")
+    bpy.context.scene.camera = obj
+    return {"name": obj.name, "active": True}
+
+
+@bridge_method("create_primitive", mutating=True, cost="medium")
+def create_primitive(params):
+    """
+    Create a primitive object (cube, sphere, cylinder, cone, torus, plane, monkey).
+
+    Parameters:
+        primitive_type: Type of primitive to create
+        name: Optional custom name
+        location: Optional [x, y, z] location
+        rotation: Optional [x, y, z] rotation in degrees
+        scale: Optional uniform or [x, y, z] scale
+        size: Optional size parameter
+
+    Returns:
+        Object info with name, type, location
+    """
+    import math
+
+    primitive_type = (params.get("primitive_type") or params.get("type", "")).lower()
+    name = params.get("name")
+    location = params.get("location", [0, 0, 0])
+    rotation = params.get("rotation", [0, 0, 0])
+    scale_param = params.get("scale", 1.0)
+    size = params.get("size", 2.0)
+
+    if not primitive_type:
+        raise ValueError("create_primitive requires 'primitive_type' parameter")
+
+    # Map primitive types to operators
+    operators = {
+        "cube": lambda: bpy.ops.mesh.primitive_cube_add(size=size, location=location),
+        "sphere": lambda: bpy.ops.mesh.primitive_uv_sphere_add(radius=size/2, location=location),
+        "cylinder": lambda: bpy.ops.mesh.primitive_cylinder_add(radius=size/2, depth=size, location=location),
+        "cone": lambda: bpy.ops.mesh.primitive_cone_add(radius1=size/2, depth=size, location=location),
+        "torus": lambda: bpy.ops.mesh.primitive_torus_add(major_radius=size/2, minor_radius=size/4, location=location),
+        "plane": lambda: bpy.ops.mesh.primitive_plane_add(size=size, location=location),
+        "monkey": lambda: bpy.ops.mesh.primitive_monkey_add(size=size, location=location)
+    }
+
+    if primitive_type not in operators:
+        raise ValueError(f"Unknown primitive_type: {primitive_type}. Supported: {', '.join(operators.keys())}")
+
+    # Create the primitive
+    operators[primitive_type]()
+
+    # Get the created object (active object)
+    obj = bpy.context.active_object
+
+    # Set custom name if provided
+    if name:
+        obj.name = name
+
+    # Apply rotation
+    obj.rotation_euler = [math.radians(a) for a in rotation]
+
+    # Apply scale
+    if isinstance(scale_param, (int, float)):
+        obj.scale = (scale_param, scale_param, scale_param)
+    else:
+        obj.scale = scale_param
+
+    # Update scene
+    bpy.context.view_layer.update()
+    record_change("added", obj.name)
+
+    return {
+        "name": obj.name,
+        "type": primitive_type,
+        "location": list(obj.location),
+        "rotation_degrees": rotation,
+        "scale": list(obj.scale)
+    }
+
+
+@bridge_method("duplicate_object", mutating=True, cost="medium")
+def duplicate_object(params):
+    """Duplicate object with optional offset."""
     object_name = params.get("object_name") or params.get("name")
     new_name = params.get("new_name")
     offset = params.get("offset", [0, 0, 0])
@@ -464,8 +1769,10 @@ def duplicate_object(params):
     if new_name:
         new_obj.name = new_name
     new_obj.location = [obj.location[i] + offset[i] for i in range(3)]
+    record_change("added", new_obj.name, source_object=object_name)
     return {"original": object_name, "duplicate": new_obj.name, "location": list(new_obj.location)}
 
+@bridge_method("delete_object", mutating=True)
 def delete_object(params):
     """Delete object from scene."""
     object_name = params.get("object_name") or params.get("name")
@@ -474,11 +1781,14 @@ def delete_object(params):
     obj = bpy.data.objects.get(object_name)
     if not obj:
         raise ValueError(f"Object '{object_name}' not found")
+    pointer = obj.as_pointer()
     for collection in obj.users_collection:
         collection.objects.unlink(obj)
     bpy.data.objects.remove(obj, do_unlink=True)
+    record_change("removed", object_name, pointer=pointer)
     return {"deleted": object_name, "success": True}
 
+@bridge_method("rename_object", mutating=True)
 def rename_object(params):
     """Rename object."""
     object_name = params.get("object_name") or params.get("name")
@@ -490,9 +1800,11 @@ def rename_object(params):
         raise ValueError(f"Object '{object_name}' not found")
     old_name = obj.name
     obj.name = new_name
+    record_change("renamed", obj.name, old_name=old_name)
     return {"old_name": old_name, "new_name": obj.name}
 
 
+@bridge_method("set_material", mutating=True)
 def set_material(params):
     """Create/assign material with color."""
     object_name = params.get("object_name") or params.get("name")
@@ -518,8 +1830,10 @@ def set_material(params):
         obj.data.materials[0] = mat
     else:
         obj.data.materials.append(mat)
+    record_change("material", obj.name, material=mat.name)
     return {"object_name": object_name, "material_name": mat.name, "color": list(color), "metallic": metallic, "roughness": roughness}
 
+@bridge_method("set_parent", mutating=True)
 def set_parent(params):
     """Set parent-child relationship."""
     child_name = params.get("child") or params.get("child_name")
@@ -536,8 +1850,10 @@ def set_parent(params):
     child.parent = parent
     if keep_transform:
         child.matrix_parent_inverse = parent.matrix_world.inverted()
+    record_change("parent", child.name, parent=parent.name)
     return {"child": child_name, "parent": parent_name, "keep_transform": keep_transform}
 
+@bridge_method("set_smooth_shading", mutating=True, cost="medium")
 def set_smooth_shading(params):
     """Set smooth or flat shading."""
     object_name = params.get("object_name") or params.get("name")
@@ -547,10 +1863,13 @@ def set_smooth_shading(params):
     obj = bpy.data.objects.get(object_name)
     if not obj or obj.type != 'MESH':
         raise ValueError(f"Mesh object '{object_name}' not found")
+    _require_no_mesh_session(obj)
     for poly in obj.data.polygons:
         poly.use_smooth = smooth
+    record_change("geometry", obj.name)
     return {"object_name": object_name, "smooth": smooth}
 
+@bridge_method("measure_distance")
 def measure_distance(params):
     """PROTOTYPE: Measure distance between two objects"""
     obj1_name = params.get("object1")
@@ -587,30 +1906,173 @@ def measure_distance(params):
     }
 
 
-def execute_python(params):
-    """
-    META-TOOL: Execute arbitrary Python code in Blender
+# Compiled scripts keyed by SHA-256 of the source, least recently used first.
+CODE_CACHE = collections.OrderedDict()
+CODE_CACHE_SIZE = 128
 
-    This is a development tool for rapid prototyping.
-    Allows testing new tool ideas without restarting the bridge.
-    """
-    import io
-    import sys as pysys
+# Named namespaces that keep globals (and helper functions) between calls.
+PYTHON_NAMESPACES = {}
+MAX_PYTHON_NAMESPACES = 16
+PYTHON_NAMESPACE_MAX_BYTES = int(_env_float("FRIGG_PYTHON_NAMESPACE_MAX_MB", 64) * 1024 * 1024)
 
-    script = params.get("script")
-    if not script:
-        raise ValueError("execute_python requires 'script' parameter")
 
-    # Prepare execution namespace with common imports
-    namespace = {
+def _python_base_namespace():
+    import math
+    import mathutils
+
+    return {
         'bpy': bpy,
-        'math': __import__('math'),
-        'mathutils': __import__('mathutils'),
-        'Vector': __import__('mathutils').Vector,
+        'math': math,
+        'mathutils': mathutils,
+        'Vector': mathutils.Vector,
         'time': time,
     }
 
-    # Capture stdout and stderr
+
+def _compile_cached(script):
+    import hashlib
+
+    digest = hashlib.sha256(script.encode("utf-8")).hexdigest()
+    code = CODE_CACHE.get(digest)
+    if code is not None:
+        CODE_CACHE.move_to_end(digest)
+        return code, digest, True
+    code = compile(script, f"<frigg:{digest[:12]}>", "exec")
+    CODE_CACHE[digest] = code
+    while len(CODE_CACHE) > CODE_CACHE_SIZE:
+        CODE_CACHE.popitem(last=False)
+    return code, digest, False
+
+
+def _namespace_bytes(namespace) -> int:
+    """Rough size of user values in a namespace (containers counted one level deep)."""
+    base = _python_base_namespace()
+    total = 0
+    for key, value in namespace.items():
+        if key in base or key == "__builtins__":
+            continue
+        total += sys.getsizeof(value, 0)
+        if isinstance(value, dict):
+            total += sum(sys.getsizeof(k, 0) + sys.getsizeof(v, 0) for k, v in value.items())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            total += sum(sys.getsizeof(item, 0) for item in value)
+    return total
+
+
+def _python_namespace(name, reset=False):
+    """Fresh namespace for name None, otherwise the named persistent one (created on demand)."""
+    if name is None:
+        return _python_base_namespace(), None
+    if not isinstance(name, str) or not name:
+        raise ValueError("namespace must be a non-empty string")
+    entry = PYTHON_NAMESPACES.get(name)
+    if entry is None or reset:
+        if entry is None and len(PYTHON_NAMESPACES) >= MAX_PYTHON_NAMESPACES:
+            raise ValueError(f"Too many Python namespaces (max {MAX_PYTHON_NAMESPACES}); reset one first")
+        entry = PYTHON_NAMESPACES[name] = {"globals": _python_base_namespace(), "created_at": time.time(), "runs": 0}
+    entry["runs"] += 1
+    entry["last_used"] = time.time()
+    return entry["globals"], entry
+
+
+def _enforce_namespace_cap(name, entry):
+    """Drop a persistent namespace that outgrew its memory cap; returns a warning or None."""
+    if entry is None:
+        return None
+    size = _namespace_bytes(entry["globals"])
+    entry["approx_bytes"] = size
+    if size <= PYTHON_NAMESPACE_MAX_BYTES:
+        return None
+    PYTHON_NAMESPACES.pop(name, None)
+    return f"Namespace '{name}' exceeded {PYTHON_NAMESPACE_MAX_BYTES} bytes (~{size}) and was reset"
+
+
+# Lists at least this long are returned packed (see _pack_array).
+PACK_MIN_ITEMS = 256
+ENCODE_MAX_DEPTH = 32
+# result_encoding values: "auto" packs NumPy arrays and long lists of
+# mathutils vectors (neither was JSON before); "packed" also packs long
+# plain numeric lists; "json" packs nothing.
+RESULT_ENCODINGS = ("auto", "packed", "json")
+
+
+def _encode_result(value, encoding="auto", depth=0):
+    """
+    Convert a script result into JSON-safe data.
+
+    mathutils values become lists (matrices as rows), bpy IDs become
+    {"id_type", "name"}, arrays are packed per RESULT_ENCODINGS, and
+    anything else unknown falls back to repr().
+    """
+    import math
+    import mathutils
+
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if depth >= ENCODE_MAX_DEPTH:
+        return repr(value)
+    if isinstance(value, mathutils.Matrix):
+        return [list(row) for row in value]
+    if isinstance(value, (mathutils.Vector, mathutils.Euler, mathutils.Quaternion, mathutils.Color)):
+        return list(value)
+    if isinstance(value, bpy.types.ID):
+        return {"id_type": type(value).__name__, "name": value.name}
+    if isinstance(value, dict):
+        return {str(key): _encode_result(item, encoding, depth + 1) for key, item in value.items()}
+    if hasattr(value, "__array_interface__") and type(value).__module__ == "numpy":
+        # Object arrays hold pointers; their bytes are meaningless to the client.
+        if encoding != "json" and value.dtype.kind != "O":
+            return _pack_array(value)
+        return _encode_result(value.tolist(), encoding, depth + 1)
+    if type(value).__module__ == "numpy" and hasattr(value, "item"):
+        return _encode_result(value.item(), encoding, depth + 1)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+        if encoding != "json" and len(items) >= PACK_MIN_ITEMS:
+            array = _numeric_array(items, numbers=encoding == "packed")
+            if array is not None:
+                return _pack_array(array)
+        return [_encode_result(item, encoding, depth + 1) for item in items]
+    return repr(value)
+
+
+def _numeric_array(items, numbers=False):
+    """
+    NumPy array for a list of same-size mathutils vectors or, with numbers,
+    a homogeneous list of numbers; None when the list does not qualify.
+    """
+    import mathutils
+    import numpy as np
+
+    first = items[0]
+    if isinstance(first, (int, float)) and not isinstance(first, bool):
+        if not numbers:
+            return None
+        try:
+            if all(isinstance(item, int) and not isinstance(item, bool) for item in items):
+                return np.asarray(items, dtype=np.int64)
+            if all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in items):
+                return np.asarray(items, dtype=np.float64)
+        except OverflowError:
+            pass  # ints beyond int64 stay plain JSON
+        return None
+    if isinstance(first, (mathutils.Vector, mathutils.Color, mathutils.Euler, mathutils.Quaternion)):
+        width = len(first)
+        if all(type(item) is type(first) and len(item) == width for item in items):
+            array = np.empty(len(items) * width, dtype=np.float32)
+            for index, item in enumerate(items):
+                array[index * width:(index + 1) * width] = item
+            return array.reshape(-1, width)
+    return None
+
+
+def _run_captured(func, encoding="auto"):
+    """Run func() with stdout/stderr captured; returns the execute_python-style result dict."""
+    import io
+    import sys as pysys
+
     stdout_capture = io.StringIO()
     stderr_capture = io.StringIO()
     old_stdout = pysys.stdout
@@ -620,32 +2082,26 @@ def execute_python(params):
         pysys.stdout = stdout_capture
         pysys.stderr = stderr_capture
 
-        # Execute the script
-        exec(script, namespace)
-
-        # Get captured output
-        stdout_text = stdout_capture.getvalue()
-        stderr_text = stderr_capture.getvalue()
-
-        # Try to extract a return value if 'result' was set
-        result_value = namespace.get('result', None)
+        try:
+            result_value = _encode_result(func(), encoding)
+        finally:
+            _sync_known_objects(source="execute_python")
 
         return {
             "success": True,
-            "stdout": stdout_text,
-            "stderr": stderr_text,
+            "stdout": stdout_capture.getvalue(),
+            "stderr": stderr_capture.getvalue(),
             "result": result_value,
             "message": "Script executed successfully"
         }
 
     except Exception as exc:
-        stderr_text = stderr_capture.getvalue()
         return {
             "success": False,
             "error": str(exc),
             "error_type": type(exc).__name__,
             "stdout": stdout_capture.getvalue(),
-            "stderr": stderr_text,
+            "stderr": stderr_capture.getvalue(),
             "traceback": traceback.format_exc()
         }
 
@@ -654,33 +2110,173 @@ def execute_python(params):
         pysys.stderr = old_stderr
 
 
-def viewport_snapshot(params):
-    """
-    VISION TOOL: Capture viewport snapshot (UI-only).
-    """
-    import base64
-    import tempfile
-    import os
+def _result_encoding(params):
+    encoding = params.get("result_encoding", "auto")
+    if encoding not in RESULT_ENCODINGS:
+        raise ValueError(f"result_encoding must be one of {list(RESULT_ENCODINGS)}")
+    return encoding
 
-    shading = params.get("shading", "solid")
-    projection = params.get("projection", "persp")
-    view = params.get("view", "current")  # current, front, back, left, right, top, bottom
-    width = params.get("width", 512)
-    height = params.get("height", 512)
-    return_base64 = params.get("return_base64", False)
-    filename = params.get("filename")
 
-    shading_map = {"solid": "SOLID", "wireframe": "WIREFRAME"}
-    if shading not in shading_map:
-        raise ValueError("shading must be 'solid' or 'wireframe'")
+@bridge_method("execute_python", mutating=True, cost="heavy")
+def execute_python(params):
+    """
+    META-TOOL: Execute arbitrary Python code in Blender
 
-    projection_map = {"persp": "PERSP", "perspective": "PERSP", "ortho": "ORTHO"}
-    if projection not in projection_map:
-        raise ValueError("projection must be 'persp' or 'ortho'")
+    This is a development tool for rapid prototyping.
+    Allows testing new tool ideas without restarting the bridge.
 
-    valid_views = ["current", "front", "back", "left", "right", "top", "bottom"]
-    if view not in valid_views:
-        raise ValueError(f"view must be one of {valid_views}")
+    Parameters:
+        script: Python source; bind 'result' to return a value
+        namespace: Optional name of a persistent namespace whose globals
+            (including functions defined by the script) survive between calls
+        reset: Start the named namespace from scratch (default: false)
+        result_encoding: "auto" (default) returns NumPy arrays and long
+            vector lists as base64 arrays; "packed" also packs long numeric
+            lists; "json" keeps everything as plain lists
+
+    Compiled code is cached by source hash, so re-running a script skips compile.
+    """
+    script = params.get("script")
+    if not script:
+        raise ValueError("execute_python requires 'script' parameter")
+
+    encoding = _result_encoding(params)
+    name = params.get("namespace")
+    namespace, entry = _python_namespace(name, reset=bool(params.get("reset")))
+    namespace.pop("result", None)
+
+    try:
+        code, digest, cache_hit = _compile_cached(script)
+    except SyntaxError as exc:
+        return {
+            "success": False,
+            "error": str(exc),
+            "error_type": type(exc).__name__,
+            "stdout": "",
+            "stderr": "",
+            "traceback": traceback.format_exc()
+        }
+
+    def run():
+        exec(code, namespace)
+        return namespace.get('result', None)
+
+    response = _run_captured(run, encoding)
+    response["code_hash"] = digest
+    response["cache_hit"] = cache_hit
+    if name is not None:
+        response["namespace"] = name
+        warning = _enforce_namespace_cap(name, entry)
+        if warning:
+            response["warning"] = warning
+    return response
+
+
+@bridge_method("python_call", mutating=True, cost="heavy")
+def python_call(params):
+    """
+    Call a function previously defined in a persistent namespace.
+
+    Parameters:
+        namespace: Namespace the helper was defined in (via execute_python)
+        function: Name of the callable
+        args / kwargs: JSON arguments
+
+    No source is sent or compiled, so registered helpers are cheap to invoke.
+    """
+    encoding = _result_encoding(params)
+    name = params.get("namespace")
+    function_name = params.get("function")
+    entry = PYTHON_NAMESPACES.get(name)
+    if entry is None:
+        raise ValueError(f"Python namespace '{name}' not found")
+    func = entry["globals"].get(function_name)
+    if not callable(func):
+        raise ValueError(f"'{function_name}' is not a callable in namespace '{name}'")
+    args = params.get("args") or []
+    kwargs = params.get("kwargs") or {}
+    if not isinstance(args, list) or not isinstance(kwargs, dict):
+        raise ValueError("args must be a list and kwargs an object")
+
+    entry["runs"] += 1
+    entry["last_used"] = time.time()
+    response = _run_captured(lambda: func(*args, **kwargs), encoding)
+    response["namespace"] = name
+    warning = _enforce_namespace_cap(name, entry)
+    if warning:
+        response["warning"] = warning
+    return response
+
+
+@bridge_method("python_namespaces")
+def python_namespaces(params=None):
+    """List persistent namespaces with their helpers and approximate size."""
+    namespaces = []
+    base = _python_base_namespace()
+    for name, entry in sorted(PYTHON_NAMESPACES.items()):
+        user_globals = entry["globals"]
+        namespaces.append({
+            "name": name,
+            "runs": entry["runs"],
+            "created_at": entry["created_at"],
+            "last_used": entry.get("last_used"),
+            "approx_bytes": _namespace_bytes(user_globals),
+            "functions": sorted(
+                key for key, value in user_globals.items()
+                if key not in base and not key.startswith("_") and callable(value)
+            ),
+        })
+    return {
+        "namespaces": namespaces,
+        "count": len(namespaces),
+        "max_namespaces": MAX_PYTHON_NAMESPACES,
+        "max_bytes": PYTHON_NAMESPACE_MAX_BYTES,
+        "code_cache": {"size": len(CODE_CACHE), "capacity": CODE_CACHE_SIZE},
+    }
+
+
+@bridge_method("python_namespace_reset")
+def python_namespace_reset(params):
+    """Drop one persistent namespace ('namespace') or all of them (omit it)."""
+    name = params.get("namespace")
+    if name is None:
+        dropped = sorted(PYTHON_NAMESPACES)
+        PYTHON_NAMESPACES.clear()
+    else:
+        dropped = [name] if PYTHON_NAMESPACES.pop(name, None) is not None else []
+    if params.get("clear_code_cache"):
+        CODE_CACHE.clear()
+    return {"dropped": dropped, "remaining": len(PYTHON_NAMESPACES)}
+
+
+@bridge_method("viewport_snapshot", cost="heavy", envelope=True)
+def viewport_snapshot(params):
+    """
+    VISION TOOL: Capture viewport snapshot (UI-only).
+    """
+    import base64
+    import tempfile
+    import os
+
+    shading = params.get("shading", "solid")
+    projection = params.get("projection", "persp")
+    view = params.get("view", "current")  # current, front, back, left, right, top, bottom
+    width = params.get("width", 512)
+    height = params.get("height", 512)
+    return_base64 = params.get("return_base64", False)
+    filename = params.get("filename")
+
+    shading_map = {"solid": "SOLID", "wireframe": "WIREFRAME"}
+    if shading not in shading_map:
+        raise ValueError("shading must be 'solid' or 'wireframe'")
+
+    projection_map = {"persp": "PERSP", "perspective": "PERSP", "ortho": "ORTHO"}
+    if projection not in projection_map:
+        raise ValueError("projection must be 'persp' or 'ortho'")
+
+    valid_views = ["current", "front", "back", "left", "right", "top", "bottom"]
+    if view not in valid_views:
+        raise ValueError(f"view must be one of {valid_views}")
 
     try:
         width = int(width)
@@ -717,9 +2313,7 @@ def viewport_snapshot(params):
     space = area.spaces.active
     region_3d = space.region_3d
     scene = bpy.context.scene
-    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    output_dir = os.environ.get("FRIGG_OUTPUT_DIR") or os.path.join(repo_root, "output")
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = _output_dir()
 
     original_shading = space.shading.type
     original_view_perspective = region_3d.view_perspective
@@ -793,6 +2387,7 @@ def viewport_snapshot(params):
         scene.render.filepath = original_filepath
 
 
+@bridge_method("get_bounding_box")
 def get_bounding_box(params):
     """
     SPATIAL COGNITION TOOL: Get bounding box dimensions and bounds
@@ -857,6 +2452,7 @@ def get_bounding_box(params):
     }
 
 
+@bridge_method("get_spatial_relationships")
 def get_spatial_relationships(params):
     """
     SPATIAL COGNITION TOOL: Determine spatial relationships between two objects
@@ -965,6 +2561,7 @@ def get_spatial_relationships(params):
 # SPACE MARINE MODELING TOOLS (v0.5)
 # =============================================================================
 
+@bridge_method("add_modifier", mutating=True)
 def add_modifier(params):
     """Add a modifier to an object (Mirror, Subdivision, Boolean, Array, Solidify)"""
     import math
@@ -1020,6 +2617,8 @@ def add_modifier(params):
         modifier.thickness = params.get("thickness", 0.1)
         modifier.offset = params.get("offset", 0.0)
 
+    record_change("modifier", obj.name, modifier=modifier.name)
+
     return {
         "object": object_name,
         "modifier_name": modifier.name,
@@ -1028,6 +2627,7 @@ def add_modifier(params):
     }
 
 
+@bridge_method("apply_modifier", mutating=True, cost="heavy")
 def apply_modifier(params):
     """Apply (bake) a modifier to make it permanent"""
     object_name = params.get("object_name") or params.get("name")
@@ -1045,10 +2645,13 @@ def apply_modifier(params):
     modifier = obj.modifiers.get(modifier_name)
     if not modifier:
         raise ValueError(f"Modifier '{modifier_name}' not found on '{object_name}'")
+    _require_no_mesh_session(obj)
 
     # Apply modifier
     bpy.context.view_layer.objects.active = obj
     bpy.ops.object.modifier_apply(modifier=modifier_name)
+    record_change("modifier", obj.name, applied=[modifier_name])
+    record_change("geometry", obj.name)
 
     return {
         "object": object_name,
@@ -1057,6 +2660,7 @@ def apply_modifier(params):
     }
 
 
+@bridge_method("list_modifiers")
 def list_modifiers(params):
     """List all modifiers on an object"""
     object_name = params.get("object_name") or params.get("name")
@@ -1100,6 +2704,7 @@ def list_modifiers(params):
     }
 
 
+@bridge_method("boolean_operation", mutating=True, cost="heavy")
 def boolean_operation(params):
     """Perform boolean operation between two objects"""
     base_name = params.get("base_object") or params.get("object_name")
@@ -1120,6 +2725,8 @@ def boolean_operation(params):
         raise ValueError(f"Base object '{base_name}' not found")
     if not target_obj:
         raise ValueError(f"Target object '{target_name}' not found")
+    if apply_immediately:
+        _require_no_mesh_session(base_obj)
 
     # Add boolean modifier
     modifier = base_obj.modifiers.new(name=f"Boolean_{target_name}", type="BOOLEAN")
@@ -1145,9 +2752,13 @@ def boolean_operation(params):
         target_obj.hide_set(True)
         result["target_hidden"] = True
 
+    record_change("modifier", base_obj.name, modifier=result["modifier_name"])
+    if apply_immediately:
+        record_change("geometry", base_obj.name)
     return result
 
 
+@bridge_method("create_material", mutating=True)
 def create_material(params):
     """Create a new PBR material with Principled BSDF"""
     mat_name = params.get("name") or params.get("material_name")
@@ -1190,6 +2801,8 @@ def create_material(params):
     roughness = params.get("roughness", 0.5)
     bsdf.inputs['Roughness'].default_value = roughness
 
+    record_change("material", None, material=mat.name)
+
     return {
         "material_name": mat_name,
         "base_color": base_color,
@@ -1199,6 +2812,7 @@ def create_material(params):
     }
 
 
+@bridge_method("assign_material", mutating=True)
 def assign_material(params):
     """Assign a material to an object"""
     object_name = params.get("object_name") or params.get("name")
@@ -1227,6 +2841,8 @@ def assign_material(params):
         else:
             obj.data.materials[slot_index] = mat
 
+    record_change("material", obj.name, material=mat.name)
+
     return {
         "object": object_name,
         "material": material_name,
@@ -1235,6 +2851,7 @@ def assign_material(params):
     }
 
 
+@bridge_method("create_collection", mutating=True)
 def create_collection(params):
     """Create a new collection for organizing objects"""
     collection_name = params.get("name") or params.get("collection_name")
@@ -1268,6 +2885,7 @@ def create_collection(params):
     }
 
 
+@bridge_method("move_to_collection", mutating=True)
 def move_to_collection(params):
     """Move an object to a collection"""
     object_name = params.get("object_name") or params.get("name")
@@ -1297,6 +2915,8 @@ def move_to_collection(params):
     # Link to new collection
     collection.objects.link(obj)
 
+    record_change("collection", obj.name, collection=collection.name)
+
     return {
         "object": object_name,
         "new_collection": collection_name,
@@ -1309,6 +2929,7 @@ def move_to_collection(params):
 # MESH EDITING TOOLS
 # =============================================================================
 
+@bridge_method("join_objects", mutating=True, cost="heavy")
 def join_objects(params):
     """Join multiple mesh objects into one."""
     import bmesh
@@ -1329,6 +2950,7 @@ def join_objects(params):
                 raise ValueError(f"Object '{name}' not found.")
             if obj.type != "MESH":
                 raise ValueError(f"Object '{name}' is not a mesh.")
+            _require_no_mesh_session(obj)
             objects.append(obj)
 
         bpy.ops.object.mode_set(mode="OBJECT")
@@ -1336,6 +2958,8 @@ def join_objects(params):
         for obj in objects:
             obj.select_set(True)
         bpy.context.view_layer.objects.active = objects[0]
+        merged = [(obj.name, obj.as_pointer()) for obj in objects[1:]]
+        joined_name = objects[0].name
         bpy.ops.object.join()
 
         result_obj = bpy.context.view_layer.objects.active
@@ -1345,6 +2969,12 @@ def join_objects(params):
         if result_name:
             result_obj.name = result_name
 
+        for name, pointer in merged:
+            record_change("removed", name, pointer=pointer)
+        if result_obj.name != joined_name:
+            record_change("renamed", result_obj.name, old_name=joined_name)
+        record_change("geometry", result_obj.name)
+
         mesh = result_obj.data
         return {
             "result_object": result_obj.name,
@@ -1360,199 +2990,367 @@ def join_objects(params):
             pass
 
 
-def extrude_faces(params):
-    """Extrude faces on a mesh object."""
-    import bmesh
+# The handlers below run bmesh.ops on the object-mode mesh (from_mesh /
+# to_mesh) instead of toggling edit mode and calling bpy.ops.mesh, which
+# rebuilds edit-mesh data on every toggle. Each op is a _bm_* function of
+# (bm, params) so it can also run against an open mesh edit session.
 
+def _require_mesh_object(params):
+    object_name = params.get("object_name")
+    if not object_name:
+        raise ValueError("object_name is required.")
+    obj = bpy.data.objects.get(object_name)
+    if not obj:
+        raise ValueError(f"Object '{object_name}' not found.")
+    if obj.type != "MESH":
+        raise ValueError(f"Object '{object_name}' is not a mesh.")
+    return obj
+
+
+def _select_elements(elements, indices, label, allow_all=True):
+    """Resolve an index list (or None / "all") to bmesh elements, ignoring out-of-range indices."""
+    elements.ensure_lookup_table()
+    if indices is None or (allow_all and indices == "all"):
+        return list(elements)
+    if not isinstance(indices, list):
+        suffix = " or 'all'" if allow_all else ""
+        raise ValueError(f"{label} must be a list of integers{suffix}.")
     try:
-        object_name = params.get("object_name")
-        face_indices = params.get("face_indices")
-        offset = params.get("offset", 0.5)
-        direction = params.get("direction")
+        wanted = sorted({int(i) for i in indices})
+    except (TypeError, ValueError):
+        raise ValueError(f"{label} must be a list of integers.")
+    count = len(elements)
+    return [elements[i] for i in wanted if 0 <= i < count]
 
-        if not object_name:
-            raise ValueError("object_name is required.")
-        obj = bpy.data.objects.get(object_name)
-        if not obj:
-            raise ValueError(f"Object '{object_name}' not found.")
-        if obj.type != "MESH":
-            raise ValueError(f"Object '{object_name}' is not a mesh.")
 
-        if direction is not None:
-            if (
-                not isinstance(direction, (list, tuple))
-                or len(direction) != 3
-                or not all(isinstance(v, (int, float)) for v in direction)
-            ):
-                raise ValueError("direction must be [x, y, z] if provided.")
+def _resolve_objects(params, obj_type="MESH"):
+    """
+    Objects a multi-object handler works on, or None for a single object_name call.
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+    Parameters:
+        object_names: Explicit list (unknown names are reported per object)
+        collection: Objects in this collection, including child collections
+        type: Object type filter for collection selections (default: MESH)
 
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="DESELECT")
+    Returns:
+        list of (name, object or None) in request / scene order
+    """
+    names = params.get("object_names")
+    collection = params.get("collection")
+    if names is None and not collection:
+        return None
+    if names is not None:
+        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+            raise ValueError("object_names must be a list of strings.")
+        return [(name, bpy.data.objects.get(name)) for name in names]
+    indices = _filtered_object_indices({"collection": collection, "type": params.get("type", obj_type)})
+    return [(bpy.data.objects[index].name, bpy.data.objects[index]) for index in indices]
+
+
+def _for_each_mesh(params, run):
+    """Apply run(obj) to every resolved mesh object, collecting a per-object summary."""
+    results = []
+    for name, obj in _resolve_objects(params):
+        try:
+            if obj is None:
+                raise ValueError(f"Object '{name}' not found.")
+            if obj.type != "MESH":
+                raise ValueError(f"Object '{name}' is not a mesh.")
+            results.append(dict(run(obj), ok=True))
+        except Exception as exc:
+            results.append({"object": name, "ok": False, "error": str(exc)})
+    succeeded = sum(1 for result in results if result["ok"])
+    return {
+        "objects": results,
+        "count": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+    }
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
 
-        if face_indices is None or face_indices == "all":
-            for face in bm.faces:
-                face.select = True
-            selected_faces = [face.index for face in bm.faces]
-        elif isinstance(face_indices, list):
-            try:
-                indices = {int(i) for i in face_indices}
-            except (TypeError, ValueError):
-                raise ValueError("face_indices must be a list of integers.")
-            selected_faces = []
-            for face in bm.faces:
-                face.select = face.index in indices
-                if face.select:
-                    selected_faces.append(face.index)
-        else:
-            raise ValueError("face_indices must be a list of integers or 'all'.")
+def _edit_meshes(params, op):
+    """Single-object call keeps its old result shape; lists and collections get a summary."""
+    if _resolve_objects(params) is None:
+        return _edit_mesh(_require_mesh_object(params), op, params)
+    return _for_each_mesh(params, lambda obj: _edit_mesh(obj, op, params))
 
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
-        if not selected_faces:
-            raise ValueError("No faces selected for extrusion.")
+def _bm_extrude(bm, params):
+    import bmesh
+    import mathutils
 
-        # Extrude the selected faces
-        bpy.ops.mesh.extrude_region()
+    offset = float(params.get("offset", 0.5))
+    direction = params.get("direction")
+    if direction is not None:
+        if (
+            not isinstance(direction, (list, tuple))
+            or len(direction) != 3
+            or not all(isinstance(v, (int, float)) for v in direction)
+        ):
+            raise ValueError("direction must be [x, y, z] if provided.")
+
+    faces = _select_elements(bm.faces, params.get("face_indices"), "face_indices")
+    if not faces:
+        raise ValueError("No faces selected for extrusion.")
+    selected_faces = [face.index for face in faces]
+
+    ret = bmesh.ops.extrude_face_region(bm, geom=faces)
+    new_verts = [elem for elem in ret["geom"] if isinstance(elem, bmesh.types.BMVert)]
+
+    if direction is not None:
+        bmesh.ops.translate(bm, verts=new_verts, vec=mathutils.Vector(direction) * offset)
+    else:
+        # Shrink/fatten: move each vertex along the normal of the extruded
+        # faces around it (side faces also touch old vertices, so skip them).
+        new_set = set(new_verts)
+        top_faces = [
+            elem for elem in ret["geom"]
+            if isinstance(elem, bmesh.types.BMFace) and all(v in new_set for v in elem.verts)
+        ]
+        for face in top_faces:
+            face.normal_update()
+        top_set = set(top_faces)
+        for vert in new_verts:
+            normal = mathutils.Vector()
+            for face in vert.link_faces:
+                if face in top_set:
+                    normal += face.normal
+            if normal.length > 0.0:
+                vert.co += normal.normalized() * offset
 
-        # Then move them
-        if direction is None:
-            # Shrink/fatten along normals
-            bpy.ops.transform.shrink_fatten(value=float(offset))
-        else:
-            # Translate in specific direction
-            translation = tuple(float(direction[i]) * float(offset) for i in range(3))
-            bpy.ops.transform.translate(value=translation)
+    return {"extruded_faces": selected_faces, "new_vertex_count": len(bm.verts)}
 
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
-        return {
-            "object": obj.name,
-            "extruded_faces": selected_faces,
-            "new_vertex_count": len(obj.data.vertices),
+def _bm_inset(bm, params):
+    import bmesh
+
+    faces = _select_elements(bm.faces, params.get("face_indices"), "face_indices", allow_all=False)
+    if not faces:
+        raise ValueError("No faces selected for inset.")
+    selected_faces = [face.index for face in faces]
+    bmesh.ops.inset_region(
+        bm,
+        faces=faces,
+        thickness=float(params.get("thickness", 0.1)),
+        depth=float(params.get("depth", 0.0)),
+    )
+    return {"inset_faces": selected_faces, "new_face_count": len(bm.faces)}
+
+
+def _bm_merge(bm, params):
+    import bmesh
+
+    distance = params.get("distance", 0.0001)
+    if distance is None or float(distance) < 0:
+        raise ValueError("distance must be a non-negative number.")
+    vertices_before = len(bm.verts)
+    bmesh.ops.remove_doubles(bm, verts=list(bm.verts), dist=float(distance))
+    vertices_after = len(bm.verts)
+    return {
+        "vertices_before": vertices_before,
+        "vertices_after": vertices_after,
+        "removed_count": max(0, vertices_before - vertices_after),
+    }
+
+
+def _bm_bevel(bm, params):
+    import bmesh
+
+    edges = _select_elements(bm.edges, params.get("edge_indices"), "edge_indices")
+    selected_edges = [edge.index for edge in edges]
+    if edges:
+        options = {
+            "geom": edges,
+            "offset": float(params.get("width", 0.1)),
+            "offset_type": "OFFSET",
+            "segments": int(params.get("segments", 2)),
+            "profile": float(params.get("profile", 0.5)),
         }
-    finally:
         try:
-            if bpy.context.object and bpy.context.object.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-        except Exception:
-            pass
+            bmesh.ops.bevel(bm, affect="EDGES", **options)
+        except TypeError:
+            # Blender < 2.90 names the option vertex_only.
+            bmesh.ops.bevel(bm, vertex_only=False, **options)
+    return {"beveled_edges": selected_edges, "new_vertex_count": len(bm.verts)}
 
 
-def inset_faces(params):
-    """Inset faces on a mesh object."""
+def _bm_subdivide(bm, params):
     import bmesh
 
-    try:
-        object_name = params.get("object_name")
-        face_indices = params.get("face_indices")
-        thickness = params.get("thickness", 0.1)
-        depth = params.get("depth", 0.0)
-
-        if not object_name:
-            raise ValueError("object_name is required.")
-        obj = bpy.data.objects.get(object_name)
-        if not obj:
-            raise ValueError(f"Object '{object_name}' not found.")
-        if obj.type != "MESH":
-            raise ValueError(f"Object '{object_name}' is not a mesh.")
+    faces = _select_elements(bm.faces, params.get("face_indices"), "face_indices", allow_all=False)
+    selected_faces = [face.index for face in faces]
+    edges = list({edge for face in faces for edge in face.edges})
+    if edges:
+        bmesh.ops.subdivide_edges(
+            bm,
+            edges=edges,
+            cuts=int(params.get("cuts", 1)),
+            smooth=float(params.get("smooth", 0.0)),
+            use_grid_fill=True,
+        )
+    return {
+        "subdivided_faces": selected_faces,
+        "new_vertex_count": len(bm.verts),
+        "new_face_count": len(bm.faces),
+    }
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
 
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="DESELECT")
+def _bm_recalc_normals(bm, params):
+    import bmesh
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
+    faces = list(bm.faces)
+    bmesh.ops.recalc_face_normals(bm, faces=faces)
+    if params.get("inside", False):
+        bmesh.ops.reverse_faces(bm, faces=faces)
+    return {"status": "recalculated", "face_count": len(bm.faces)}
 
-        if face_indices is None:
-            for face in bm.faces:
-                face.select = True
-            selected_faces = [face.index for face in bm.faces]
-        elif isinstance(face_indices, list):
-            try:
-                indices = {int(i) for i in face_indices}
-            except (TypeError, ValueError):
-                raise ValueError("face_indices must be a list of integers.")
-            selected_faces = []
-            for face in bm.faces:
-                face.select = face.index in indices
-                if face.select:
-                    selected_faces.append(face.index)
-        else:
-            raise ValueError("face_indices must be a list of integers.")
 
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+# op name -> bmesh implementation, shared by the handlers and edit sessions
+BMESH_OPS = {
+    "extrude_faces": _bm_extrude,
+    "inset_faces": _bm_inset,
+    "merge_vertices": _bm_merge,
+    "bevel_edges": _bm_bevel,
+    "subdivide_mesh": _bm_subdivide,
+    "recalculate_normals": _bm_recalc_normals,
+}
 
-        if not selected_faces:
-            raise ValueError("No faces selected for inset.")
 
-        bpy.ops.mesh.inset(thickness=float(thickness), depth=float(depth))
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+def _edit_mesh(obj, op, params):
+    """Run a _bm_* op on an object's mesh and write the result back."""
+    import bmesh
 
-        return {
-            "object": obj.name,
-            "inset_faces": selected_faces,
-            "new_face_count": len(obj.data.polygons),
-        }
-    finally:
+    _require_no_mesh_session(obj)
+    mesh = obj.data
+    if obj.mode == "EDIT":
+        # The object-mode mesh is stale while in edit mode; work on the edit mesh.
+        bm = bmesh.from_edit_mesh(mesh)
+        result = op(bm, params)
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=True)
+    else:
+        bm = bmesh.new()
         try:
-            if bpy.context.object and bpy.context.object.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-        except Exception:
-            pass
+            bm.from_mesh(mesh)
+            result = op(bm, params)
+            bm.to_mesh(mesh)
+        finally:
+            bm.free()
+        mesh.update()
+    record_change("geometry", obj.name)
+    return dict({"object": obj.name}, **result)
+
+
+@bridge_method("extrude_faces", mutating=True, cost="heavy")
+def extrude_faces(params):
+    """Extrude faces on a mesh object."""
+    return _edit_mesh(_require_mesh_object(params), _bm_extrude, params)
+
+
+@bridge_method("inset_faces", mutating=True, cost="heavy")
+def inset_faces(params):
+    """Inset faces on a mesh object."""
+    return _edit_mesh(_require_mesh_object(params), _bm_inset, params)
 
 
+@bridge_method("merge_vertices", mutating=True, cost="heavy")
 def merge_vertices(params):
     """Merge vertices by distance (remove doubles)."""
-    import bmesh
+    return _edit_meshes(params, _bm_merge)
+
+
+@bridge_method("bevel_edges", mutating=True, cost="heavy")
+def bevel_edges(params):
+    """Bevel edges on a mesh object."""
+    return _edit_mesh(_require_mesh_object(params), _bm_bevel, params)
+
+
+@bridge_method("subdivide_mesh", mutating=True, cost="heavy")
+def subdivide_mesh(params):
+    """Subdivide mesh faces."""
+    return _edit_meshes(params, _bm_subdivide)
+
+
+@bridge_method("recalculate_normals", mutating=True, cost="heavy")
+def recalculate_normals(params):
+    """Recalculate face normals (fix inside-out faces)."""
+    return _edit_meshes(params, _bm_recalc_normals)
+
+
+def _shade_mesh(obj, smooth, auto_smooth, angle):
+    if obj.mode == "EDIT":
+        raise ValueError(f"Object '{obj.name}' is in edit mode.")
+    _require_no_mesh_session(obj)
+    # Data-level equivalent of bpy.ops.object.shade_smooth/flat: no selection
+    # or active-object changes, so it scales to many objects in one pass.
+    mesh = obj.data
+    mesh.polygons.foreach_set("use_smooth", [bool(smooth)] * len(mesh.polygons))
+    mesh.update()
+
+    if auto_smooth:
+        mesh.use_auto_smooth = True
+        mesh.auto_smooth_angle = float(angle) * 3.14159 / 180.0
 
+    record_change("geometry", obj.name)
+
+    return {
+        "object": obj.name,
+        "shading": "smooth" if smooth else "flat",
+        "auto_smooth": auto_smooth,
+    }
+
+
+@bridge_method("shade_smooth", mutating=True, cost="medium")
+def shade_smooth(params):
+    """Set smooth or flat shading on a mesh object (or object_names / collection)."""
+    smooth = params.get("smooth", True)
+    auto_smooth = params.get("auto_smooth", False)
+    angle = params.get("angle", 30.0)
+
+    if _resolve_objects(params) is not None:
+        return _for_each_mesh(params, lambda obj: _shade_mesh(obj, smooth, auto_smooth, angle))
+
+    obj = _require_mesh_object(params)
+    if bpy.context.object and bpy.context.object.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    return _shade_mesh(obj, smooth, auto_smooth, angle)
+
+
+@bridge_method("apply_all_modifiers", mutating=True, cost="heavy")
+def apply_all_modifiers(params):
+    """Apply all modifiers on an object."""
     try:
         object_name = params.get("object_name")
-        distance = params.get("distance", 0.0001)
+        modifier_types = params.get("types")
 
         if not object_name:
             raise ValueError("object_name is required.")
         obj = bpy.data.objects.get(object_name)
         if not obj:
             raise ValueError(f"Object '{object_name}' not found.")
-        if obj.type != "MESH":
-            raise ValueError(f"Object '{object_name}' is not a mesh.")
-        if distance is None or float(distance) < 0:
-            raise ValueError("distance must be a non-negative number.")
+        _require_no_mesh_session(obj)
 
         bpy.ops.object.mode_set(mode="OBJECT")
         bpy.ops.object.select_all(action="DESELECT")
         obj.select_set(True)
         bpy.context.view_layer.objects.active = obj
 
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
-
-        bm = bmesh.from_edit_mesh(obj.data)
-        vertices_before = len(bm.verts)
-
-        bpy.ops.mesh.remove_doubles(threshold=float(distance))
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+        applied = []
+        for modifier in list(obj.modifiers):
+            if modifier_types is None or modifier.type in modifier_types:
+                try:
+                    bpy.ops.object.modifier_apply(modifier=modifier.name)
+                    applied.append(modifier.name)
+                except Exception as e:
+                    pass
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        vertices_after = len(bm.verts)
+        if applied:
+            record_change("modifier", obj.name, applied=applied)
+            record_change("geometry", obj.name)
 
         return {
             "object": obj.name,
-            "vertices_before": vertices_before,
-            "vertices_after": vertices_after,
-            "removed_count": max(0, vertices_before - vertices_after),
+            "applied_modifiers": applied,
+            "count": len(applied),
         }
     finally:
         try:
@@ -1562,16 +3360,17 @@ def merge_vertices(params):
             pass
 
 
-def bevel_edges(params):
-    """Bevel edges on a mesh object."""
+@bridge_method("select_faces_by_angle", mutating=True, cost="medium")
+def select_faces_by_angle(params):
+    """Select faces by their normal direction."""
     import bmesh
+    import math
 
     try:
         object_name = params.get("object_name")
-        edge_indices = params.get("edge_indices")
-        width = params.get("width", 0.1)
-        segments = params.get("segments", 2)
-        profile = params.get("profile", 0.5)
+        direction = params.get("direction", [0, 0, 1])
+        threshold = params.get("threshold", 10.0)
+        extend = params.get("extend", False)
 
         if not object_name:
             raise ValueError("object_name is required.")
@@ -1580,42 +3379,36 @@ def bevel_edges(params):
             raise ValueError(f"Object '{object_name}' not found.")
         if obj.type != "MESH":
             raise ValueError(f"Object '{object_name}' is not a mesh.")
+        _require_no_mesh_session(obj)
 
         bpy.ops.object.mode_set(mode="OBJECT")
         bpy.ops.object.select_all(action="DESELECT")
         obj.select_set(True)
         bpy.context.view_layer.objects.active = obj
         bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="DESELECT")
+        if not extend:
+            bpy.ops.mesh.select_all(action="DESELECT")
 
         bm = bmesh.from_edit_mesh(obj.data)
-        bm.edges.ensure_lookup_table()
-
-        if edge_indices is None or edge_indices == "all":
-            for edge in bm.edges:
-                edge.select = True
-            selected_edges = [edge.index for edge in bm.edges]
-        elif isinstance(edge_indices, list):
-            try:
-                indices = {int(i) for i in edge_indices}
-            except (TypeError, ValueError):
-                raise ValueError("edge_indices must be a list of integers.")
-            selected_edges = []
-            for edge in bm.edges:
-                edge.select = edge.index in indices
-                if edge.select:
-                    selected_edges.append(edge.index)
+        bm.faces.ensure_lookup_table()
 
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+        import mathutils
+        target = mathutils.Vector(direction).normalized()
+        threshold_rad = math.radians(float(threshold))
 
-        bpy.ops.mesh.bevel(offset=float(width), segments=int(segments), profile=float(profile))
+        selected = []
+        for face in bm.faces:
+            angle = face.normal.angle(target)
+            if angle < threshold_rad:
+                face.select = True
+                selected.append(face.index)
 
         bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
         return {
             "object": obj.name,
-            "beveled_edges": selected_edges,
-            "new_vertex_count": len(obj.data.vertices),
+            "selected_faces": selected,
+            "count": len(selected),
         }
     finally:
         try:
@@ -1625,397 +3418,2164 @@ def bevel_edges(params):
             pass
 
 
-def subdivide_mesh(params):
-    """Subdivide mesh faces."""
-    import bmesh
+# =============================================================================
+# MESH EDIT SESSIONS
+# =============================================================================
 
-    try:
-        object_name = params.get("object_name")
-        cuts = params.get("cuts", 1)
-        smooth = params.get("smooth", 0.0)
-        face_indices = params.get("face_indices")
+# Open sessions keep one bmesh per object across bridge calls, so a run of
+# mesh ops pays for from_mesh/to_mesh once instead of once per op.
+MESH_SESSIONS = {}
+MAX_MESH_SESSIONS = 8
+MESH_SESSION_TTL_S = 600.0
+_MESH_SESSION_IDS = itertools.count(1)
 
-        if not object_name:
-            raise ValueError("object_name is required.")
-        obj = bpy.data.objects.get(object_name)
-        if not obj:
-            raise ValueError(f"Object '{object_name}' not found.")
-        if obj.type != "MESH":
-            raise ValueError(f"Object '{object_name}' is not a mesh.")
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="DESELECT")
+def _bm_select_faces_by_angle(bm, params):
+    import math
+    import mathutils
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
+    bm.normal_update()
+    direction = params.get("direction", [0, 0, 1])
+    threshold = math.radians(float(params.get("threshold", 10.0)))
+    target = mathutils.Vector(direction).normalized()
+    if not params.get("extend", False):
+        for face in bm.faces:
+            face.select = False
+    selected = []
+    for face in bm.faces:
+        if face.normal.length > 0.0 and face.normal.angle(target) < threshold:
+            face.select = True
+            selected.append(face.index)
+    return {"selected_faces": selected, "count": len(selected)}
 
-        if face_indices is None:
-            for face in bm.faces:
-                face.select = True
-            selected_faces = [face.index for face in bm.faces]
-        elif isinstance(face_indices, list):
+
+# Ops only available inside a session; selection has no effect on one-shot edits.
+SESSION_OPS = dict(BMESH_OPS, select_faces_by_angle=_bm_select_faces_by_angle)
+
+
+def _session_for_object(obj):
+    pointer = obj.as_pointer()
+    for session_id, session in MESH_SESSIONS.items():
+        if session["pointer"] == pointer:
+            return session_id
+    return None
+
+
+def _require_no_mesh_session(obj):
+    """Refuse a one-shot mesh change that a later session commit would overwrite."""
+    session_id = _session_for_object(obj) if MESH_SESSIONS else None
+    if session_id is not None:
+        raise ValueError(f"Object '{obj.name}' has open mesh session {session_id}; commit or discard it first.")
+
+
+def _close_mesh_session(session_id):
+    session = MESH_SESSIONS.pop(session_id, None)
+    if session is not None:
+        session["bm"].free()
+    return session
+
+
+def _expire_mesh_sessions():
+    now = time.time()
+    for session_id, session in list(MESH_SESSIONS.items()):
+        if now - session["last_used"] > MESH_SESSION_TTL_S:
+            log(f"Mesh session {session_id} on '{session['object']}' expired")
+            _close_mesh_session(session_id)
+
+
+def _get_mesh_session(params):
+    session_id = params.get("session")
+    session = MESH_SESSIONS.get(session_id)
+    if session is None:
+        raise ValueError(f"Mesh session '{session_id}' not found")
+    obj = bpy.data.objects.get(session["object"])
+    if obj is None or obj.as_pointer() != session["pointer"] or obj.data.as_pointer() != session["mesh_pointer"]:
+        _close_mesh_session(session_id)
+        raise ValueError(f"Object of mesh session '{session_id}' was deleted, renamed or re-meshed; session closed")
+    session["last_used"] = time.time()
+    return session_id, session, obj
+
+
+def _session_info(session_id, session):
+    bm = session["bm"]
+    return {
+        "session": session_id,
+        "object": session["object"],
+        "ops": session["ops"],
+        "vertex_count": len(bm.verts),
+        "face_count": len(bm.faces),
+        "opened_at": session["opened_at"],
+    }
+
+
+@bridge_method("mesh_session_open", mutating=True, cost="medium")
+def mesh_session_open(params):
+    """
+    Open a mesh edit session on a mesh object.
+
+    Parameters:
+        object_name: Mesh object to edit (must be in object mode)
+
+    Returns:
+        session id plus vertex/face counts; edits stay in memory until commit
+    """
+    import bmesh
+
+    _expire_mesh_sessions()
+    obj = _require_mesh_object(params)
+    if obj.mode == "EDIT":
+        raise ValueError(f"Object '{obj.name}' is in edit mode; leave edit mode before opening a session.")
+    existing = _session_for_object(obj)
+    if existing is not None:
+        raise ValueError(f"Object '{obj.name}' already has open mesh session {existing}")
+    if len(MESH_SESSIONS) >= MAX_MESH_SESSIONS:
+        raise ValueError(f"Too many open mesh sessions (max {MAX_MESH_SESSIONS})")
+
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    now = time.time()
+    session_id = next(_MESH_SESSION_IDS)
+    MESH_SESSIONS[session_id] = {
+        "object": obj.name,
+        "pointer": obj.as_pointer(),
+        "mesh_pointer": obj.data.as_pointer(),
+        "bm": bm,
+        "ops": 0,
+        "opened_at": now,
+        "last_used": now,
+    }
+    return _session_info(session_id, MESH_SESSIONS[session_id])
+
+
+@bridge_method("mesh_session_apply", mutating=True, cost="heavy")
+def mesh_session_apply(params):
+    """
+    Run mesh ops against an open session's in-memory mesh.
+
+    Parameters:
+        session: Session id
+        operations: [{"op": name, "params": {...}}, ...] applied in order;
+            op is one of SESSION_OPS (the one-shot mesh handlers plus
+            select_faces_by_angle). face_indices may be "selected".
+
+    Returns:
+        per-op results; stops at the first failing op (earlier ops stay applied)
+    """
+    session_id, session, _obj = _get_mesh_session(params)
+    operations = params.get("operations")
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("operations must be a non-empty list")
+
+    bm = session["bm"]
+    results = []
+    failed = None
+    for index, operation in enumerate(operations):
+        op_name = operation.get("op") if isinstance(operation, dict) else None
+        op = SESSION_OPS.get(op_name)
+        try:
+            if op is None:
+                raise ValueError(f"Unknown mesh op: {op_name}. Valid: {sorted(SESSION_OPS)}")
+            op_params = dict(operation.get("params") or {})
+            if op_params.get("face_indices") == "selected":
+                op_params["face_indices"] = [face.index for face in bm.faces if face.select]
+            result = op(bm, op_params)
+            # Keep indices contiguous so the next op (and the client) can address elements.
+            bm.verts.index_update()
+            bm.edges.index_update()
+            bm.faces.index_update()
+            session["ops"] += 1
+            results.append({"op": op_name, "ok": True, "result": result})
+        except Exception as exc:
+            results.append({"op": op_name, "ok": False, "error": str(exc)})
+            failed = index
+            break
+
+    return dict(_session_info(session_id, session), success=failed is None, failed_step=failed, results=results)
+
+
+@bridge_method("mesh_session_commit", mutating=True, cost="medium")
+def mesh_session_commit(params):
+    """
+    Write an open session's mesh back to its object.
+
+    Parameters:
+        session: Session id
+        keep_open: Keep the session open for more edits (default: false)
+    """
+    session_id, session, obj = _get_mesh_session(params)
+    session["bm"].to_mesh(obj.data)
+    obj.data.update()
+    record_change("geometry", obj.name)
+    info = _session_info(session_id, session)
+    if not params.get("keep_open", False):
+        _close_mesh_session(session_id)
+    info["closed"] = session_id not in MESH_SESSIONS
+    return info
+
+
+@bridge_method("mesh_session_discard", mutating=True)
+def mesh_session_discard(params):
+    """Close a session without writing its edits back."""
+    session_id = params.get("session")
+    session = _close_mesh_session(session_id)
+    if session is None:
+        raise ValueError(f"Mesh session '{session_id}' not found")
+    return {"session": session_id, "object": session["object"], "discarded_ops": session["ops"]}
+
+
+@bridge_method("mesh_sessions")
+def mesh_sessions(params=None):
+    _expire_mesh_sessions()
+    sessions = [_session_info(session_id, session) for session_id, session in sorted(MESH_SESSIONS.items())]
+    return {"sessions": sessions, "count": len(sessions), "max_sessions": MAX_MESH_SESSIONS}
+
+
+# =============================================================================
+# SCENE SNAPSHOTS AND BATCHES
+# =============================================================================
+
+# Request params that name the objects a mutating handler works on.
+OBJECT_PARAM_KEYS = ("name", "object_name", "base_object", "target_object", "child", "child_name")
+OBJECT_LIST_PARAM_KEYS = ("object_names", "names")
+# Params holding a list of {"name": ...} records (set_transforms_bulk).
+OBJECT_RECORD_PARAM_KEYS = ("records",)
+
+
+def _id_alive(datablock) -> bool:
+    if datablock is None:
+        return False
+    try:
+        datablock.name
+    except ReferenceError:
+        return False
+    return True
+
+
+def _rna_values(struct):
+    """Writable RNA property values of a struct (used to rebuild modifiers)."""
+    values = {}
+    for prop in struct.bl_rna.properties:
+        ident = prop.identifier
+        if prop.is_readonly or prop.type == "COLLECTION" or ident in ("rna_type", "name"):
+            continue
+        try:
+            value = getattr(struct, ident)
+        except AttributeError:
+            continue
+        if prop.type != "POINTER" and hasattr(value, "__len__") and not isinstance(value, str):
+            value = tuple(value)
+        values[ident] = value
+    return values
+
+
+def _apply_rna_values(struct, values) -> None:
+    for ident, value in values.items():
+        try:
+            setattr(struct, ident, value)
+        except (AttributeError, TypeError, ValueError, ReferenceError):
+            pass
+
+
+class SceneSnapshot:
+    """
+    Restorable scene state captured incrementally.
+
+    Creating a snapshot only records which datablocks exist. Object state
+    (transform, parent, collections, modifiers, material slots and a copy of
+    its mesh geometry) is captured the first time the object is touched, so
+    the cost is proportional to what is about to change, not to scene size.
+
+    Restoring removes objects, materials, collections and meshes created since
+    the snapshot and puts touched objects back, recreating deleted ones.
+    Edits made to pre-existing materials or through execute_python on
+    untouched objects are not tracked.
+    """
+
+    def __init__(self):
+        start = time.perf_counter()
+        self.object_names = set(bpy.data.objects.keys())
+        self.object_pointers = {obj.as_pointer() for obj in bpy.data.objects}
+        self.material_names = set(bpy.data.materials.keys())
+        self.collection_names = set(bpy.data.collections.keys())
+        self.mesh_names = set(bpy.data.meshes.keys())
+        self.records = {}
+        self.capture_s = time.perf_counter() - start
+
+    def touch(self, obj) -> None:
+        if obj is None or obj.name in self.records:
+            return
+        if obj.name not in self.object_names and obj.as_pointer() not in self.object_pointers:
+            return  # created after the snapshot, restore removes it
+        start = time.perf_counter()
+        data = obj.data
+        geometry = None
+        materials = None
+        if data is not None and isinstance(data, bpy.types.Mesh):
+            geometry = data.copy()
+            geometry.name = f"frigg_undo.{data.name}"
+            materials = [mat.name if mat else None for mat in data.materials]
+        self.records[obj.name] = {
+            "object": obj,
+            "name": obj.name,
+            "type": obj.type,
+            "data": data,
+            "data_name": data.name if data is not None else None,
+            "geometry": geometry,
+            "materials": materials,
+            "matrix_basis": obj.matrix_basis.copy(),
+            "rotation_mode": obj.rotation_mode,
+            "parent": obj.parent.name if obj.parent else None,
+            "matrix_parent_inverse": obj.matrix_parent_inverse.copy(),
+            "collections": [col.name for col in obj.users_collection],
+            "hidden": obj.hide_get(),
+            "modifiers": [(mod.name, mod.type, _rna_values(mod)) for mod in obj.modifiers],
+        }
+        self.capture_s += time.perf_counter() - start
+
+    def touch_params(self, params) -> bool:
+        """Touch the objects a request names; False if it names none."""
+        if not isinstance(params, dict):
+            return False
+        names = [params.get(key) for key in OBJECT_PARAM_KEYS]
+        for key in OBJECT_LIST_PARAM_KEYS:
+            value = params.get(key)
+            if isinstance(value, (list, tuple)):
+                names.extend(value)
+        for key in OBJECT_RECORD_PARAM_KEYS:
+            value = params.get(key)
+            if isinstance(value, (list, tuple)):
+                names.extend(record.get("name") for record in value if isinstance(record, dict))
+        session = MESH_SESSIONS.get(params.get("session"))
+        if session is not None:
+            names.append(session["object"])
+        names = [name for name in names if isinstance(name, str)]
+        for name in names:
+            self.touch(bpy.data.objects.get(name))
+        collection = bpy.data.collections.get(params["collection"]) if isinstance(params.get("collection"), str) else None
+        if collection is not None:
+            # Multi-object handlers also accept a collection selection.
+            for obj in collection.all_objects:
+                self.touch(obj)
+        return bool(names) or collection is not None
+
+    def _is_new_object(self, obj, restored) -> bool:
+        if obj.as_pointer() in restored:
+            return False
+        return obj.name not in self.object_names and obj.as_pointer() not in self.object_pointers
+
+    def restore(self) -> dict:
+        start = time.perf_counter()
+        live = {}
+        for name, record in self.records.items():
+            obj = record["object"]
+            if not _id_alive(obj):
+                # A later restore may have recreated the object under its name.
+                obj = bpy.data.objects.get(name)
+                if obj is not None and obj.type != record["type"]:
+                    obj = None
+            live[name] = obj
+        restored = {obj.as_pointer() for obj in live.values() if obj is not None}
+
+        removed = []
+        for obj in list(bpy.data.objects):
+            if self._is_new_object(obj, restored):
+                removed.append(obj.name)
+                bpy.data.objects.remove(obj, do_unlink=True)
+
+        # Free the names of touched objects before renaming them back.
+        for name, obj in live.items():
+            if obj is not None and obj.name != name:
+                obj.name = f"frigg_undo.{name}"
+        for name, record in self.records.items():
+            live[name] = self._restore_object(record, live[name])
+        for name, record in self.records.items():
+            obj = live[name]
+            parent = bpy.data.objects.get(record["parent"]) if record["parent"] else None
+            obj.parent = parent
+            obj.matrix_parent_inverse = record["matrix_parent_inverse"]
+            obj.matrix_basis = record["matrix_basis"]
+
+        for mat in list(bpy.data.materials):
+            if mat.name not in self.material_names:
+                bpy.data.materials.remove(mat)
+        for col in list(bpy.data.collections):
+            if col.name not in self.collection_names:
+                bpy.data.collections.remove(col)
+        for mesh in list(bpy.data.meshes):
+            if mesh.name not in self.mesh_names and mesh.users == 0 and not mesh.name.startswith("frigg_undo."):
+                bpy.data.meshes.remove(mesh)
+
+        restored_names = sorted(self.records.keys())
+        # Open mesh sessions on restored objects hold pre-restore geometry.
+        closed_sessions = []
+        for session_id, session in list(MESH_SESSIONS.items()):
+            if session["object"] in self.records or session["object"] in removed:
+                _close_mesh_session(session_id)
+                closed_sessions.append(session_id)
+        self.discard()
+        bpy.context.view_layer.update()
+        _sync_known_objects(source="rollback")
+        for name in restored_names:
+            record_change("transform", name, source="rollback")
+            record_change("geometry", name, source="rollback")
+        result = {
+            "restored_objects": restored_names,
+            "removed_objects": removed,
+            "restore_ms": (time.perf_counter() - start) * 1000.0,
+        }
+        if closed_sessions:
+            result["closed_sessions"] = closed_sessions
+        return result
+
+    def _restore_object(self, record, obj):
+        data = record["data"] if _id_alive(record["data"]) else None
+        geometry = record["geometry"]
+        if data is None and geometry is not None:
+            data = geometry.copy()
+            data.name = record["data_name"]
+        if obj is None:
+            obj = bpy.data.objects.new(record["name"], data)
+        else:
+            obj.name = record["name"]
+            if data is not None and obj.data != data:
+                obj.data = data
+        if geometry is not None and data is not None:
+            import bmesh
+
+            bm = bmesh.new()
             try:
-                indices = {int(i) for i in face_indices}
-            except (TypeError, ValueError):
-                raise ValueError("face_indices must be a list of integers.")
-            selected_faces = []
-            for face in bm.faces:
-                face.select = face.index in indices
-                if face.select:
-                    selected_faces.append(face.index)
+                bm.from_mesh(geometry)
+                bm.to_mesh(data)
+            finally:
+                bm.free()
+            data.materials.clear()
+            for mat_name in record["materials"]:
+                data.materials.append(bpy.data.materials.get(mat_name) if mat_name else None)
+            data.update()
+
+        target = set(record["collections"])
+        for col in list(obj.users_collection):
+            if col.name not in target:
+                col.objects.unlink(obj)
+        current = {col.name for col in obj.users_collection}
+        for col_name in record["collections"]:
+            if col_name in current:
+                continue
+            if col_name == bpy.context.scene.collection.name:
+                bpy.context.scene.collection.objects.link(obj)
+            else:
+                col = bpy.data.collections.get(col_name)
+                if col is not None:
+                    col.objects.link(obj)
+
+        wanted = [name for name, _type, _values in record["modifiers"]]
+        for mod in list(obj.modifiers):
+            if mod.name not in wanted:
+                obj.modifiers.remove(mod)
+        for name, mod_type, values in record["modifiers"]:
+            mod = obj.modifiers.get(name)
+            if mod is None or mod.type != mod_type:
+                if mod is not None:
+                    obj.modifiers.remove(mod)
+                mod = obj.modifiers.new(name=name, type=mod_type)
+            _apply_rna_values(mod, values)
+
+        obj.rotation_mode = record["rotation_mode"]
+        try:
+            obj.hide_set(record["hidden"])
+        except RuntimeError:
+            pass  # not in the active view layer
+        return obj
+
+    def discard(self) -> None:
+        """Free the geometry copies; the snapshot can no longer be restored."""
+        for record in self.records.values():
+            geometry = record["geometry"]
+            if _id_alive(geometry):
+                bpy.data.meshes.remove(geometry)
+            record["geometry"] = None
+        self.records = {}
+
+
+def _resolve_refs(value, results):
+    """Replace {"$ref": "step.path"} markers with values from earlier batch steps."""
+    if isinstance(value, dict):
+        if set(value.keys()) == {"$ref"}:
+            ref = value["$ref"]
+            if not isinstance(ref, str) or not ref:
+                raise ValueError("$ref must be a non-empty string like 'step.key'")
+            step, _, path = ref.partition(".")
+            if step not in results:
+                raise ValueError(f"$ref to unknown or later step: {step}")
+            current = results[step]
+            for part in path.split(".") if path else []:
+                if isinstance(current, list):
+                    try:
+                        current = current[int(part)]
+                    except (ValueError, IndexError):
+                        raise ValueError(f"$ref path not found: {ref}")
+                elif isinstance(current, dict) and part in current:
+                    current = current[part]
+                else:
+                    raise ValueError(f"$ref path not found: {ref}")
+            return current
+        return {key: _resolve_refs(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(item, results) for item in value]
+    return value
+
+
+def _batch_slices(params):
+    """
+    Generator behind batch: yields progress after every step.
+
+    Sending a truthy value into the generator cancels the remaining steps;
+    the summary is the return value. Atomic batches never yield: other
+    requests running between slices could create datablocks that the
+    rollback would then delete, so they run in one slice.
+    """
+    operations = params.get("operations")
+    atomic = bool(params.get("atomic", False))
+    stop_on_error = bool(params.get("stop_on_error", True)) or atomic
+
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("batch requires a non-empty 'operations' list")
+    # Validate the shape up front: failing mid-loop would skip the rollback.
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            raise ValueError(f"batch operation {index} must be an object")
+
+    snapshot = SceneSnapshot() if atomic else None
+    results = {}
+    steps = []
+    untracked = []
+    failed = None
+    cancelled = False
+    try:
+        for index, operation in enumerate(operations):
+            step_id = str(operation.get("id", index))
+            method = operation.get("method")
+            step = {"index": index, "id": step_id, "method": method}
+            try:
+                spec = HANDLERS.get(method)
+                if spec is None:
+                    raise ValueError(f"Unknown method: {method}")
+                if spec["name"] == "batch":
+                    raise ValueError("batch cannot be nested")
+                step_params = _resolve_refs(operation.get("params") or {}, results)
+                fields = None
+                if isinstance(step_params, dict) and "fields" in step_params:
+                    step_params = dict(step_params)
+                    fields = _field_tree(step_params.pop("fields"))
+                if snapshot is not None and spec["mutating"] and not snapshot.touch_params(step_params):
+                    # e.g. execute_python: the rollback cannot undo what it changes.
+                    untracked.append({"index": index, "id": step_id, "method": method})
+                _touch_checkpoints(spec, step_params)
+                result = spec["handler"](step_params)
+                if spec["envelope"] and isinstance(result, dict) and result.get("ok") is False:
+                    raise RuntimeError(str(result.get("error")))
+                # $refs see the full result; the step output is projected.
+                step.update({"ok": True, "result": _project(result, fields)})
+                results[step_id] = result
+                results[str(index)] = result
+            except Exception as exc:
+                log(f"batch step {index} ({method}) failed: {exc}")
+                step.update({"ok": False, "error": str(exc)})
+                if failed is None:
+                    failed = index
+            steps.append(step)
+            if failed is not None and stop_on_error:
+                break
+            if atomic or index + 1 >= len(operations):
+                continue
+            if (yield {"completed": len(steps), "total": len(operations)}):
+                cancelled = True
+                break
+
+        rollback = None
+        if snapshot is not None and (failed is not None or cancelled):
+            rollback = snapshot.restore()
+        else:
+            bpy.context.view_layer.update()
+    finally:
+        if snapshot is not None:
+            snapshot.discard()
+
+    summary = {
+        "success": failed is None and not cancelled,
+        "completed": sum(1 for step in steps if step["ok"]),
+        "total": len(operations),
+        "failed_step": failed,
+        "rolled_back": rollback is not None,
+        "steps": steps,
+    }
+    if atomic:
+        summary["untracked"] = untracked
+    if cancelled:
+        summary["cancelled"] = True
+    if rollback is not None:
+        summary["rollback"] = rollback
+    return summary
+
+
+def _drain(slices):
+    """Run a slice generator to completion and return its result."""
+    try:
+        while True:
+            next(slices)
+    except StopIteration as stop:
+        return stop.value
+
+
+@bridge_method("batch", mutating=True, cost="heavy", slices=_batch_slices)
+def batch(params):
+    """
+    Run several bridge methods in order within one main-thread job.
+
+    Parameters:
+        operations: List of {"method": str, "params": dict, "id": optional str}
+        atomic: Roll back every change if a step fails (default: false)
+        stop_on_error: Stop at the first failing step (default: true)
+
+    A step can use the result of an earlier one with {"$ref": "<id>.<key>"},
+    where <id> is the step id or its index, e.g. {"$ref": "0.name"}.
+
+    Atomic batches list mutating steps that name no object (e.g.
+    execute_python) in "untracked": a rollback does not undo their changes.
+
+    Returns:
+        Per-step results, the failing step (if any) and whether the batch
+        was rolled back
+    """
+    return _drain(_batch_slices(params))
+
+
+# =============================================================================
+# CHECKPOINTS
+# =============================================================================
+
+# Named SceneSnapshots kept across requests. While any exist, every mutating
+# handler touches the objects it names first, so each checkpoint holds the
+# pre-change state of exactly the objects edited since it was created.
+CHECKPOINTS = collections.OrderedDict()
+MAX_CHECKPOINTS = 16
+_CHECKPOINT_IDS = itertools.count(1)
+
+# Methods that capture their own state: batch touches per step, and a
+# restore must not be recorded into the checkpoints it is restoring.
+CHECKPOINT_EXEMPT_METHODS = ("batch", "checkpoint_restore")
+
+
+def _touch_checkpoints(spec, params) -> None:
+    if not CHECKPOINTS or not spec["mutating"] or spec["name"] in CHECKPOINT_EXEMPT_METHODS:
+        return
+    for checkpoint in CHECKPOINTS.values():
+        checkpoint["calls"] += 1
+        if not checkpoint["snapshot"].touch_params(params):
+            # e.g. execute_python: the bridge cannot tell what it will change.
+            checkpoint["untracked"][spec["name"]] = checkpoint["untracked"].get(spec["name"], 0) + 1
+
+
+def _checkpoint_info(name, checkpoint):
+    snapshot = checkpoint["snapshot"]
+    return {
+        "checkpoint": name,
+        "created_at": checkpoint["created_at"],
+        "scene_version": checkpoint["scene_version"],
+        "create_ms": checkpoint["create_ms"],
+        "capture_ms": snapshot.capture_s * 1000.0,
+        "touched_objects": sorted(snapshot.records.keys()),
+        "geometry_copies": sum(1 for record in snapshot.records.values() if record["geometry"] is not None),
+        "mutating_calls": checkpoint["calls"],
+        "untracked_calls": dict(checkpoint["untracked"]),
+    }
+
+
+def _new_checkpoint():
+    snapshot = SceneSnapshot()
+    return {
+        "snapshot": snapshot,
+        "created_at": time.time(),
+        "scene_version": SCENE_VERSION,
+        "create_ms": snapshot.capture_s * 1000.0,
+        "calls": 0,
+        "untracked": {},
+    }
+
+
+def _get_checkpoint(params):
+    name = params.get("checkpoint")
+    if name is None and CHECKPOINTS:
+        name = next(reversed(CHECKPOINTS))
+    checkpoint = CHECKPOINTS.get(name)
+    if checkpoint is None:
+        raise ValueError(f"Checkpoint '{name}' not found")
+    return name, checkpoint
+
+
+@bridge_method("checkpoint_create")
+def checkpoint_create(params):
+    """
+    Create a named checkpoint to roll the scene back to.
+
+    Parameters:
+        checkpoint: Name (default: "cp<n>"); reusing a name replaces it
+
+    Creating a checkpoint only lists the existing datablocks; state is
+    copied lazily as mutating handlers touch objects, so capture_ms grows
+    with the edits made since, not with the scene.
+    """
+    name = params.get("checkpoint") or f"cp{next(_CHECKPOINT_IDS)}"
+    if not isinstance(name, str):
+        raise ValueError("checkpoint must be a string")
+    previous = CHECKPOINTS.pop(name, None)
+    if previous is not None:
+        previous["snapshot"].discard()
+    if len(CHECKPOINTS) >= MAX_CHECKPOINTS:
+        raise ValueError(f"Too many checkpoints (max {MAX_CHECKPOINTS}); discard old ones first")
+    CHECKPOINTS[name] = _new_checkpoint()
+    return _checkpoint_info(name, CHECKPOINTS[name])
+
+
+@bridge_method("checkpoint_restore", mutating=True, cost="medium")
+def checkpoint_restore(params):
+    """
+    Roll the scene back to a checkpoint.
+
+    Parameters:
+        checkpoint: Name (default: the newest checkpoint)
+        keep: Keep the checkpoint for another restore (default: true)
+
+    Checkpoints created after this one are discarded. Changes made through
+    execute_python to objects no handler touched are not rolled back; they
+    are counted in untracked_calls.
+    """
+    name, checkpoint = _get_checkpoint(params)
+    info = _checkpoint_info(name, checkpoint)
+    result = checkpoint["snapshot"].restore()
+
+    names = list(CHECKPOINTS.keys())
+    discarded = names[names.index(name) + 1:]
+    for later in discarded:
+        CHECKPOINTS.pop(later)["snapshot"].discard()
+    if params.get("keep", True):
+        CHECKPOINTS[name] = _new_checkpoint()
+    else:
+        del CHECKPOINTS[name]
+
+    result.update({
+        "checkpoint": name,
+        "capture_ms": info["capture_ms"],
+        "untracked_calls": info["untracked_calls"],
+        "discarded_checkpoints": discarded,
+        "kept": name in CHECKPOINTS,
+    })
+    return result
+
+
+@bridge_method("checkpoint_discard")
+def checkpoint_discard(params):
+    """Free a checkpoint ('checkpoint') or, with all=true, every checkpoint."""
+    if params.get("all"):
+        names = list(CHECKPOINTS.keys())
+    else:
+        names = [_get_checkpoint(params)[0]]
+    for name in names:
+        CHECKPOINTS.pop(name)["snapshot"].discard()
+    return {"discarded": names, "remaining": len(CHECKPOINTS)}
+
+
+@bridge_method("checkpoints")
+def checkpoints(params=None):
+    """List checkpoints, oldest first, with what each has captured so far."""
+    items = [_checkpoint_info(name, checkpoint) for name, checkpoint in CHECKPOINTS.items()]
+    return {"checkpoints": items, "count": len(items), "max_checkpoints": MAX_CHECKPOINTS}
+
+
+# =============================================================================
+# OBJECT INDEX AND QUERIES
+# =============================================================================
+
+# Filter keys answered from posting sets: filter key -> row key.
+INDEXED_KEYS = {
+    "type": "type",
+    "collection": "collections",
+    "material": "materials",
+    "modifier": "modifiers",
+    "parent": "parent",
+    "data": "data",
+}
+# Integer row keys kept in sorted order for range filters.
+RANGE_KEYS = ("polycount", "vertices")
+RANGE_OPERATORS = ("==", ">", ">=", "<", "<=")
+# Journal kinds that move an object's children as well.
+CASCADING_KINDS = ("transform", "parent", "renamed", "updated")
+
+
+def _index_row(obj):
+    """Indexed attributes of one object."""
+    import mathutils
+
+    data = obj.data
+    polycount = vertices = 0
+    if isinstance(data, bpy.types.Mesh):
+        polycount = len(data.polygons)
+        vertices = len(data.vertices)
+    matrix = obj.matrix_world
+    corners = [matrix @ mathutils.Vector(corner) for corner in obj.bound_box]
+    return {
+        "type": obj.type,
+        "collections": [col.name for col in obj.users_collection],
+        "materials": sorted({slot.material.name for slot in obj.material_slots if slot.material}),
+        "modifiers": sorted({mod.type for mod in obj.modifiers}),
+        "parent": obj.parent.name if obj.parent else None,
+        "data": data.name if data is not None else None,
+        "polycount": polycount,
+        "vertices": vertices,
+        "aabb": [min(c[axis] for c in corners) for axis in range(3)] + [max(c[axis] for c in corners) for axis in range(3)],
+    }
+
+
+def _bbox_filter(value):
+    if not isinstance(value, dict) or len(value) != 1:
+        raise ValueError("bbox filter must be {'inside'|'intersects': [[min x, y, z], [max x, y, z]]} or {'contains': [x, y, z]}")
+    mode, box = next(iter(value.items()))
+    if mode == "contains":
+        if not isinstance(box, (list, tuple)) or len(box) != 3:
+            raise ValueError("bbox.contains must be a point [x, y, z]")
+        point = [float(v) for v in box]
+        return mode, point + point
+    if mode not in ("inside", "intersects"):
+        raise ValueError(f"Unknown bbox mode: {mode}")
+    if not isinstance(box, (list, tuple)) or len(box) != 2 or any(not isinstance(c, (list, tuple)) or len(c) != 3 for c in box):
+        raise ValueError(f"bbox.{mode} must be [[min x, y, z], [max x, y, z]]")
+    return mode, [float(v) for v in box[0]] + [float(v) for v in box[1]]
+
+
+def _aabb_matches(mode, aabb, box) -> bool:
+    if mode == "inside":
+        return all(box[axis] <= aabb[axis] and aabb[axis + 3] <= box[axis + 3] for axis in range(3))
+    # intersects / contains
+    return all(aabb[axis] <= box[axis + 3] and box[axis] <= aabb[axis + 3] for axis in range(3))
+
+
+def _box_union(a, b):
+    return [min(a[0], b[0]), min(a[1], b[1]), min(a[2], b[2]), max(a[3], b[3]), max(a[4], b[4]), max(a[5], b[5])]
+
+
+def _box_area(box):
+    dx, dy, dz = box[3] - box[0], box[4] - box[1], box[5] - box[2]
+    return dx * dy + dy * dz + dz * dx
+
+
+def _box_distance(a, b):
+    """Gap between two boxes (0 when they touch or overlap)."""
+    total = 0.0
+    for axis in range(3):
+        gap = max(a[axis] - b[axis + 3], b[axis] - a[axis + 3], 0.0)
+        total += gap * gap
+    return total ** 0.5
+
+
+class AabbTree:
+    """
+    Dynamic bounding volume hierarchy with one leaf per object.
+
+    Leaves are inserted next to the sibling that grows the tree's surface
+    area least and removed by splicing their sibling into the parent's
+    place, so moving an object costs O(log n). After many edits the tree
+    is rebuilt top-down (see needs_rebuild).
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self.boxes = []
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.names = []
+        self.free = []
+        self.root = -1
+        self.leaves = {}
+        self.edits = 0
+
+    def _alloc(self, box, name=None):
+        if self.free:
+            node = self.free.pop()
+            self.boxes[node] = box
+            self.left[node] = self.right[node] = self.parent[node] = -1
+            self.names[node] = name
+            return node
+        self.boxes.append(box)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.names.append(name)
+        return len(self.boxes) - 1
+
+    def _release(self, node) -> None:
+        self.names[node] = None
+        self.boxes[node] = None
+        self.free.append(node)
+
+    def _refit(self, node) -> None:
+        while node != -1:
+            self.boxes[node] = _box_union(self.boxes[self.left[node]], self.boxes[self.right[node]])
+            node = self.parent[node]
+
+    def needs_rebuild(self) -> bool:
+        return self.edits > max(64, len(self.leaves) // 2)
+
+    def build(self, items) -> None:
+        """Top-down build from (name, box) pairs, splitting at the median of the longest axis."""
+        self.clear()
+        items = list(items)
+        if not items:
+            return
+
+        def centre(box, axis):
+            return box[axis] + box[axis + 3]
+
+        def build_range(items):
+            if len(items) == 1:
+                name, box = items[0]
+                node = self._alloc(list(box), name)
+                self.leaves[name] = node
+                return node
+            bounds = items[0][1]
+            for _name, box in items[1:]:
+                bounds = _box_union(bounds, box)
+            extent = [bounds[axis + 3] - bounds[axis] for axis in range(3)]
+            axis = extent.index(max(extent))
+            items.sort(key=lambda item: centre(item[1], axis))
+            middle = len(items) // 2
+            node = self._alloc(bounds)
+            left, right = build_range(items[:middle]), build_range(items[middle:])
+            self.left[node], self.right[node] = left, right
+            self.parent[left] = self.parent[right] = node
+            return node
+
+        self.root = build_range(items)
+
+    def insert(self, name, box) -> None:
+        leaf = self._alloc(list(box), name)
+        self.leaves[name] = leaf
+        self.edits += 1
+        if self.root == -1:
+            self.root = leaf
+            return
+        node = self.root
+        while self.names[node] is None:
+            area = _box_area(self.boxes[node])
+            combined = _box_area(_box_union(self.boxes[node], box))
+            cost = 2.0 * combined
+            inherited = 2.0 * (combined - area)
+            child_costs = []
+            for child in (self.left[node], self.right[node]):
+                grown = _box_area(_box_union(self.boxes[child], box))
+                if self.names[child] is None:
+                    grown -= _box_area(self.boxes[child])
+                child_costs.append(grown + inherited)
+            if cost < min(child_costs):
+                break
+            node = self.left[node] if child_costs[0] <= child_costs[1] else self.right[node]
+
+        sibling = node
+        old_parent = self.parent[sibling]
+        branch = self._alloc(_box_union(self.boxes[sibling], box))
+        self.parent[branch] = old_parent
+        self.left[branch], self.right[branch] = sibling, leaf
+        self.parent[sibling] = self.parent[leaf] = branch
+        if old_parent == -1:
+            self.root = branch
+        else:
+            if self.left[old_parent] == sibling:
+                self.left[old_parent] = branch
+            else:
+                self.right[old_parent] = branch
+            self._refit(old_parent)
+
+    def remove(self, name) -> None:
+        leaf = self.leaves.pop(name, None)
+        if leaf is None:
+            return
+        self.edits += 1
+        branch = self.parent[leaf]
+        self._release(leaf)
+        if branch == -1:
+            self.root = -1
+            return
+        sibling = self.right[branch] if self.left[branch] == leaf else self.left[branch]
+        grand = self.parent[branch]
+        self.parent[sibling] = grand
+        if grand == -1:
+            self.root = sibling
+        else:
+            if self.left[grand] == branch:
+                self.left[grand] = sibling
+            else:
+                self.right[grand] = sibling
+            self._refit(grand)
+        self._release(branch)
+
+    def box(self, name):
+        leaf = self.leaves.get(name)
+        return None if leaf is None else self.boxes[leaf]
+
+    def query(self, mode, box):
+        """Names whose box is inside / intersects 'box'; returns (names, nodes visited)."""
+        found = []
+        visited = 0
+        stack = [self.root] if self.root != -1 else []
+        while stack:
+            node = stack.pop()
+            visited += 1
+            if not _aabb_matches("intersects", self.boxes[node], box):
+                continue
+            if self.names[node] is not None:
+                if mode != "inside" or _aabb_matches("inside", self.boxes[node], box):
+                    found.append(self.names[node])
+            else:
+                stack.append(self.left[node])
+                stack.append(self.right[node])
+        return found, visited
+
+    def nearest(self, box, k, max_distance=None, accept=None):
+        """The k leaves closest to 'box', best-first; returns ([(distance, name)], nodes visited)."""
+        import heapq
+
+        found = []
+        visited = 0
+        heap = [(_box_distance(box, self.boxes[self.root]), self.root)] if self.root != -1 else []
+        while heap and len(found) < k:
+            distance, node = heapq.heappop(heap)
+            visited += 1
+            if max_distance is not None and distance > max_distance:
+                break
+            name = self.names[node]
+            if name is not None:
+                if accept is None or accept(name):
+                    found.append((distance, name))
+                continue
+            for child in (self.left[node], self.right[node]):
+                heapq.heappush(heap, (_box_distance(box, self.boxes[child]), child))
+        return found, visited
+
+
+class ObjectIndex:
+    """
+    Secondary indexes over bpy.data.objects, kept current from the journal.
+
+    Every query first replays the journal entries recorded since the last
+    one and re-reads only the objects they name (plus the children of moved
+    or renamed objects and the other users of edited geometry). The index
+    is rebuilt from scratch on first use or when the journal no longer
+    reaches back to its version. World bounding boxes also live in an
+    AabbTree for region, nearest and overlap queries.
+    """
+
+    def __init__(self):
+        self.rows = {}
+        self.version = None
+        self.postings = {key: collections.defaultdict(set) for key in INDEXED_KEYS.values()}
+        self.ranges = {key: [] for key in RANGE_KEYS}
+        self.spatial = AabbTree()
+        self.stats = {"builds": 0, "refreshes": 0, "reindexed_total": 0, "spatial_rebuilds": 0, "last_build_ms": 0.0}
+
+    def _add(self, name, row) -> None:
+        import bisect
+
+        self.rows[name] = row
+        for key, postings in self.postings.items():
+            values = row[key] if isinstance(row[key], list) else [row[key]]
+            for value in values:
+                postings[value].add(name)
+        for key, ordered in self.ranges.items():
+            bisect.insort(ordered, (row[key], name))
+        self.spatial.insert(name, row["aabb"])
+
+    def _remove(self, name) -> None:
+        import bisect
+
+        row = self.rows.pop(name, None)
+        if row is None:
+            return
+        for key, postings in self.postings.items():
+            values = row[key] if isinstance(row[key], list) else [row[key]]
+            for value in values:
+                members = postings.get(value)
+                if members is not None:
+                    members.discard(name)
+                    if not members:
+                        del postings[value]
+        for key, ordered in self.ranges.items():
+            position = bisect.bisect_left(ordered, (row[key], name))
+            if position < len(ordered) and ordered[position] == (row[key], name):
+                del ordered[position]
+        self.spatial.remove(name)
+
+    def rebuild(self) -> None:
+        start = time.perf_counter()
+        # Handlers that only set obj.location leave matrix_world stale until
+        # the depsgraph is evaluated, which headless mode never does by itself.
+        bpy.context.view_layer.update()
+        self.rows = {}
+        self.postings = {key: collections.defaultdict(set) for key in INDEXED_KEYS.values()}
+        self.ranges = {key: [] for key in RANGE_KEYS}
+        for obj in bpy.data.objects:
+            row = _index_row(obj)
+            self.rows[obj.name] = row
+            for key, postings in self.postings.items():
+                for value in row[key] if isinstance(row[key], list) else [row[key]]:
+                    postings[value].add(obj.name)
+        for key in RANGE_KEYS:
+            self.ranges[key] = sorted((row[key], name) for name, row in self.rows.items())
+        self.spatial.build((name, row["aabb"]) for name, row in self.rows.items())
+        self.version = SCENE_VERSION
+        self.stats["builds"] += 1
+        self.stats["last_build_ms"] = (time.perf_counter() - start) * 1000.0
+
+    def refresh(self):
+        """Bring the index up to SCENE_VERSION; returns (objects re-read, rebuilt)."""
+        # Evaluating first journals pending edits made outside the bridge (the
+        # depsgraph hook runs now) and makes matrix_world current (see rebuild).
+        bpy.context.view_layer.update()
+        oldest = JOURNAL[0]["version"] if JOURNAL else SCENE_VERSION + 1
+        if self.version is None or self.version < oldest - 1:
+            self.rebuild()
+            return len(self.rows), True
+        if self.version == SCENE_VERSION:
+            return 0, False
+
+        entries = []
+        for entry in reversed(JOURNAL):
+            if entry["version"] <= self.version:
+                break
+            entries.append(entry)
+        dirty = set()
+        for entry in reversed(entries):
+            name = entry["object"]
+            if name is None:
+                if entry["kind"] == "collection" and entry.get("collection"):
+                    # Collection membership changed: re-read its members and
+                    # the objects the index still lists in it.
+                    col = bpy.data.collections.get(entry["collection"])
+                    if col is not None:
+                        dirty.update(obj.name for obj in col.all_objects)
+                    dirty.update(self.postings["collections"].get(entry["collection"], ()))
+                continue  # material datablock edits do not change assignments
+            if entry["kind"] == "renamed":
+                dirty.add(entry.get("old_name"))
+            dirty.add(name)
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                continue
+            if entry["kind"] in CASCADING_KINDS:
+                dirty.update(child.name for child in obj.children_recursive)
+            if entry["kind"] == "geometry" and obj.data is not None:
+                dirty.update(self.postings["data"].get(obj.data.name, ()))
+        dirty.discard(None)
+        for name in dirty:
+            self._remove(name)
+            obj = bpy.data.objects.get(name)
+            if obj is not None:
+                self._add(obj.name, _index_row(obj))
+        if self.spatial.needs_rebuild():
+            self.spatial.build((name, row["aabb"]) for name, row in self.rows.items())
+            self.stats["spatial_rebuilds"] += 1
+        self.version = SCENE_VERSION
+        self.stats["refreshes"] += 1
+        self.stats["reindexed_total"] += len(dirty)
+        return len(dirty), False
+
+    def _posting(self, key, value):
+        row_key = INDEXED_KEYS[key]
+        values = value if isinstance(value, list) else [value]
+        if key in ("type", "modifier"):
+            values = [v.upper() if isinstance(v, str) else v for v in values]
+        if key == "collection":
+            # A collection filter includes objects in its child collections.
+            expanded = []
+            for name in values:
+                expanded.append(name)
+                col = bpy.data.collections.get(name) if isinstance(name, str) else None
+                if col is not None:
+                    expanded.extend(child.name for child in col.children_recursive)
+            values = expanded
+        postings = self.postings[row_key]
+        result = set()
+        for item in values:
+            result |= postings.get(item, set())
+        return result
+
+    def _range(self, key, value):
+        import bisect
+        import math
+
+        ops = {"==": value} if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+        if not isinstance(ops, dict) or not ops or any(op not in RANGE_OPERATORS for op in ops):
+            raise ValueError(f"{key} filter must be a number or {{op: number}} with op in {list(RANGE_OPERATORS)}")
+        low, high = -math.inf, math.inf
+        for op, bound in ops.items():
+            if not isinstance(bound, (int, float)) or isinstance(bound, bool):
+                raise ValueError(f"{key} {op} needs a number")
+            if op in ("==", ">="):
+                low = max(low, math.ceil(bound))
+            if op in ("==", "<="):
+                high = min(high, math.floor(bound))
+            if op == ">":
+                low = max(low, math.floor(bound) + 1)
+            if op == "<":
+                high = min(high, math.ceil(bound) - 1)
+        ordered = self.ranges[key]
+        start = bisect.bisect_left(ordered, (low, "")) if low != -math.inf else 0
+        end = bisect.bisect_left(ordered, (high + 1, "")) if high != math.inf else len(ordered)
+        return {name for _count, name in ordered[start:end]}
+
+    def evaluate(self, condition):
+        """Names of the objects matching a filter expression (see query_objects)."""
+        import fnmatch
+
+        if not isinstance(condition, dict) or not condition:
+            raise ValueError("Filter must be a non-empty object")
+        if len(condition) > 1:
+            return self.evaluate({"and": [{key: value} for key, value in condition.items()]})
+        key, value = next(iter(condition.items()))
+        if key in ("and", "or"):
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"'{key}' needs a non-empty list of filters")
+            # Evaluate the cheapest (indexed) terms first so 'and' can stop early.
+            terms = sorted(value, key=lambda term: 0 if isinstance(term, dict) and set(term) <= set(INDEXED_KEYS) else 1)
+            result = self.evaluate(terms[0])
+            for term in terms[1:]:
+                if key == "and":
+                    if not result:
+                        break
+                    result &= self.evaluate(term)
+                else:
+                    result |= self.evaluate(term)
+            return result
+        if key == "not":
+            return set(self.rows) - self.evaluate(value)
+        if key in INDEXED_KEYS:
+            return self._posting(key, value)
+        if key in RANGE_KEYS:
+            return self._range(key, value)
+        if key == "name":
+            if not isinstance(value, str):
+                raise ValueError("name filter must be a glob string")
+            return {name for name in self.rows if fnmatch.fnmatchcase(name, value)}
+        if key == "bbox":
+            mode, box = _bbox_filter(value)
+            return set(self.spatial.query(mode, box)[0])
+        raise ValueError(f"Unknown filter key: {key}")
+
+
+OBJECT_INDEX = ObjectIndex()
+QUERY_MAX_LIMIT = 10000
+
+
+def _refresh_object_index(params, start):
+    """Refresh (or, with rebuild=true, rebuild) OBJECT_INDEX; returns (time, index info)."""
+    if params.get("rebuild"):
+        OBJECT_INDEX.rebuild()
+        reindexed, rebuilt = len(OBJECT_INDEX.rows), True
+    else:
+        reindexed, rebuilt = OBJECT_INDEX.refresh()
+    refreshed = time.perf_counter()
+    info = dict(
+        OBJECT_INDEX.stats,
+        objects=len(OBJECT_INDEX.rows),
+        reindexed=reindexed,
+        rebuilt=rebuilt,
+        refresh_ms=(refreshed - start) * 1000.0,
+    )
+    return refreshed, info
+
+
+@bridge_method("query_objects", cost="medium")
+def query_objects(params):
+    """
+    Find objects with an indexed filter expression.
+
+    Parameters:
+        where: Filter (default: every object). Keys of one object are ANDed:
+            type, collection, material, modifier, parent, data: value or list
+                of values (collection includes child collections; parent
+                null selects root objects)
+            name: glob
+            polycount, vertices: number or {">": n, "<=": m, ...}
+            bbox: {"inside": [[x, y, z], [x, y, z]]}, {"intersects": ...}
+                or {"contains": [x, y, z]} (world-space bounding boxes)
+            and / or: list of filters; not: filter
+        limit, cursor: Page through results ordered by name
+        properties: Return dicts with these row keys instead of names (type,
+            collections, materials, modifiers, parent, data, polycount,
+            vertices, aabb)
+        rebuild: Rebuild the index first (default: false)
+
+    Edits made in the UI or through execute_python reach the index through
+    the depsgraph hook, which journals every updated object and collection.
+    Renaming a material or collection is not journaled, and neither is an
+    edit that Blender does not report to the depsgraph; pass rebuild=true
+    after those.
+
+    Example: {"where": {"type": "MESH", "material": "Bark",
+              "collection": "Forest", "polycount": {">": 10000}}}
+    """
+    import bisect
+
+    start = time.perf_counter()
+    limit = params.get("limit")
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or not 1 <= limit <= QUERY_MAX_LIMIT):
+        raise ValueError(f"limit must be an integer between 1 and {QUERY_MAX_LIMIT}")
+    properties = params.get("properties")
+    if properties is not None:
+        row_keys = set(INDEXED_KEYS.values()) | set(RANGE_KEYS) | {"aabb"}
+        if not isinstance(properties, list) or not properties or any(key not in row_keys for key in properties):
+            raise ValueError(f"properties must be a non-empty list of {sorted(row_keys)}")
+
+    refreshed, index_info = _refresh_object_index(params, start)
+    where = params.get("where")
+    names = sorted(OBJECT_INDEX.evaluate(where) if where else OBJECT_INDEX.rows)
+    total = len(names)
+    if params.get("cursor"):
+        names = names[bisect.bisect_right(names, _decode_cursor(params["cursor"])):]
+    next_cursor = None
+    if limit is not None and len(names) > limit:
+        names = names[:limit]
+        next_cursor = _encode_cursor(names[-1])
+
+    rows = OBJECT_INDEX.rows
+    if properties is None:
+        objects = names
+    else:
+        objects = [dict({"name": name}, **{key: rows[name][key] for key in properties}) for name in names]
+    return {
+        "objects": objects,
+        "count": len(objects),
+        "total": total,
+        "next_cursor": next_cursor,
+        "scene_version": OBJECT_INDEX.version,
+        "index": dict(index_info, query_ms=(time.perf_counter() - refreshed) * 1000.0),
+    }
+
+
+def _spatial_result(result, refreshed, index_info, visited):
+    result.update({
+        "scene_version": OBJECT_INDEX.version,
+        "nodes_visited": visited,
+        "index": dict(index_info, query_ms=(time.perf_counter() - refreshed) * 1000.0),
+    })
+    return result
+
+
+def _where_filter(params):
+    """Set of names allowed by an optional 'where' filter (None = all)."""
+    where = params.get("where")
+    return OBJECT_INDEX.evaluate(where) if where else None
+
+
+def _query_box(params):
+    """World box of a query: an object's bounding box ('object_name') or a point."""
+    name = params.get("object_name")
+    if name is not None:
+        box = OBJECT_INDEX.spatial.box(name)
+        if box is None:
+            raise ValueError(f"Object not found: {name}")
+        return box
+    point = params.get("point")
+    if not isinstance(point, (list, tuple)) or len(point) != 3:
+        raise ValueError("Pass object_name or point [x, y, z]")
+    point = [float(v) for v in point]
+    return point + point
+
+
+@bridge_method("objects_in_region", cost="medium")
+def objects_in_region(params):
+    """
+    Objects whose world bounding box lies in a box.
+
+    Parameters:
+        min, max: Opposite corners [x, y, z] of the region
+        mode: "intersects" (default) or "inside" (fully contained)
+        where: Optional query_objects filter applied to the hits
+        limit: Maximum number of names (default: all)
+
+    Returns:
+        objects (ordered by name), count, total and nodes_visited
+    """
+    start = time.perf_counter()
+    mode = params.get("mode", "intersects")
+    if mode not in ("intersects", "inside"):
+        raise ValueError("mode must be intersects or inside")
+    _mode, box = _bbox_filter({mode: [params.get("min"), params.get("max")]})
+    limit = params.get("limit")
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 1):
+        raise ValueError("limit must be a positive integer")
+    refreshed, index_info = _refresh_object_index(params, start)
+    names, visited = OBJECT_INDEX.spatial.query(mode, box)
+    allowed = _where_filter(params)
+    if allowed is not None:
+        names = [name for name in names if name in allowed]
+    names.sort()
+    total = len(names)
+    names = names[:limit] if limit is not None else names
+    return _spatial_result({"objects": names, "count": len(names), "total": total}, refreshed, index_info, visited)
+
+
+@bridge_method("nearest_objects", cost="medium")
+def nearest_objects(params):
+    """
+    Objects closest to a point or to another object, by bounding-box gap.
+
+    Parameters:
+        point: [x, y, z], or
+        object_name: Measure from this object's bounding box (it is excluded)
+        k: Number of objects (default: 5, max: 1000)
+        max_distance: Ignore objects further away
+        where: Optional query_objects filter, e.g. {"type": "MESH"}
+
+    Returns:
+        objects: [{"name", "distance"}] nearest first (0 = touching/overlapping)
+    """
+    start = time.perf_counter()
+    k = params.get("k", 5)
+    if not isinstance(k, int) or isinstance(k, bool) or not 1 <= k <= 1000:
+        raise ValueError("k must be an integer between 1 and 1000")
+    max_distance = params.get("max_distance")
+    if max_distance is not None and (not isinstance(max_distance, (int, float)) or max_distance < 0):
+        raise ValueError("max_distance must be a non-negative number")
+    refreshed, index_info = _refresh_object_index(params, start)
+    box = _query_box(params)
+    allowed = _where_filter(params)
+    exclude = params.get("object_name")
+
+    def accept(name):
+        return name != exclude and (allowed is None or name in allowed)
+
+    found, visited = OBJECT_INDEX.spatial.nearest(box, k, max_distance, accept)
+    objects = [{"name": name, "distance": distance} for distance, name in found]
+    return _spatial_result({"objects": objects, "count": len(objects)}, refreshed, index_info, visited)
+
+
+@bridge_method("overlapping_objects", cost="medium")
+def overlapping_objects(params):
+    """
+    Objects whose world bounding boxes overlap.
+
+    Parameters:
+        object_name: Objects overlapping this one; without it, every
+            overlapping pair in the scene
+        where: Optional query_objects filter both sides must match
+        limit: Maximum number of pairs (default: 1000)
+
+    Returns:
+        objects (with object_name) or pairs [[a, b], ...] ordered by name
+    """
+    start = time.perf_counter()
+    limit = params.get("limit", 1000)
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+        raise ValueError("limit must be a positive integer")
+    refreshed, index_info = _refresh_object_index(params, start)
+    allowed = _where_filter(params)
+    spatial = OBJECT_INDEX.spatial
+
+    name = params.get("object_name")
+    if name is not None:
+        box = _query_box(params)
+        hits, visited = spatial.query("intersects", box)
+        names = sorted(hit for hit in hits if hit != name and (allowed is None or hit in allowed))
+        return _spatial_result({"object": name, "objects": names, "count": len(names)}, refreshed, index_info, visited)
+
+    pairs = []
+    visited = 0
+    truncated = False
+    for first in sorted(spatial.leaves if allowed is None else allowed & spatial.leaves.keys()):
+        hits, count = spatial.query("intersects", spatial.box(first))
+        visited += count
+        for second in sorted(hits):
+            if second > first and (allowed is None or second in allowed):
+                pairs.append([first, second])
+        if len(pairs) > limit:
+            pairs = pairs[:limit]
+            truncated = True
+            break
+    return _spatial_result({"pairs": pairs, "count": len(pairs), "truncated": truncated}, refreshed, index_info, visited)
+
+
+# =============================================================================
+# ASYNC JOBS
+# =============================================================================
+
+# Jobs run on the main thread in slices between request ticks, so a long
+# operation neither blocks its caller's connection nor other clients.
+JOBS = collections.OrderedDict()
+ACTIVE_JOBS = collections.deque()
+MAX_JOBS = 256
+JOB_TTL_S = _env_float("FRIGG_JOB_TTL_S", 900.0)
+JOB_FINISHED_STATES = ("done", "failed", "cancelled")
+_JOB_IDS = itertools.count(1)
+
+
+def _single_slice(spec, params):
+    _touch_checkpoints(spec, params)
+    result = spec["handler"](params)
+    if spec["envelope"] and isinstance(result, dict) and result.get("ok") is False:
+        raise RuntimeError(str(result.get("error")))
+    return result
+    yield  # pragma: no cover - makes this a generator
+
+
+def _expire_jobs() -> None:
+    now = time.time()
+    for job_id, job in list(JOBS.items()):
+        if job["state"] in JOB_FINISHED_STATES and now - job["finished_at"] > JOB_TTL_S:
+            del JOBS[job_id]
+    if len(JOBS) > MAX_JOBS:
+        for job_id, job in list(JOBS.items()):
+            if len(JOBS) <= MAX_JOBS:
+                break
+            if job["state"] in JOB_FINISHED_STATES:
+                del JOBS[job_id]
+
+
+def _finish_job(job, state, response) -> None:
+    job["state"] = state
+    job["response"] = response
+    job["finished_at"] = time.time()
+    job["generator"] = None
+    record_latency(job["method"], "handler", job["busy_s"], error=state == "failed")
+
+
+def _step_job(job) -> None:
+    """Advance one job by one slice."""
+    start = time.perf_counter()
+    try:
+        if job["generator"] is None:
+            job["state"] = "running"
+            job["started_at"] = time.time()
+            spec = HANDLERS[job["method"]]
+            slices = spec["slices"] or (lambda params: _single_slice(spec, params))
+            job["generator"] = slices(job["params"])
+            progress = next(job["generator"])
+        else:
+            progress = job["generator"].send(job["cancel_requested"])
+    except StopIteration as stop:
+        # Count this slice before _finish_job records the handler latency.
+        job["busy_s"] += time.perf_counter() - start
+        job["slices"] += 1
+        state = "cancelled" if job["cancel_requested"] else "done"
+        _finish_job(job, state, {"ok": True, "result": stop.value})
+        return
+    except Exception as exc:
+        job["busy_s"] += time.perf_counter() - start
+        log(f"Job {job['id']} ({job['method']}) failed: {exc}")
+        log(traceback.format_exc())
+        _finish_job(job, "failed", {"ok": False, "error": str(exc)})
+        return
+    job["busy_s"] += time.perf_counter() - start
+    job["progress"] = progress
+    job["slices"] += 1
+
+
+def _run_job_slices(deadline) -> int:
+    """Run job slices until the tick deadline (always at least one)."""
+    ran = 0
+    while ACTIVE_JOBS and (ran == 0 or time.perf_counter() < deadline):
+        job = JOBS.get(ACTIVE_JOBS[0])
+        if job is None or job["state"] in JOB_FINISHED_STATES:
+            ACTIVE_JOBS.popleft()
+            continue
+        _step_job(job)
+        ran += 1
+        if job["state"] not in JOB_FINISHED_STATES:
+            # Round-robin between running jobs.
+            ACTIVE_JOBS.rotate(-1)
+    return ran
+
+
+def _job_info(job):
+    info = {
+        "job": job["id"],
+        "method": job["method"],
+        "state": job["state"],
+        "submitted_at": job["submitted_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "slices": job["slices"],
+        "busy_ms": job["busy_s"] * 1000.0,
+        "progress": job["progress"],
+        "cancel_requested": job["cancel_requested"],
+    }
+    if job["state"] in JOB_FINISHED_STATES:
+        info["expires_at"] = job["finished_at"] + JOB_TTL_S
+    return info
+
+
+def _get_job(params):
+    job = JOBS.get(params.get("job"))
+    if job is None:
+        raise ValueError(f"Job '{params.get('job')}' not found (finished jobs expire after {JOB_TTL_S:.0f}s)")
+    return job
+
+
+@bridge_method("submit_job")
+def submit_job(params):
+    """
+    Run a bridge method asynchronously and return a job id immediately.
+
+    Parameters:
+        method: Bridge method to run (a non-atomic batch runs one step per slice)
+        params: Its parameters
+
+    Poll job_status, then fetch job_result; cancel_job stops it.
+    """
+    method = params.get("method")
+    spec = HANDLERS.get(method)
+    if spec is None:
+        raise ValueError(f"Unknown method: {method}")
+    if spec["name"] in ("submit_job", "job_status", "job_result", "cancel_job"):
+        raise ValueError(f"{method} cannot run as a job")
+    _expire_jobs()
+    if len(JOBS) >= MAX_JOBS:
+        raise ValueError(f"Job store full ({MAX_JOBS} jobs); fetch or wait for results to expire")
+
+    job_id = next(_JOB_IDS)
+    JOBS[job_id] = {
+        "id": job_id,
+        "method": spec["name"],
+        "params": params.get("params") or {},
+        "state": "queued",
+        "submitted_at": time.time(),
+        "started_at": None,
+        "finished_at": None,
+        "slices": 0,
+        "busy_s": 0.0,
+        "progress": None,
+        "cancel_requested": False,
+        "generator": None,
+        "response": None,
+    }
+    ACTIVE_JOBS.append(job_id)
+    return _job_info(JOBS[job_id])
 
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
-        bpy.ops.mesh.subdivide(number_cuts=int(cuts), smoothness=float(smooth))
+@bridge_method("job_status")
+def job_status(params):
+    """Report one job ('job') or, without it, every job in the store."""
+    _expire_jobs()
+    if params.get("job") is None:
+        jobs = [_job_info(job) for job in JOBS.values()]
+        return {"jobs": jobs, "count": len(jobs), "active": len(ACTIVE_JOBS), "max_jobs": MAX_JOBS}
+    return _job_info(_get_job(params))
 
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
-        return {
-            "object": obj.name,
-            "subdivided_faces": selected_faces,
-            "new_vertex_count": len(obj.data.vertices),
-            "new_face_count": len(obj.data.polygons),
-        }
-    finally:
-        try:
-            if bpy.context.object and bpy.context.object.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-        except Exception:
-            pass
+@bridge_method("job_result")
+def job_result(params):
+    """
+    Fetch a finished job's result.
 
+    Parameters:
+        job: Job id
+        release: Drop the job from the store after reading (default: false)
 
-def recalculate_normals(params):
-    """Recalculate face normals (fix inside-out faces)."""
-    import bmesh
+    Returns:
+        job info plus ok and result (or error); ready is false while running
+    """
+    job = _get_job(params)
+    info = _job_info(job)
+    if job["state"] not in JOB_FINISHED_STATES:
+        info["ready"] = False
+        return info
+    info["ready"] = True
+    info.update(job["response"])
+    if params.get("release"):
+        JOBS.pop(job["id"], None)
+    return info
+
+
+@bridge_method("cancel_job")
+def cancel_job(params):
+    """
+    Cancel a job. Queued jobs stop immediately; running jobs stop at their
+    next slice boundary (a single-slice handler cannot be interrupted).
+    """
+    job = _get_job(params)
+    if job["state"] in JOB_FINISHED_STATES:
+        return _job_info(job)
+    job["cancel_requested"] = True
+    if job["state"] == "queued":
+        _finish_job(job, "cancelled", {"ok": False, "error": "Job cancelled before it started"})
+    return _job_info(job)
+
+
+PROFILE_SORT_KEYS = ("cumulative", "tottime", "calls")
+
+
+def _profile_options(value):
+    """Normalise the request-level 'profile' flag: true or {top, sort, save}."""
+    options = {"top": 25, "sort": "cumulative", "save": False}
+    if isinstance(value, dict):
+        options.update({key: value[key] for key in options if key in value})
+    top = options["top"]
+    if not isinstance(top, int) or isinstance(top, bool) or not 1 <= top <= 500:
+        raise ValueError("profile.top must be an integer between 1 and 500")
+    if options["sort"] not in PROFILE_SORT_KEYS:
+        raise ValueError(f"profile.sort must be one of {list(PROFILE_SORT_KEYS)}")
+    return options
+
+
+def _profile_report(profiler, options, method):
+    import pstats
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(options["sort"])
+    functions = []
+    for func in stats.fcn_list[:options["top"]]:
+        primitive_calls, calls, tottime, cumtime, _callers = stats.stats[func]
+        filename, line, name = func
+        functions.append({
+            "function": f"{os.path.basename(filename)}:{line}({name})" if line else name,
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "tottime_ms": tottime * 1000.0,
+            "cumtime_ms": cumtime * 1000.0,
+        })
+    report = {
+        "sort": options["sort"],
+        "total_ms": stats.total_tt * 1000.0,
+        "total_calls": stats.total_calls,
+        "functions": functions,
+    }
+    if options["save"]:
+        path = os.path.join(_output_dir(), f"profile_{method}_{int(time.time() * 1000)}.prof")
+        stats.dump_stats(path)
+        report["path"] = path
+    return report
+
+
+def _field_tree(fields):
+    """Parse a 'fields' projection (["name", "location.0", "objects.name"]) into a nested dict."""
+    if not isinstance(fields, list) or not fields:
+        raise ValueError("fields must be a non-empty list of key paths like 'name' or 'objects.name'")
+    tree = {}
+    for path in fields:
+        if not isinstance(path, str) or not path or "" in path.split("."):
+            raise ValueError(f"Invalid field path: {path!r}")
+        node = tree
+        parts = path.split(".")
+        for index, part in enumerate(parts):
+            if index == len(parts) - 1:
+                node[part] = None  # keep the whole value
+            elif node.get(part, {}) is None:
+                break  # a shorter path already keeps everything below
+            else:
+                node = node.setdefault(part, {})
+    return tree
 
-    try:
-        object_name = params.get("object_name")
-        inside = params.get("inside", False)
 
-        if not object_name:
-            raise ValueError("object_name is required.")
-        obj = bpy.data.objects.get(object_name)
-        if not obj:
-            raise ValueError(f"Object '{object_name}' not found.")
-        if obj.type != "MESH":
-            raise ValueError(f"Object '{object_name}' is not a mesh.")
+def _project(value, tree):
+    """
+    Keep only the keys in 'tree'. Lists are projected element-wise, so
+    "objects.name" trims every entry of an "objects" list. Missing keys are
+    left out; non-dict values are kept as they are.
+    """
+    if tree is None:
+        return value
+    if isinstance(value, dict):
+        return {key: _project(value[key], sub) for key, sub in tree.items() if key in value}
+    if isinstance(value, (list, tuple)):
+        return [_project(item, tree) for item in value]
+    return value
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        bpy.ops.mesh.select_all(action="SELECT")
 
-        bpy.ops.mesh.normals_make_consistent(inside=bool(inside))
+def handle_request(request):
+    method = request.get("method") if isinstance(request, dict) else None
+    params = request.get("params", {}) if isinstance(request, dict) else {}
+
+    # A list or dict method would make the lookup raise TypeError.
+    spec = HANDLERS.get(method) if isinstance(method, str) else None
+    if spec is None:
+        return {"ok": False, "error": f"Unknown method: {method}"}
 
-        return {
-            "object": obj.name,
-            "status": "recalculated",
-            "face_count": len(obj.data.polygons),
-        }
-    finally:
+    # "fields" is reserved in every method's params: the result is trimmed
+    # to those key paths before it is encoded; handlers never see it.
+    fields = None
+    if isinstance(params, dict) and "fields" in params:
+        params = dict(params)
         try:
-            if bpy.context.object and bpy.context.object.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-        except Exception:
-            pass
+            fields = _field_tree(params.pop("fields"))
+        except ValueError as exc:
+            return {"ok": False, "error": str(exc)}
+
+    # "profile" sits next to method/params so any handler can be profiled
+    # without changing its parameters; the report rides on the envelope.
+    profiler = None
+    profile = request.get("profile")
+    if profile:
+        try:
+            options = _profile_options(profile)
+        except ValueError as exc:
+            return {"ok": False, "error": str(exc)}
+        import cProfile
 
+        profiler = cProfile.Profile()
 
-def shade_smooth(params):
-    """Set smooth or flat shading on a mesh object."""
     try:
-        object_name = params.get("object_name")
-        smooth = params.get("smooth", True)
-        auto_smooth = params.get("auto_smooth", False)
-        angle = params.get("angle", 30.0)
+        _touch_checkpoints(spec, params)
+        if profiler is not None:
+            result = profiler.runcall(spec["handler"], params)
+        else:
+            result = spec["handler"](params)
+        if spec["envelope"] and isinstance(result, dict) and result.get("ok") is False and "error" in result:
+            response = result
+        else:
+            response = {"ok": True, "result": _project(result, fields)}
+    except Exception as exc:
+        log(f"Error handling {method}: {exc}")
+        log(traceback.format_exc())
+        response = {"ok": False, "error": str(exc)}
 
-        if not object_name:
-            raise ValueError("object_name is required.")
-        obj = bpy.data.objects.get(object_name)
-        if not obj:
-            raise ValueError(f"Object '{object_name}' not found.")
-        if obj.type != "MESH":
-            raise ValueError(f"Object '{object_name}' is not a mesh.")
+    if profiler is not None:
+        response = dict(response, profile=_profile_report(profiler, options, method))
+    return response
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
 
-        if smooth:
-            bpy.ops.object.shade_smooth()
-        else:
-            bpy.ops.object.shade_flat()
+def _queue_request(request, client_id=None):
+    job = {
+        "request": request,
+        "event": threading.Event(),
+        "response": None,
+        "client": client_id,
+        "queued_at": time.perf_counter(),
+    }
+    REQUEST_QUEUE.put(job, lane_for(request))
+    backlog = REQUEST_QUEUE.qsize()
+    if backlog > SCHEDULER_STATS["max_backlog"]:
+        SCHEDULER_STATS["max_backlog"] = backlog
+    return job
 
-        if auto_smooth:
-            obj.data.use_auto_smooth = True
-            obj.data.auto_smooth_angle = float(angle) * 3.14159 / 180.0
 
-        return {
-            "object": obj.name,
-            "shading": "smooth" if smooth else "flat",
-            "auto_smooth": auto_smooth,
-        }
-    finally:
-        try:
-            if bpy.context.object and bpy.context.object.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-        except Exception:
-            pass
+def _job_method(job):
+    request = job["request"]
+    return request.get("method") if isinstance(request, dict) else None
 
 
-def apply_all_modifiers(params):
-    """Apply all modifiers on an object."""
+def _run_job(job):
+    global _CURRENT_CLIENT
+    _CURRENT_CLIENT = job.get("client")
+    method = _job_method(job)
+    start = job["started_at"] = time.perf_counter()
+    record_latency(method, "queue_wait", start - job["queued_at"])
     try:
-        object_name = params.get("object_name")
-        modifier_types = params.get("types")
+        job["response"] = handle_request(job["request"])
+    except Exception as exc:
+        log(f"Error processing request: {exc}")
+        log(traceback.format_exc())
+        job["response"] = {"ok": False, "error": str(exc)}
+    finally:
+        _CURRENT_CLIENT = None
+    job["finished_at"] = time.perf_counter()
+    record_latency(method, "handler", job["finished_at"] - start, error=job["response"].get("ok") is False)
+    job["event"].set()
 
-        if not object_name:
-            raise ValueError("object_name is required.")
-        obj = bpy.data.objects.get(object_name)
-        if not obj:
-            raise ValueError(f"Object '{object_name}' not found.")
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+# Offset from perf_counter() to wall-clock time, so trace spans line up with
+# the spans the stdio server records with time.time().
+_PERF_TO_EPOCH = time.time() - time.perf_counter()
 
-        applied = []
-        for modifier in list(obj.modifiers):
-            if modifier_types is None or modifier.type in modifier_types:
-                try:
-                    bpy.ops.object.modifier_apply(modifier=modifier.name)
-                    applied.append(modifier.name)
-                except Exception as e:
-                    pass
 
+def _trace_spans(job, received_at, method):
+    """Bridge-side spans of a traced request, in wall-clock microseconds."""
+
+    def span(name, start, end):
         return {
-            "object": obj.name,
-            "applied_modifiers": applied,
-            "count": len(applied),
+            "name": name,
+            "process": "bridge",
+            "ts_us": int((start + _PERF_TO_EPOCH) * 1e6),
+            "dur_us": int(max(end - start, 0.0) * 1e6),
         }
-    finally:
-        try:
-            if bpy.context.object and bpy.context.object.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-        except Exception:
-            pass
 
+    spans = [span("bridge.parse", received_at, job["queued_at"])]
+    if "started_at" in job:
+        spans.append(span("bridge.queue_wait", job["queued_at"], job["started_at"]))
+        spans.append(span(f"bridge.handler:{method}", job["started_at"], job["finished_at"]))
+    return spans
+
+
+def _record_tick(jobs: int, busy_s: float) -> None:
+    budget = TICK_BUDGET_S if TICK_BUDGET_S > 0 else float("inf")
+    utilization = busy_s / budget
+    stats = SCHEDULER_STATS
+    stats["ticks"] += 1
+    if jobs:
+        stats["busy_ticks"] += 1
+        stats["jobs"] += jobs
+        stats["busy_s"] += busy_s
+        if busy_s > budget:
+            stats["over_budget_ticks"] += 1
+    stats["utilization_ewma"] = 0.9 * stats["utilization_ewma"] + 0.1 * utilization
+    stats["last_tick"] = {
+        "jobs": jobs,
+        "busy_ms": busy_s * 1000.0,
+        "budget_ms": TICK_BUDGET_S * 1000.0,
+        "utilization": utilization,
+        "backlog": REQUEST_QUEUE.qsize(),
+    }
 
-def select_faces_by_angle(params):
-    """Select faces by their normal direction."""
-    import bmesh
-    import math
-
-    try:
-        object_name = params.get("object_name")
-        direction = params.get("direction", [0, 0, 1])
-        threshold = params.get("threshold", 10.0)
-        extend = params.get("extend", False)
 
-        if not object_name:
-            raise ValueError("object_name is required.")
-        obj = bpy.data.objects.get(object_name)
-        if not obj:
-            raise ValueError(f"Object '{object_name}' not found.")
-        if obj.type != "MESH":
-            raise ValueError(f"Object '{object_name}' is not a mesh.")
+@bridge_method("scheduler_stats")
+def scheduler_stats(params=None):
+    stats = SCHEDULER_STATS
+    elapsed = max(time.time() - stats["started_at"], 1e-9)
+    return {
+        "budget_ms": TICK_BUDGET_S * 1000.0,
+        "interval_ms": TICK_INTERVAL_S * 1000.0,
+        "ticks": stats["ticks"],
+        "busy_ticks": stats["busy_ticks"],
+        "over_budget_ticks": stats["over_budget_ticks"],
+        "jobs": stats["jobs"],
+        "backlog": REQUEST_QUEUE.qsize(),
+        "utilization_ewma": stats["utilization_ewma"],
+        "main_thread_duty_cycle": stats["busy_s"] / elapsed,
+        "last_tick": stats["last_tick"],
+    }
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-        if not extend:
-            bpy.ops.mesh.select_all(action="DESELECT")
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
+@bridge_method("configure_scheduler")
+def configure_scheduler(params):
+    """
+    Tune the main-thread scheduler at runtime.
 
-        import mathutils
-        target = mathutils.Vector(direction).normalized()
-        threshold_rad = math.radians(float(threshold))
+    Parameters:
+        budget_ms: Time spent draining jobs per timer tick before yielding
+        interval_ms: Timer interval when the queue is empty
+        reset_stats: Reset the utilization counters (default: false)
+    """
+    global TICK_BUDGET_S, TICK_INTERVAL_S
+
+    budget_ms = params.get("budget_ms")
+    interval_ms = params.get("interval_ms")
+    if budget_ms is not None:
+        if not isinstance(budget_ms, (int, float)) or budget_ms <= 0:
+            raise ValueError("budget_ms must be a positive number")
+        TICK_BUDGET_S = float(budget_ms) / 1000.0
+    if interval_ms is not None:
+        if not isinstance(interval_ms, (int, float)) or interval_ms <= 0:
+            raise ValueError("interval_ms must be a positive number")
+        TICK_INTERVAL_S = float(interval_ms) / 1000.0
+    if params.get("reset_stats"):
+        SCHEDULER_STATS.update(_new_scheduler_stats())
+    return scheduler_stats()
 
-        selected = []
-        for face in bm.faces:
-            angle = face.normal.angle(target)
-            if angle < threshold_rad:
-                face.select = True
-                selected.append(face.index)
 
-        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+# =============================================================================
+# METRICS
+# =============================================================================
 
-        return {
-            "object": obj.name,
-            "selected_faces": selected,
-            "count": len(selected),
+# Latency histograms are log-bucketed with HISTOGRAM_SUB_BUCKETS buckets per
+# power of two (about 9% relative error), so memory stays bounded regardless
+# of traffic and percentiles can be read without storing samples.
+HISTOGRAM_SUB_BUCKETS = 8
+METRIC_STAGES = ("queue_wait", "handler", "encode", "send")
+METRICS = {}
+METRICS_LOCK = threading.Lock()
+METRICS_STARTED_AT = time.time()
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram in microseconds."""
+
+    __slots__ = ("count", "total_us", "min_us", "max_us", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_us = 0.0
+        self.min_us = None
+        self.max_us = 0.0
+        self.buckets = {}
+
+    @staticmethod
+    def _bucket(value_us):
+        if value_us < 1.0:
+            return 0
+        import math
+
+        return int(math.log2(value_us) * HISTOGRAM_SUB_BUCKETS) + 1
+
+    @staticmethod
+    def _bucket_upper_us(bucket):
+        if bucket == 0:
+            return 1.0
+        return 2.0 ** (bucket / HISTOGRAM_SUB_BUCKETS)
+
+    def record(self, seconds):
+        value_us = max(seconds, 0.0) * 1e6
+        bucket = self._bucket(value_us)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        self.max_us = max(self.max_us, value_us)
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+
+    def percentile_us(self, percentile):
+        if not self.count:
+            return None
+        target = self.count * percentile / 100.0
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min(self._bucket_upper_us(bucket), self.max_us)
+        return self.max_us
+
+    def summary(self, include_buckets=False):
+        if not self.count:
+            return {"count": 0}
+        result = {
+            "count": self.count,
+            "mean_ms": self.total_us / self.count / 1000.0,
+            "min_ms": self.min_us / 1000.0,
+            "max_ms": self.max_us / 1000.0,
+            "p50_ms": self.percentile_us(50) / 1000.0,
+            "p90_ms": self.percentile_us(90) / 1000.0,
+            "p99_ms": self.percentile_us(99) / 1000.0,
         }
-    finally:
-        try:
-            if bpy.context.object and bpy.context.object.mode != "OBJECT":
-                bpy.ops.object.mode_set(mode="OBJECT")
-        except Exception:
-            pass
+        if include_buckets:
+            result["buckets"] = [
+                [self._bucket_upper_us(bucket) / 1000.0, count] for bucket, count in sorted(self.buckets.items())
+            ]
+        return result
 
 
-def handle_request(request):
-    method = request.get("method") if isinstance(request, dict) else None
-    params = request.get("params", {}) if isinstance(request, dict) else {}
+def _metric_key(method):
+    # Only registered methods get their own series, so bad input cannot grow METRICS.
+    return method if method in HANDLERS else "<unknown>"
 
-    try:
-        if method == "bridge_ping":
-            return {"ok": True, "result": {"pong": True, "time": time.time()}}
-        if method == "get_scene_info":
-            return {"ok": True, "result": scene_info()}
-        if method == "get_object_transform":
-            return {"ok": True, "result": get_object_transform(params)}
-        if method == "set_object_location":
-            return {"ok": True, "result": set_object_location(params)}
-        if method == "set_object_rotation":
-            return {"ok": True, "result": set_object_rotation(params)}
-        if method == "set_object_scale":
-            return {"ok": True, "result": set_object_scale(params)}
-        if method == "select_object":
-            return {"ok": True, "result": select_object(params)}
-        if method == "get_transform":
-            return {"ok": True, "result": get_transform(params)}
-        if method == "set_transform":
-            return {"ok": True, "result": set_transform(params)}
-        if method == "apply_transform":
-            return {"ok": True, "result": apply_transform(params)}
-        if method == "create_camera":
-            return {"ok": True, "result": create_camera(params)}
-        if method == "set_active_camera":
-            return {"ok": True, "result": set_active_camera(params)}
-        if method == "create_primitive":
-            return {"ok": True, "result": create_primitive(params)}
-        if method == "duplicate_object":
-            return {"ok": True, "result": duplicate_object(params)}
-        if method == "delete_object":
-            return {"ok": True, "result": delete_object(params)}
-        if method == "rename_object":
-            return {"ok": True, "result": rename_object(params)}
-        if method == "set_material":
-            return {"ok": True, "result": set_material(params)}
-        if method == "set_parent":
-            return {"ok": True, "result": set_parent(params)}
-        if method == "set_smooth_shading":
-            return {"ok": True, "result": set_smooth_shading(params)}
-        if method == "scene_info":
-            return {"ok": True, "result": scene_info()}
-        if method == "list_objects":
-            return {"ok": True, "result": list_objects()}
-        if method == "move_object":
-            return {"ok": True, "result": move_object(params)}
-
-        # VISION TOOLS - Core vision capabilities
-        if method == "viewport_snapshot":
-            result = viewport_snapshot(params)
-            if isinstance(result, dict) and result.get("ok") is False and "error" in result:
-                return result
-            return {"ok": True, "result": result}
-
-        # SPATIAL COGNITION TOOLS
-        if method == "get_bounding_box":
-            return {"ok": True, "result": get_bounding_box(params)}
-        if method == "get_spatial_relationships":
-            return {"ok": True, "result": get_spatial_relationships(params)}
-        if method == "measure_distance":
-            return {"ok": True, "result": measure_distance(params)}
-
-        # META-TOOLS - Development utilities
-        if method == "execute_python":
-            return {"ok": True, "result": execute_python(params)}
-
-        # SPACE MARINE MODELING TOOLS (v0.5)
-        if method == "add_modifier":
-            return {"ok": True, "result": add_modifier(params)}
-        if method == "apply_modifier":
-            return {"ok": True, "result": apply_modifier(params)}
-        if method == "list_modifiers":
-            return {"ok": True, "result": list_modifiers(params)}
-        if method == "boolean_operation":
-            return {"ok": True, "result": boolean_operation(params)}
-        if method == "create_material":
-            return {"ok": True, "result": create_material(params)}
-        if method == "assign_material":
-            return {"ok": True, "result": assign_material(params)}
-        if method == "create_collection":
-            return {"ok": True, "result": create_collection(params)}
-        if method == "move_to_collection":
-            return {"ok": True, "result": move_to_collection(params)}
-
-        # MESH EDITING TOOLS
-        if method == "join_objects":
-            return {"ok": True, "result": join_objects(params)}
-        if method == "extrude_faces":
-            return {"ok": True, "result": extrude_faces(params)}
-        if method == "inset_faces":
-            return {"ok": True, "result": inset_faces(params)}
-        if method == "merge_vertices":
-            return {"ok": True, "result": merge_vertices(params)}
-        if method == "bevel_edges":
-            return {"ok": True, "result": bevel_edges(params)}
-        if method == "subdivide_mesh":
-            return {"ok": True, "result": subdivide_mesh(params)}
-        if method == "recalculate_normals":
-            return {"ok": True, "result": recalculate_normals(params)}
-        if method == "shade_smooth":
-            return {"ok": True, "result": shade_smooth(params)}
-        if method == "apply_all_modifiers":
-            return {"ok": True, "result": apply_all_modifiers(params)}
-        if method == "select_faces_by_angle":
-            return {"ok": True, "result": select_faces_by_angle(params)}
 
-        return {"ok": False, "error": f"Unknown method: {method}"}
-    except Exception as exc:
-        log(f"Error handling {method}: {exc}")
-        log(traceback.format_exc())
-        return {"ok": False, "error": str(exc)}
+def record_latency(method, stage, seconds, error=False) -> None:
+    key = _metric_key(method)
+    with METRICS_LOCK:
+        entry = METRICS.get(key)
+        if entry is None:
+            entry = METRICS[key] = {"errors": 0, "stages": {}}
+        histogram = entry["stages"].get(stage)
+        if histogram is None:
+            histogram = entry["stages"][stage] = LatencyHistogram()
+        histogram.record(seconds)
+        if error:
+            entry["errors"] += 1
 
 
-def _queue_request(request):
-    job = {"request": request, "event": threading.Event(), "response": None}
-    REQUEST_QUEUE.put(job)
-    return job
+@bridge_method("bridge_metrics")
+def bridge_metrics(params=None):
+    """
+    Per-method latency histograms plus queue and main-thread load.
+
+    Parameters:
+        method: Only report this method
+        buckets: Include raw histogram buckets (default: false)
+        reset: Clear the histograms after reading (default: false)
+
+    Returns:
+        methods: {method: {errors, stages: {queue_wait|handler|encode|send: summary}}}
+        queue: current and max depth; main_thread: utilization from the scheduler
+    """
+    global METRICS_STARTED_AT
+
+    params = params or {}
+    only = params.get("method")
+    include_buckets = bool(params.get("buckets"))
+    with METRICS_LOCK:
+        methods = {}
+        for method, entry in sorted(METRICS.items()):
+            if only is not None and method != only:
+                continue
+            methods[method] = {
+                "errors": entry["errors"],
+                "stages": {
+                    stage: entry["stages"][stage].summary(include_buckets)
+                    for stage in METRIC_STAGES
+                    if stage in entry["stages"]
+                },
+            }
+        since = METRICS_STARTED_AT
+        lanes = REQUEST_QUEUE.lane_stats(include_buckets)
+        if params.get("reset"):
+            METRICS.clear()
+            METRICS_STARTED_AT = time.time()
+            SCHEDULER_STATS["max_backlog"] = REQUEST_QUEUE.qsize()
+            REQUEST_QUEUE.reset_stats()
+
+    stats = SCHEDULER_STATS
+    elapsed = max(time.time() - stats["started_at"], 1e-9)
+    return {
+        "since": since,
+        "methods": methods,
+        "queue": {
+            "depth": REQUEST_QUEUE.qsize(),
+            "max_depth": stats["max_backlog"],
+            "lanes": lanes,
+        },
+        "main_thread": {
+            "utilization_ewma": stats["utilization_ewma"],
+            "duty_cycle": stats["busy_s"] / elapsed,
+            "over_budget_ticks": stats["over_budget_ticks"],
+            "jobs": stats["jobs"],
+        },
+    }
 
 
 def _process_requests():
     if STOP:
         return None
-    while True:
+    tick_start = time.perf_counter()
+    deadline = tick_start + TICK_BUDGET_S
+    jobs = 0
+    # Always run at least one job per tick so a single job larger than the
+    # budget still makes progress; stop pulling new jobs once over budget.
+    while jobs == 0 or time.perf_counter() < deadline:
         try:
             job = REQUEST_QUEUE.get_nowait()
         except queue.Empty:
             break
-        try:
-            job["response"] = handle_request(job["request"])
-        except Exception as exc:
-            log(f"Error processing request: {exc}")
-            log(traceback.format_exc())
-            job["response"] = {"ok": False, "error": str(exc)}
-        job["event"].set()
-    return 0.05
-
+        _run_job(job)
+        jobs += 1
+    if ACTIVE_JOBS:
+        jobs += _run_job_slices(deadline)
+    _settle_pending_depsgraph()
+    if SUBSCRIPTIONS:
+        _flush_subscriptions()
+    _record_tick(jobs, time.perf_counter() - tick_start)
+    if not REQUEST_QUEUE.empty() or ACTIVE_JOBS:
+        # Yield to Blender's event loop, then come straight back for the rest.
+        return TICK_YIELD_S
+    return TICK_INTERVAL_S
+
+
+@bridge_method("bridge_clients")
+def bridge_clients(params=None):
+    with CLIENTS_LOCK:
+        clients = [
+            {
+                "id": client_id,
+                "address": info["address"],
+                "connected_at": info["connected_at"],
+                "requests": info["requests"],
+            }
+            for client_id, info in sorted(CLIENTS.items())
+        ]
+    return {"clients": clients, "count": len(clients), "max_clients": MAX_CLIENTS}
 
-def _accept_loop(server: socket.socket) -> None:
-    server.settimeout(0.5)
-    while True:
-        if STOP:
-            break
-        try:
-            conn, _addr = server.accept()
-        except socket.timeout:
-            continue
-        except OSError:
-            break
 
+def _serve_connection(conn: socket.socket, client_id: int) -> None:
+    # A client has at most one job in flight: the next line is only read once
+    # the previous response is sent. Each lane is FIFO, so within a lane
+    # clients interleave and a busy client cannot starve the others.
+    try:
         with conn:
             file = conn.makefile("r", encoding="utf-8")
             for line in file:
@@ -2024,18 +5584,91 @@ def _accept_loop(server: socket.socket) -> None:
                 line = line.strip()
                 if not line:
                     continue
+                method = None
+                received_at = time.perf_counter()
                 try:
                     request = json.loads(line)
-                    job = _queue_request(request)
+                    job = _queue_request(request, client_id)
+                    method = _job_method(job)
                     job["event"].wait()
                     response = job["response"]
                     if response is None:
                         response = {"ok": False, "error": "No response from main thread"}
+                    trace = request.get("trace") if isinstance(request, dict) else None
+                    if isinstance(trace, dict):
+                        response = dict(response, trace={"id": trace.get("id"), "spans": _trace_spans(job, received_at, method)})
                 except Exception as exc:
                     log(traceback.format_exc())
                     response = {"ok": False, "error": str(exc)}
-                payload = json.dumps(response) + "\n"
-                conn.sendall(payload.encode("utf-8"))
+                if not _send_to_client(client_id, response, method):
+                    break
+                with CLIENTS_LOCK:
+                    if client_id in CLIENTS:
+                        CLIENTS[client_id]["requests"] += 1
+    except OSError as exc:
+        log(f"Client {client_id} disconnected: {exc}")
+    finally:
+        with CLIENTS_LOCK:
+            info = CLIENTS.pop(client_id, None)
+        if info is not None and info["outbox"] is not None:
+            _close_outbox(info["outbox"])
+
+
+def _close_outbox(outbox) -> None:
+    """Wake the push thread with the None sentinel without blocking on a full outbox."""
+    while True:
+        try:
+            outbox.put_nowait(None)
+            return
+        except queue.Full:
+            # The client is gone; its undelivered events can be dropped.
+            try:
+                outbox.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _accept_loop(server: socket.socket) -> None:
+    server.settimeout(0.5)
+    while True:
+        if STOP:
+            break
+        try:
+            conn, addr = server.accept()
+        except socket.timeout:
+            continue
+        except OSError:
+            break
+
+        conn.settimeout(None)
+        with CLIENTS_LOCK:
+            full = len(CLIENTS) >= MAX_CLIENTS
+            if not full:
+                client_id = next(_CLIENT_IDS)
+                CLIENTS[client_id] = {
+                    "conn": conn,
+                    "address": f"{addr[0]}:{addr[1]}",
+                    "connected_at": time.time(),
+                    "requests": 0,
+                    "send_lock": threading.Lock(),
+                    "outbox": None,
+                }
+        if full:
+            try:
+                payload = {"ok": False, "error": f"Bridge busy: {MAX_CLIENTS} clients already connected"}
+                conn.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+            except OSError:
+                pass
+            conn.close()
+            continue
+
+        thread = threading.Thread(
+            target=_serve_connection,
+            args=(conn, client_id),
+            name=f"frigg-client-{client_id}",
+            daemon=True,
+        )
+        thread.start()
 
 
 def _request_shutdown() -> None:
@@ -2054,6 +5687,16 @@ def _request_shutdown() -> None:
             server.close()
         except OSError:
             pass
+    for segment in list(SHARED_BUFFERS.values()):
+        _release_segment(segment)
+    SHARED_BUFFERS.clear()
+    with CLIENTS_LOCK:
+        conns = [info["conn"] for info in CLIENTS.values()]
+    for conn in conns:
+        try:
+            conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
 
 
 def _register_shutdown_handler() -> None:
@@ -2068,19 +5711,101 @@ def _register_shutdown_handler() -> None:
         pass
 
 
-def serve(host: str, port: int) -> None:
+# Headless mode (blender -b): no UI event loop to drive bpy.app.timers, so
+# the script's main thread blocks on REQUEST_QUEUE directly.
+HEADLESS_POLL_S = 0.1
+
+
+def _headless_mode() -> bool:
+    value = os.environ.get("FRIGG_BRIDGE_HEADLESS")
+    if value is None or value == "":
+        return bool(bpy.app.background)
+    return value.lower() not in ("0", "false", "no")
+
+
+def _serve_headless() -> None:
+    import signal
+
+    def on_signal(signum, _frame):
+        # Only flag the loop: the handler runs on the main thread, which may
+        # hold CLIENTS_LOCK, so cleanup is left to the finally block below.
+        global STOP
+        STOP = True
+
+    for name in ("SIGTERM", "SIGINT"):
+        if hasattr(signal, name):
+            try:
+                signal.signal(getattr(signal, name), on_signal)
+            except ValueError:
+                pass  # not the main thread
+
+    log("Serving in headless mode")
+    try:
+        while not STOP:
+            try:
+                if ACTIVE_JOBS:
+                    job = REQUEST_QUEUE.get_nowait()
+                else:
+                    job = REQUEST_QUEUE.get(timeout=HEADLESS_POLL_S)
+            except queue.Empty:
+                job = None
+            if job is None and not ACTIVE_JOBS:
+                if SUBSCRIPTIONS:
+                    _flush_subscriptions()
+                continue
+            # Without a UI to keep responsive, drain everything that is queued,
+            # then give async jobs one budget's worth of slices.
+            tick_start = time.perf_counter()
+            jobs = 0
+            while job is not None:
+                _run_job(job)
+                jobs += 1
+                try:
+                    job = REQUEST_QUEUE.get_nowait()
+                except queue.Empty:
+                    job = None
+            if ACTIVE_JOBS:
+                jobs += _run_job_slices(time.perf_counter() + TICK_BUDGET_S)
+            _settle_pending_depsgraph()
+            if SUBSCRIPTIONS:
+                _flush_subscriptions()
+            _record_tick(jobs, time.perf_counter() - tick_start)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _request_shutdown()
+    log("Bridge stopped")
+
+
+@bridge_method("bridge_shutdown")
+def bridge_shutdown(params=None):
+    """Stop the bridge server; in headless mode Blender then exits."""
+    # Deferred so this response still reaches the caller before sockets close.
+    timer = threading.Timer(0.1, _request_shutdown)
+    timer.daemon = True
+    timer.start()
+    return {"stopping": True, "headless": _headless_mode()}
+
+
+def serve(host: str, port: int, headless=None) -> None:
     global SERVER_SOCKET
     server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     server.bind((host, port))
-    server.listen(1)
+    server.listen(max(MAX_CLIENTS, 5))
     SERVER_SOCKET = server
     print("READY", flush=True)
 
     thread = threading.Thread(target=_accept_loop, args=(server,), daemon=True)
     thread.start()
     _register_shutdown_handler()
-    bpy.app.timers.register(_process_requests, first_interval=0.05, persistent=True)
+    _register_change_journal()
+    if headless is None:
+        headless = _headless_mode()
+    if headless:
+        _serve_headless()
+        return
+    bpy.app.timers.register(_process_requests, first_interval=TICK_INTERVAL_S, persistent=True)
 
 
 if __name__ == "__main__":
@@ -1,58 +1,46 @@
 """
-Test des bridge handlers via le système de commandes
-À exécuter dans Blender Python console
+Test des bridge handlers via le registre du bridge (HANDLERS)
+À exécuter dans Blender :
+    blender -b --factory-startup --python tools/test_bridge_handlers.py
 """
 
+import importlib.util
 import json
-import sys
-import os
-
-# Ajouter le chemin du bridge addon
-BRIDGE_PATH = r"D:\Frigg\blender_bridge_addon"
-if BRIDGE_PATH not in sys.path:
-    sys.path.insert(0, BRIDGE_PATH)
+from pathlib import Path
 
 import bpy
 
-# Importer les handlers depuis le bridge addon
+# Charger le bridge : ses handlers sont enregistrés dans HANDLERS via bridge_method
+BRIDGE_PATH = Path(__file__).parent / "frigg_blender_bridge.py"
+
 try:
-    # Recharger le module si déjà chargé
-    if "__init__" in sys.modules:
-        import importlib
-        importlib.reload(sys.modules["__init__"])
-
-    # Importer depuis le nom du package si c'est un addon installé
-    from blender_bridge_addon import COMMAND_HANDLERS
-except:
-    # Sinon importer directement
-    try:
-        import __init__ as bridge_module
-        COMMAND_HANDLERS = bridge_module.COMMAND_HANDLERS
-    except Exception as e:
-        print(f"❌ Failed to import COMMAND_HANDLERS: {e}")
-        print("Make sure blender_bridge_addon is installed or path is correct")
-        COMMAND_HANDLERS = {}
+    spec = importlib.util.spec_from_file_location("frigg_blender_bridge", BRIDGE_PATH)
+    bridge = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bridge)
+    HANDLERS = bridge.HANDLERS
+except Exception as e:
+    print(f"❌ Failed to load the bridge from {BRIDGE_PATH}: {e}")
+    bridge = None
+    HANDLERS = {}
 
 def test_handler(handler_name, command_data):
-    """Tester un handler spécifique"""
+    """Tester un handler spécifique via handle_request (même chemin que le serveur)"""
     print(f"\n{'='*60}")
     print(f"Testing handler: {handler_name}")
     print(f"{'='*60}")
     print(f"Input: {json.dumps(command_data, indent=2)}")
 
-    if handler_name not in COMMAND_HANDLERS:
-        print(f"❌ Handler '{handler_name}' not found in COMMAND_HANDLERS!")
-        print(f"Available handlers: {list(COMMAND_HANDLERS.keys())}")
+    if handler_name not in HANDLERS:
+        print(f"❌ Handler '{handler_name}' not found in HANDLERS!")
+        print(f"Available handlers: {sorted(HANDLERS)}")
         return False
 
-    handler = COMMAND_HANDLERS[handler_name]
-
     try:
-        result = handler(command_data)
-        print(f"\nResult: {json.dumps(result, indent=2, default=str)}")
+        response = bridge.handle_request({"method": handler_name, "params": command_data})
+        print(f"\nResult: {json.dumps(response, indent=2, default=str)}")
 
-        if "error" in result:
-            print(f"\n❌ Handler returned error: {result['error']}")
+        if not response.get("ok"):
+            print(f"\n❌ Handler returned error: {response.get('error')}")
             return False
 
         print("\n✅ Handler executed successfully")
@@ -240,13 +228,13 @@ def run_all_tests():
     print("BRIDGE HANDLERS VALIDATION")
     print("="*60)
 
-    if not COMMAND_HANDLERS:
-        print("\n❌ COMMAND_HANDLERS not loaded! Cannot run tests.")
-        print("Make sure the bridge addon is properly installed.")
+    if not HANDLERS:
+        print("\n❌ HANDLERS not loaded! Cannot run tests.")
+        print("Make sure tools/frigg_blender_bridge.py is next to this script.")
         return False
 
-    print(f"\nFound {len(COMMAND_HANDLERS)} handlers:")
-    for handler_name in sorted(COMMAND_HANDLERS.keys()):
+    print(f"\nFound {len(HANDLERS)} handlers:")
+    for handler_name in sorted(HANDLERS):
         print(f"  - {handler_name}")
 
     results = {}
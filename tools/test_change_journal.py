@@ -0,0 +1,79 @@
+"""
+Change journal test: compacting get_changes must keep one entry per target.
+
+Run inside Blender (no bridge server needed):
+    blender -b --factory-startup --python tools/test_change_journal.py
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import bpy
+
+BRIDGE_PATH = Path(__file__).parent / "frigg_blender_bridge.py"
+
+
+def load_bridge():
+    spec = importlib.util.spec_from_file_location("frigg_blender_bridge", BRIDGE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def call(bridge, method, params):
+    response = bridge.handle_request({"method": method, "params": params})
+    if not response.get("ok"):
+        raise AssertionError(f"{method} failed: {response.get('error')}")
+    return response["result"]
+
+
+def check(label, condition):
+    print(f"{'PASS' if condition else 'FAIL'}  {label}")
+    return condition
+
+
+def test_compact_keeps_each_collection(bridge):
+    for name in ("JournalA", "JournalB"):
+        call(bridge, "create_collection", {"name": name})
+    since = call(bridge, "get_changes", {"since_version": 0})["version"]
+    # The depsgraph journals collection updates without an object.
+    bridge.record_change("collection", None, source="depsgraph", collection="JournalA")
+    bridge.record_change("collection", None, source="depsgraph", collection="JournalB")
+    bridge.record_change("collection", None, source="depsgraph", collection="JournalA")
+    changes = call(bridge, "get_changes", {"since_version": since})["changes"]
+    collections = sorted(entry["collection"] for entry in changes if entry["kind"] == "collection")
+    return all([
+        check("both collections survive compaction", collections == ["JournalA", "JournalB"]),
+        check("latest JournalA entry kept", changes[-1]["collection"] == "JournalA"),
+    ])
+
+
+def test_compact_keeps_each_object_move(bridge):
+    bpy.ops.mesh.primitive_cube_add()
+    obj = bpy.context.active_object
+    obj.name = "JournalCube"
+    since = call(bridge, "get_changes", {"since_version": 0})["version"]
+    call(bridge, "move_to_collection", {"object_name": obj.name, "collection_name": "JournalA"})
+    call(bridge, "move_to_collection", {"object_name": obj.name, "collection_name": "JournalB"})
+    changes = call(bridge, "get_changes", {"since_version": since})["changes"]
+    moves = [entry["collection"] for entry in changes if entry["kind"] == "collection"]
+    uncompacted = call(bridge, "get_changes", {"since_version": since, "compact": False})["changes"]
+    return all([
+        check("both moves reported", moves == ["JournalA", "JournalB"]),
+        check("compact never returns more than the raw journal", len(changes) <= len(uncompacted)),
+    ])
+
+
+def main():
+    bridge = load_bridge()
+    results = [
+        test_compact_keeps_each_collection(bridge),
+        test_compact_keeps_each_object_move(bridge),
+    ]
+    print(f"\n{sum(results)}/{len(results)} change journal tests passed")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Rollback test: checkpoints and atomic batches must undo bulk transforms.
+
+Run inside Blender (no bridge server needed):
+    blender -b --factory-startup --python tools/test_rollback.py
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import bpy
+
+BRIDGE_PATH = Path(__file__).parent / "frigg_blender_bridge.py"
+
+
+def load_bridge():
+    spec = importlib.util.spec_from_file_location("frigg_blender_bridge", BRIDGE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_cubes(count):
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    names = []
+    for index in range(count):
+        bpy.ops.mesh.primitive_cube_add(location=(index * 3.0, 0.0, 0.0))
+        obj = bpy.context.active_object
+        obj.name = f"Bulk_{index}"
+        names.append(obj.name)
+    return names
+
+
+def locations(names):
+    return {name: tuple(round(v, 5) for v in bpy.data.objects[name].location) for name in names}
+
+
+def call(bridge, method, params):
+    response = bridge.handle_request({"method": method, "params": params})
+    if not response.get("ok"):
+        raise AssertionError(f"{method} failed: {response.get('error')}")
+    return response["result"]
+
+
+def check(label, condition):
+    print(f"{'PASS' if condition else 'FAIL'}  {label}")
+    return condition
+
+
+def test_checkpoint_restores_packed_bulk_transform(bridge):
+    names = make_cubes(4)
+    before = locations(names)
+    call(bridge, "checkpoint_create", {"checkpoint": "bulk"})
+    call(bridge, "set_transforms_bulk", {"names": names, "location": [5.0, 5.0, 5.0] * len(names)})
+    info = call(bridge, "checkpoints", {})["checkpoints"][0]
+    moved = locations(names) != before
+    call(bridge, "checkpoint_restore", {"checkpoint": "bulk", "keep": False})
+    return all([
+        check("bulk move applied", moved),
+        check("bulk names tracked", sorted(info["touched_objects"]) == sorted(names) and not info["untracked_calls"]),
+        check("checkpoint restores packed bulk transform", locations(names) == before),
+    ])
+
+
+def test_atomic_batch_rolls_back_record_bulk_transform(bridge):
+    names = make_cubes(3)
+    before = locations(names)
+    records = [{"name": name, "location": [0.0, 9.0, 0.0], "scale": 2.0} for name in names]
+    summary = call(bridge, "batch", {
+        "atomic": True,
+        "operations": [
+            {"method": "set_transforms_bulk", "params": {"records": records}},
+            {"method": "no_such_method", "params": {}},
+        ],
+    })
+    scales = {name: tuple(bpy.data.objects[name].scale) for name in names}
+    return all([
+        check("atomic batch rolled back", summary["rolled_back"]),
+        check("record bulk transform undone", locations(names) == before),
+        check("scale undone", all(scale == (1.0, 1.0, 1.0) for scale in scales.values())),
+    ])
+
+
+def main():
+    bridge = load_bridge()
+    results = [
+        test_checkpoint_restores_packed_bulk_transform(bridge),
+        test_atomic_batch_rolls_back_record_bulk_transform(bridge),
+    ]
+    print(f"\n{sum(results)}/{len(results)} rollback tests passed")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()